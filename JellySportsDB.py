@@ -4,18 +4,57 @@ JellySportsDB – Modern object-oriented filesystem watcher + metadata agent
 """
 
 import sys
+import json
 import time
+import errno
+import argparse
+import threading
 from pathlib import Path
+from fnmatch import fnmatch
 from importlib import reload
 
 from watchdog.observers import Observer
+from watchdog.observers.api import ObservedWatch
 from watchdog.events import FileSystemEventHandler
 
 from helpers.config import AppConfig
-from helpers.plexlog import log, setup as setup_logging, LL_INFO
+from helpers.plexlog import log, setup as setup_logging, LL_DEBUG, LL_INFO, LL_WARN, LL_ERROR
 from helpers.jellyfin_client import JellyfinClient
 from helpers.sportsdb_client import TheSportsDBClient
-from helpers.process import process_file, set_clients  # We'll add set_clients
+from helpers import dircache, grammar, nameregex, netstrip
+from helpers.kobimeta import move_sidecars, nfo_write_stats
+from helpers.process import process_file, process_batch, set_clients, init_worker, run_job, new_job, STAGES
+from helpers.pipeline import Pipeline
+from helpers.scan import run_scan
+from helpers.intake import EventCoalescer, DirectoryBatcher
+from helpers.workers import WorkerPool
+from helpers.scheduler import LIVE, MANUAL, BACKFILL
+from helpers.jobqueue import JobStore
+from helpers.manifest import FileManifest
+from helpers.episodes import EpisodeSlots
+from helpers.backfill import LibraryScanner, ScanCheckpoint
+from helpers.libraries import LibraryReconciler, collapse_roots, select_locations, count_dirs
+from helpers.poller import DirectoryPoller, is_network_path
+
+def _release_partial_watch(error: OSError):
+    """
+    A recursive inotify watch that hit the limit part way leaves the watches
+    it added on an inotify instance nobody holds any more (its constructor
+    raised, so the emitter never got it); close that instance from the
+    failed frame so the kernel frees them before the polling fallback.
+    """
+    tb = error.__traceback__
+    while tb is not None:
+        inotify = tb.tb_frame.f_locals.get('self')
+        if type(inotify).__name__ == 'Inotify' and hasattr(inotify, '_inotify_fd'):
+            try:
+                inotify._is_reading = False     # no reader thread was started – close the fd directly
+                inotify.close()
+            except Exception as e:
+                log(f"Could not release partial inotify watch: {e}", "FS", LL_WARN)
+            return
+        tb = tb.tb_next
+
 
 class SportsVideoHandler(FileSystemEventHandler):
     VIDEO_EXTENSIONS = {".mkv", ".mp4", ".avi", ".mov", ".ts", ".m2ts", ".mpg", ".webm"}
@@ -38,25 +77,47 @@ class SportsVideoHandler(FileSystemEventHandler):
 
     def on_moved(self, event):
         if event.is_directory:
+            if not event.dest_path:
+                self.processor.forget(event.src_path, is_directory=True)
+            elif not event.is_synthetic:
+                self.processor.relocate_tree(event.src_path, event.dest_path)
             return
+        if event.is_synthetic:
+            # Per-file echo of a directory move – already re-keyed in bulk by relocate_tree()
+            return
+        # A file renamed while still pending must not be released under its old name
+        pending = self.processor.intake.discard(event.src_path)
         if Path(event.dest_path).suffix.lower() in self.VIDEO_EXTENSIONS:
+            if not pending and self.processor.relocate(event.src_path, event.dest_path):
+                return
             self._handle_file(event.dest_path, "moved →")
 
+    def on_deleted(self, event):
+        if event.is_directory or Path(event.src_path).suffix.lower() in self.VIDEO_EXTENSIONS:
+            self.processor.forget(event.src_path, is_directory=event.is_directory)
+
     def _handle_file(self, filepath: str, action: str):
         path = Path(filepath)
         try:
             rel = path.parent.relative_to(self.root)
             depth = 0 if str(rel) == "." else len(rel.parts)
-            log(f"[{action.upper()}] {filepath}  (depth={depth})", "FS", LL_INFO)
-            process_file(str(path), depth)
+            log(f"[{action.upper()}] {filepath}  (depth={depth})", "FS", LL_DEBUG)
+            self.processor.intake.push(str(path), depth, action)
         except Exception as e:
-            log(f"Processing failed for {filepath}: {e}", "FS", level=40)
+            log(f"Could not queue {filepath}: {e}", "FS", LL_ERROR)
 
 
 class JellySportsDBApp:
-    def __init__(self):
+    def __init__(self, backfill: bool = False, reprocess=()):
         self.config = AppConfig()
+        self.backfill = backfill
+        self.reprocess_paths = list(reprocess)
+        self.scanner = None
         setup_logging(level=self.config.log_level)
+        netstrip.configure(self.config.network_cache)
+        self.episode_slots = EpisodeSlots(str(self.config.episode_slots_path))
+        nameregex.configure(self.config.parse_memo_size, self.episode_slots)
+        grammar.configure(self.config.grammar_packs, self.config.grammar_check_interval)
 
         log("JellySportsDB starting...", "MAIN")
 
@@ -68,43 +129,415 @@ class JellySportsDBApp:
 
         self.library_paths = self._get_library_paths()
         self.observer = Observer()
+        # Library roots are re-polled and watches added/removed without a restart
+        self.reconciler = LibraryReconciler(
+            self._fetch_library_paths,
+            self._watch,
+            self._unwatch,
+            interval=self.config.reconcile_interval
+        )
+
+        # Detected-but-unfinished files are persisted so they survive a restart
+        self.jobs = JobStore(str(self.config.jobqueue_path))
+        # Files already processed with an unchanged fingerprint are skipped at intake
+        self.manifest = FileManifest(str(self.config.manifest_path))
+
+        # Slow TheSportsDB calls run on the pool, never on the watchdog emitter thread
+        self.pipeline = None
+        if self.config.worker_mode == "pipeline":
+            # Pool threads only dispatch; the stages run on their own threads
+            self.pipeline = Pipeline(
+                STAGES,
+                workers=self.config.pipeline_workers,
+                queue_size=self.config.pipeline_queue_size
+            )
+            self.workers = WorkerPool(
+                self._process,
+                workers=self.config.pipeline_inflight,
+                queue_size=self.config.queue_size,
+                store=self.jobs,
+                on_done=self._record,
+                batch_handler=self._process_batch,
+                weights=self.config.scheduler_weights,
+                max_wait=self.config.scheduler_max_wait
+            )
+        elif self.config.worker_mode == "process":
+            netstrip.warm_cache()
+            self.workers = WorkerPool(
+                run_job,
+                workers=self.config.worker_count,
+                queue_size=self.config.queue_size,
+                mode="process",
+                initializer=init_worker,
+                initargs=(str(self.config.path),),
+                store=self.jobs,
+                on_done=self._record,
+                batch_handler=process_batch,
+                weights=self.config.scheduler_weights,
+                max_wait=self.config.scheduler_max_wait
+            )
+        else:
+            self.workers = WorkerPool(
+                self._process,
+                workers=self.config.worker_count,
+                queue_size=self.config.queue_size,
+                store=self.jobs,
+                on_done=self._record,
+                batch_handler=process_batch,
+                weights=self.config.scheduler_weights,
+                max_wait=self.config.scheduler_max_wait
+            )
+
+        # Files settling in one directory (season packs) share league/season lookups
+        self.batcher = None
+        if self.config.batch_window > 0:
+            self.batcher = DirectoryBatcher(
+                self._submit_batch,
+                window=self.config.batch_window,
+                max_size=self.config.batch_max
+            )
+
+        # Bursts of created/modified/moved events collapse into one job per settled file;
+        # the job is persisted on the first event, not only once the file settled
+        self.intake = EventCoalescer(
+            self._admit,
+            quiet_period=self.config.quiet_period,
+            poll_interval=self.config.poll_interval,
+            store=self.jobs
+        )
+
+    def _admit(self, filepath: str, depth: int, action: str):
+        if self.manifest.is_unchanged(filepath):
+            log(f"Unchanged since last run, skipping: {filepath}", "FS", LL_DEBUG)
+            if action != "backfill":
+                self.jobs.done(filepath)    # persisted by intake when its first event came in
+            return
+        if self.batcher:
+            self.batcher.push(filepath, depth, action)
+        else:
+            self.workers.submit(filepath, depth, action, BACKFILL if action == "backfill" else LIVE)
+
+    def _submit_batch(self, jobs):
+        # Fresh arrivals always go ahead of the backfill scan
+        live = any(action != "backfill" for _, _, action in jobs)
+        self.workers.submit_batch(jobs, LIVE if live else BACKFILL)
+
+    def relocate(self, src: str, dest: str) -> bool:
+        """
+        Rename/move fast path: if `dest` is the already processed `src` (same
+        content identity), carry its sidecars and manifest entry along and tell
+        Jellyfin – no parsing, no TheSportsDB calls. Returns False when the file
+        needs the full pipeline.
+        """
+        if not self.manifest.same_content(src, dest):
+            return False
+        move_sidecars(src, dest)
+        self.manifest.rekey(src, dest)
+        threading.Thread(target=self.jellyfin.report_moved, args=(src, dest), daemon=True).start()
+        log(f"[MOVED] {src} → {dest} (sidecars relocated, no reprocessing)", "FS", LL_INFO)
+        return True
+
+    def relocate_tree(self, src: str, dest: str):
+        """
+        A whole directory moved: re-key manifest, job queue and intake state
+        below `src` to `dest` in one bulk operation (prefix range queries, so
+        the cost follows the size of the moved subtree, not the library).
+        """
+        manifest = self.manifest.rekey_tree(src, dest)
+        # The moved files' depth below their library root changes with the move
+        pending = self.intake.rekey_tree(src, dest, self._depth)
+        if self.batcher:
+            self.batcher.rekey_tree(src, dest, self._depth)
+        # Jobs already queued in memory still carry the old paths; the pool skips
+        # those as vanished, so the re-keyed ones are submitted again – except the
+        # files still settling or batching, which intake releases itself
+        queued = self.jobs.rekey_tree(src, dest)
+        for path, _, event in queued:
+            if not self.intake.holds(path) and not (self.batcher and self.batcher.holds(path)):
+                self.workers.submit(path, self._depth(path), event)
+        threading.Thread(target=self.jellyfin.report_moved, args=(src, dest), daemon=True).start()
+        log(f"[MOVED DIR] {src} → {dest}: {manifest} processed, {pending} pending, "
+            f"{len(queued)} queued file(s) re-keyed", "FS", LL_INFO)
+
+    def forget(self, path: str, is_directory: bool = False):
+        """A file or directory was deleted: evict everything recorded for it."""
+        if is_directory:
+            manifest = self.manifest.invalidate_tree(path)
+            pending = self.intake.discard_tree(path)
+            if self.batcher:
+                self.batcher.discard_tree(path)
+            queued = self.jobs.evict_tree(path)
+            log(f"[DELETED DIR] {path}: evicted {manifest} processed, {pending} pending, "
+                f"{queued} queued file(s)", "FS", LL_INFO)
+        else:
+            self.manifest.invalidate(path)
+            self.intake.discard(path)
+            if self.batcher:
+                self.batcher.discard(path)
+            self.jobs.done(path)
+
+    def _depth(self, filepath: str) -> int:
+        path = Path(filepath)
+        for root in self.reconciler.roots or self.library_paths:
+            if root in path.parents:
+                return len(path.parent.relative_to(root).parts)
+        return 0
+
+    def reprocess(self, filepath: str):
+        """Manually requested re-run of one file, ahead of backfill and retries."""
+        path = str(Path(filepath).resolve())
+        self.manifest.invalidate(path)
+        self.workers.submit(path, self._depth(path), "manual", MANUAL)
+
+    def _process(self, filepath: str, depth: int, action: str):
+        # Exceptions propagate to the pool, which records them in the job store for retry
+        log(f"[{action.upper()}] {filepath}  (depth={depth})", "FS", LL_INFO)
+        if self.pipeline:
+            return self.pipeline.run(new_job(filepath, depth))
+        return process_file(filepath, depth)
+
+    def _process_batch(self, jobs):
+        """Pipeline counterpart of process_batch: the files overlap, lookups are still shared."""
+        batch = {}
+        futures = [self.pipeline.submit(new_job(path, depth, batch)) for path, depth, *_ in jobs]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def _record(self, filepath: str, depth: int, action: str, result):
+        if not isinstance(result, dict) or 'nfo_hash' not in result:
+            return
+        if not result.get('tsdb_loaded'):
+            # Fallback .nfo (no match, or TheSportsDB unreachable) – retried on the next run
+            self.manifest.invalidate(filepath)
+        else:
+            self.manifest.record(
+                filepath,
+                nfo_hash=result['nfo_hash'],
+                event_id=result['idEvent'],
+                show=result.get('showname', ''),
+                league_id=result['idLeague']
+            )
 
     def _get_library_paths(self):
         try:
-            vf_data = self.jellyfin._request("GET", "Library/VirtualFolders")
-            paths = []
-            for folder in vf_data if isinstance(vf_data, list) else vf_data.get("Items", []):
-                for loc in folder.get("Locations", []):
-                    p = Path(loc)
-                    if p.is_dir():
-                        paths.append(p)
-            unique = {p.resolve() for p in paths}
-            return sorted(unique)
+            return self._fetch_library_paths(report=True)
         except Exception as e:
             log(f"Could not fetch libraries: {e} → using current directory", "MAIN", 40)
-            return [Path(".")]
+            return [Path(".").resolve()]
 
-    def run(self):
-        for path in self.library_paths:
-            handler = SportsVideoHandler(path, self)
-            self.observer.schedule(handler, str(path), recursive=True)
-            log(f"Watching → {path}", "MAIN")
+    def _fetch_library_paths(self, report: bool = False):
+        vf_data = self.jellyfin._request("GET", "Library/VirtualFolders")
+        if not vf_data:
+            raise ConnectionError("empty Library/VirtualFolders response")
+        folders = vf_data if isinstance(vf_data, list) else vf_data.get("Items", [])
+
+        # Only sports-relevant libraries: movie/music folders can never match a league
+        selected, skipped = select_locations(
+            folders,
+            self.config.collection_types,
+            self.config.include_globs,
+            self.config.exclude_globs
+        )
+        # Nested or duplicate locations would deliver the same file twice
+        roots = collapse_roots(p for p in selected if p.is_dir())
+
+        if report and skipped:
+            log(f"Skipped {len(skipped)} non-sports library location(s)", "MAIN")
+            # Walking big (network) trees takes minutes – count the saved watches off the startup path
+            threading.Thread(target=self._report_saved_watches, args=(skipped, roots),
+                             name="count-dirs", daemon=True).start()
+        return roots
+
+    def _report_saved_watches(self, skipped, roots):
+        unwatched = [p for p in collapse_roots(p for p in skipped if p.is_dir())
+                     if not any(p == r or r in p.parents for r in roots)]
+        saved = sum(count_dirs(p) for p in unwatched)
+        log(f"Skipped library locations: {saved} inotify watch(es) saved", "MAIN")
+
+    def _use_polling(self, path: Path) -> bool:
+        mode = self.config.polling_mode
+        if mode == "always":
+            return True
+        if any(fnmatch(str(path), g) for g in self.config.polling_globs):
+            return True
+        # inotify never sees changes made on the server side of a network share
+        return mode == "auto" and is_network_path(str(path))
+
+    def _watch(self, path: Path):
+        handler = SportsVideoHandler(path, self)
+        if not self._use_polling(path):
+            try:
+                return self.observer.schedule(handler, str(path), recursive=True)
+            except OSError as e:
+                if e.errno not in (errno.ENOSPC, errno.EMFILE):
+                    raise
+                # schedule() registered the handler before the emitter failed, and the
+                # watches added so far stay with the half-built inotify instance
+                _release_partial_watch(e)
+                try:
+                    self.observer.remove_handler_for_watch(handler, ObservedWatch(str(path), recursive=True))
+                except KeyError:
+                    pass
+                log(f"inotify limit reached for {path} ({e}) → falling back to polling", "MAIN", LL_WARN)
+        poller = DirectoryPoller(
+            str(path),
+            handler,
+            min_interval=self.config.poll_min_interval,
+            max_interval=self.config.poll_max_interval
+        )
+        poller.start()
+        return poller
+
+    def _unwatch(self, path: Path, watch):
+        if isinstance(watch, DirectoryPoller):
+            watch.stop()
+        else:
+            self.observer.unschedule(watch)
+
+    def _start_backfill(self):
+        """Walk the existing libraries once, in the background, through the same worker pool."""
+        self.scanner = LibraryScanner(
+            self.reconciler.roots,
+            SportsVideoHandler.VIDEO_EXTENSIONS,
+            self._admit,
+            checkpoint=ScanCheckpoint(str(self.config.backfill_checkpoint)),
+            workers=self.config.backfill_workers
+        )
+        log(f"Backfill scan started (checkpoint: {self.config.backfill_checkpoint})", "MAIN")
+        threading.Thread(target=self.scanner.run, name="backfill", daemon=True).start()
 
+    def _log_stats(self):
+        st = self.workers.stats()
+        log(
+            f"Workers: {st['busy']}/{st['workers']} busy, utilisation {st['utilisation']:.0%}, "
+            f"queue {st['queue_depth']}/{st['queue_size']}, backfill {st['backfill']}, "
+            f"done {st['processed']}, failed {st['failed']}, shed {st['shed']}",
+            "MAIN"
+        )
+        for cls, c in st['classes'].items():
+            log(f"  {cls:<8} queued {c['depth']}, served {c['count']}, "
+                f"wait mean {c['mean']:.1f}s / max {c['max']:.1f}s", "MAIN")
+        if self.config.worker_mode != "process":
+            # Counted per process, so only meaningful when the .nfo writes happen here
+            nfo = nfo_write_stats()
+            log(f"  .nfo     written {nfo['written']}, unchanged (write avoided) {nfo['unchanged']}, "
+                f"failed {nfo['failed']}", "MAIN")
+            dirs = dircache.cache.stats()
+            log(f"  listings {dirs['dirs']} cached dir(s), {dirs['hits']} hit(s), {dirs['misses']} miss(es)", "MAIN")
+            for name, m in nameregex.memo_stats().items():
+                log(f"  memo {name:<14} {m['size']} cached, {m['hits']} hit(s), {m['misses']} miss(es)", "MAIN")
+            grammar.log_match_rates(nameregex.grammar_stats())
+        if self.pipeline:
+            for name, sst in self.pipeline.stats().items():
+                t = sst['service']
+                log(f"  stage {name:<6} {sst['busy']}/{sst['workers']} busy, queued {sst['queued']}, "
+                    f"done {t['count']}, p50 {t['p50'] * 1000:.0f}ms / p95 {t['p95'] * 1000:.0f}ms / "
+                    f"max {t['max'] * 1000:.0f}ms, wait p95 {sst['wait']['p95'] * 1000:.0f}ms", "MAIN")
+
+    def run(self):
+        # Observer runs first so an exhausted inotify limit surfaces per root in _watch()
         self.observer.start()
+        self.reconciler.reconcile(self.library_paths)
+
+        self.jobs.start()
+        if self.pipeline:
+            self.pipeline.start()
+        self.workers.start()
+        self.workers.resume(self.config.max_attempts)
+        if self.batcher:
+            self.batcher.start()
+        self.intake.start()
+        self.reconciler.start()
         log("Monitoring active. Press Ctrl+C to stop.", "MAIN")
 
+        for filepath in self.reprocess_paths:
+            self.reprocess(filepath)
+
+        if self.backfill:
+            self._start_backfill()
+
         try:
+            last_stats = time.monotonic()
             while True:
                 time.sleep(1)
+                if self.config.stats_interval and time.monotonic() - last_stats >= self.config.stats_interval:
+                    self._log_stats()
+                    last_stats = time.monotonic()
         except KeyboardInterrupt:
             log("Shutting down...", "MAIN")
         finally:
+            if self.scanner:
+                self.scanner.stop()
+            self.reconciler.stop()
+            self.reconciler.unwatch_all()
             self.observer.stop()
             self.observer.join()
+            self.intake.stop()
+            if self.batcher:
+                self.batcher.stop()
+            self.workers.stop()
+            if self.pipeline:
+                self.pipeline.stop()
+            self.jobs.close()
+            log(f"Manifest: skipped {self.manifest.skipped} of {self.manifest.checked} unchanged file(s)", "MAIN")
+            self.manifest.close()
+            slots = self.episode_slots.stats()
+            log(f"Episode slots: {slots['allocated']} allocated, {slots['collisions']} collision(s) resolved", "MAIN")
+            self.episode_slots.close()
+            log(f"Intake: {self.intake.events_received} events → {self.intake.jobs_emitted} jobs", "MAIN")
+            self._log_stats()
             log("Stopped.", "MAIN")
 
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="JellySportsDB filesystem watcher + metadata agent")
+    parser.add_argument("--backfill", action="store_true",
+                        help="also process files already present in the libraries; resumes from the "
+                             "[backfill] checkpoint file (delete it to rescan everything)")
+    parser.add_argument("--reprocess", action="append", default=[], metavar="FILE",
+                        help="process FILE again at manual priority, even if unchanged (repeatable)")
+
+    commands = parser.add_subparsers(dest="command")
+    scan = commands.add_parser("scan", help="match every video below PATH and write JSON Lines; "
+                                            "no watcher, nothing is pushed to Jellyfin")
+    scan.add_argument("path", metavar="PATH")
+    scan.add_argument("--dry-run", action="store_true",
+                      help="do not write .nfo files, episode slots or the network cache")
+    scan.add_argument("--jobs", type=int, default=0, metavar="N", help="worker processes (default: CPU count)")
+    scan.add_argument("--out", metavar="FILE", help="write results to FILE instead of stdout")
+    return parser.parse_args(argv)
+
+
+def scan_main(args):
+    config = AppConfig()
+    setup_logging(level=config.log_level)
+    netstrip.configure(config.network_cache)
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    try:
+        stats = run_scan(
+            args.path,
+            SportsVideoHandler.VIDEO_EXTENSIONS,
+            out=out,
+            jobs=args.jobs,
+            dry_run=args.dry_run,
+            config_path=str(config.path)
+        )
+    finally:
+        if args.out:
+            out.close()
+    print(json.dumps(stats), file=sys.stderr)
+
+
 if __name__ == "__main__":
     reload(sys)
-    app = JellySportsDBApp()
-    app.run()
\ No newline at end of file
+    args = parse_args()
+    if args.command == "scan":
+        scan_main(args)
+    else:
+        app = JellySportsDBApp(backfill=args.backfill, reprocess=args.reprocess)
+        app.run()
\ No newline at end of file
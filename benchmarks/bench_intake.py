@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Replays a synthetic inotify event storm through EventCoalescer and reports
+jobs emitted versus events received.
+
+    python benchmarks/bench_intake.py --files 40 --writes 2000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from helpers.intake import EventCoalescer  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument('--files', type=int, default=40, help='files copied at the same time')
+    ap.add_argument('--writes', type=int, default=2000, help='write events per file')
+    ap.add_argument('--tick', type=float, default=0.01, help='simulated seconds between writes')
+    ap.add_argument('--quiet', type=float, default=5.0, help='quiet period in seconds')
+    args = ap.parse_args()
+
+    clock = FakeClock()
+    released = []
+    intake = EventCoalescer(lambda p, d, a: released.append(p), quiet_period=args.quiet, clock=clock)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"{i:02d}.NASCAR.Cup.Series.2024.R13.Race.mkv") for i in range(args.files)]
+        for p in paths:
+            open(p, 'wb').close()
+            intake.push(p, 1, 'created')
+
+        started = time.perf_counter()
+        next_poll = 1.0
+        for n in range(args.writes):
+            clock.now += args.tick
+            for p in paths:
+                with open(p, 'ab') as f:
+                    f.write(b'\0' * 64)
+                os.utime(p, ns=(int(clock.now * 1e9), int(clock.now * 1e9) + n))
+                intake.push(p, 1, 'modified')
+            if clock.now >= next_poll:
+                intake.poll()
+                next_poll += 1.0
+
+        # Copy finished – keep polling until every file has settled
+        while intake.pending():
+            clock.now += 1.0
+            intake.poll()
+        elapsed = time.perf_counter() - started
+
+    print(f"events received : {intake.events_received}")
+    print(f"jobs emitted    : {intake.jobs_emitted}")
+    print(f"reduction       : {intake.events_received / max(intake.jobs_emitted, 1):.0f}x")
+    print(f"wall time       : {elapsed:.2f}s ({intake.events_received / elapsed:,.0f} events/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Warm-restart skip rate of the fingerprint manifest: records a synthetic
+library, reopens the manifest, changes a fraction of the files and checks
+every file again as the intake would.
+
+    python benchmarks/bench_manifest.py --files 50000 --changed 0.02
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from helpers.manifest import FileManifest  # noqa: E402
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument('--files', type=int, default=50000)
+    ap.add_argument('--per-dir', type=int, default=40, help='files per season folder')
+    ap.add_argument('--changed', type=float, default=0.02, help='fraction of files modified before restart')
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.files):
+            d = os.path.join(tmp, f"Show {i // (args.per_dir * 20)}", f"Season {i // args.per_dir}")
+            if i % args.per_dir == 0:
+                os.makedirs(d, exist_ok=True)
+            p = os.path.join(d, f"{i % args.per_dir:02d}.Series.2024.R{i % 30:02d}.Race.mkv")
+            with open(p, 'wb') as f:
+                f.write(b'\0' * 16)
+            open(os.path.splitext(p)[0] + '.nfo', 'wb').close()
+            paths.append(p)
+
+        db = os.path.join(tmp, 'manifest.db')
+        manifest = FileManifest(db)
+        started = time.perf_counter()
+        for i, p in enumerate(paths):
+            manifest.record(p, nfo_hash='x', event_id=str(i), show=f"Show {i // 800} (2024)", league_id='4393')
+        record_s = time.perf_counter() - started
+        manifest.close()
+
+        for p in random.sample(paths, int(len(paths) * args.changed)):
+            with open(p, 'ab') as f:
+                f.write(b'\1')
+
+        # Warm restart
+        manifest = FileManifest(db)
+        started = time.perf_counter()
+        skipped = sum(1 for p in paths if manifest.is_unchanged(p))
+        check_s = time.perf_counter() - started
+        manifest.close()
+
+    print(f"files           : {len(paths)}")
+    print(f"record          : {record_s:.2f}s ({len(paths) / record_s:,.0f} files/s)")
+    print(f"warm check      : {check_s:.2f}s ({len(paths) / check_s:,.0f} files/s)")
+    print(f"skipped         : {skipped} ({skipped / len(paths):.1%})")
+    print(f"reprocessed     : {len(paths) - skipped}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Names per second of nameregex.get_episode / get_session matching, before
+(raw pattern strings through re.search, in dict order) and after
+(precompiled patterns behind the prefilter dispatcher). Every name is also
+checked to give the same family and groups on both paths.
+
+    python benchmarks/bench_nameregex.py --names 200000
+    python benchmarks/bench_nameregex.py --corpus release-names.txt
+
+--corpus takes one release name per line (e.g. `find /media -type f -printf '%f\\n'`);
+without it a synthetic corpus is generated from the naming schemes the
+patterns were written for.
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from helpers import nameregex  # noqa: E402
+
+SHOWS = ['NHL', 'NFL', 'NBA', 'MLB', 'Formula1', 'Formula 1', 'MotoGP', 'NASCAR Cup Series', 'IndyCar',
+         'WRC', 'UFC', 'Premier League', 'Bundesliga', 'Euro', 'WEC', 'Supercars', 'DTM', 'F2', 'F3']
+EVENTS = ['Watkins Glen', 'Goodyear 400', 'Monaco', 'Silverstone', 'Bahrain', 'Le Mans 24h', 'Daytona 500',
+          'Groep F - Turkije - Georgie', 'New Orleans Saints  vs Tennessee Titans', 'Real Madrid  at Barcelona']
+SESSIONS = ['Race', 'Sprint Race', 'Qualifying', 'Free Practice 2', 'FP1', 'Top 10 Shootout', 'Heat Races',
+            '1st Half', '2nd Period', 'Full Game', 'Overtime', 'Day 2', 'Stage 3', 'Finals', 'Pre-Show', '']
+TAILS = ['720p60 h264 English-egortech', '1080p HDTV x264-Reborn4HD', 'FS1 720P', 'WEB-DL AAC2 0 H 264',
+         'FoxSports 720p60 h264 English-egortech', 'SkyF1 1080p50', '']
+
+
+def synthetic(n: int, seed: int = 1, clean: bool = True) -> list:
+    rnd = random.Random(seed)
+    names = []
+    for _ in range(n):
+        show, event, session, tail = rnd.choice(SHOWS), rnd.choice(EVENTS), rnd.choice(SESSIONS), rnd.choice(TAILS)
+        year = rnd.randint(2005, 2025)
+        kind = rnd.randrange(6)
+        if kind == 0:
+            name = f"{show} {year} {rnd.randint(1, 12):02d} {rnd.randint(1, 28):02d} {event} {session} {tail}"
+        elif kind == 1:
+            name = f"{show} {year} Round {rnd.randint(1, 24):02d} {event} {session} {tail}"
+        elif kind == 2:
+            name = f"{show} {year} Week {rnd.randint(1, 18):02d} {event} {session} {tail}"
+        elif kind == 3:
+            name = f"{rnd.randint(1, 40):02d} {show} {year} R{rnd.randint(1, 36)} {event} {session} {tail}"
+        elif kind == 4:
+            name = f"{show} {year} - s{rnd.randint(1, 9):02d}e{rnd.randint(1, 60):02d} - {event} {session}"
+        else:
+            name = f"{show} {event} {session} {tail}"     # matches nothing
+        if rnd.random() < 0.3:
+            name = name.replace(' ', '.')
+        names.append(nameregex.cleanfilenames(name) if clean else name)
+    return names
+
+
+# ───────────────────────────────────────────────
+#   Reference: the matching loop as it was before precompilation
+# ───────────────────────────────────────────────
+
+def ref_first(regexes: dict, s: str):
+    for re_type, regex_list in regexes.items():
+        for rx in regex_list:
+            match = re.search(rx, s, re.IGNORECASE)
+            if match:
+                return re_type, match
+    return None, None
+
+
+def key(result):
+    re_type, match = result
+    return re_type, match.groupdict() if match else None, match.span() if match else None
+
+
+def run(label: str, fn, names: list) -> float:
+    started = time.perf_counter()
+    for name in names:
+        fn(name)
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<28} {len(names) / elapsed:>12,.0f} names/s  ({elapsed:.2f}s)")
+    return elapsed
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--corpus', help='file with one release name per line')
+    ap.add_argument('--names', type=int, default=100000, help='synthetic corpus size')
+    args = ap.parse_args()
+
+    if args.corpus:
+        with open(args.corpus, encoding='utf-8', errors='replace') as f:
+            names = [nameregex.cleanfilenames(os.path.splitext(line.strip())[0]) for line in f if line.strip()]
+    else:
+        names = synthetic(args.names)
+    print(f"{len(names):,} names")
+
+    # Same family, groups and span on both paths, for episodes and for sessions
+    mismatches = 0
+    events = []
+    for name in names:
+        old, new = ref_first(nameregex.episode_regexes, name), nameregex._match_episode(name)
+        if key(old) != key(new):
+            mismatches += 1
+        event = (old[1].groupdict().get('event') or '') if old[1] else name
+        events.append(event)
+        if key(ref_first(nameregex.session_regexes, event)) != \
+                key(nameregex._match_session(event)):
+            mismatches += 1
+    matched = sum(1 for name in names if nameregex._match_episode(name)[0])
+    print(f"{matched:,} matched an episode pattern, {mismatches} mismatch(es) between old and new")
+
+    print("episode patterns")
+    before = run('before (re.search strings)', lambda s: ref_first(nameregex.episode_regexes, s), names)
+    after = run('after (compiled+prefilter)', lambda s: nameregex._match_episode(s), names)
+    print(f"  speed-up ×{before / after:.2f}")
+    print("session patterns")
+    before = run('before (re.search strings)', lambda s: ref_first(nameregex.session_regexes, s), events)
+    after = run('after (compiled+prefilter)', lambda s: nameregex._match_session(s), events)
+    print(f"  speed-up ×{before / after:.2f}")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Network tag stripping: one substring search per known network (the naive
+way) against netstrip's Aho–Corasick automaton, which scans each name once.
+Both must find the same tags, and the fixed REGRESSIONS (team and event
+names that are also network names) must clean as listed.
+
+--startup instead reports, in fresh interpreters, what the first cleaned
+name costs: compiling the table vs loading the cached automaton (time and
+RSS growth).
+
+    python benchmarks/bench_netstrip.py --names 50000
+    python benchmarks/bench_netstrip.py --corpus release-names.txt
+    python benchmarks/bench_netstrip.py --startup
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from helpers import nameregex, netstrip  # noqa: E402
+from bench_nameregex import synthetic  # noqa: E402
+
+TAGS = ['FoxSports', 'FS1', 'Sky F1', 'SkyF1', 'ESPN', 'BBC One', 'TNT Sports', 'DAZN', 'Eurosport', '']
+
+# name → (clean name, network tag)
+REGRESSIONS = {
+    'NBA 2024 Week 12 Orlando Magic vs Miami Heat': ('NBA 2024 Week 12 Orlando Magic vs Miami Heat', ''),
+    'NFL 2023 Week 05 Steelers versus Ravens': ('NFL 2023 Week 05 Steelers versus Ravens', ''),
+    'Tennis 2023 ATP Finals': ('Tennis 2023 ATP Finals', ''),
+    'NCAAF 2023 Week 14 ACC Championship Game': ('NCAAF 2023 Week 14 ACC Championship Game', ''),
+    'NFL 2023 History of the NFL': ('NFL 2023 History of the NFL', ''),
+    'NHRA 2023 Speed Week': ('NHRA 2023 Speed Week', ''),
+    'WWE 2024 Premier Global Challenge 720p': ('WWE 2024 Premier Global Challenge 720p', ''),
+    'NFL.2023.Week.01.Saints.vs.Titans.FoxSports.720p.h264-EGORTECH':
+        ('NFL.2023.Week.01.Saints.vs.Titans.720p.h264-EGORTECH', 'FoxSports'),
+    'Formula1.2024.Round.05.Miami.Race.SkyF1.1080p': ('Formula1.2024.Round.05.Miami.Race.1080p', 'SkyF1'),
+    'NFL 2023 Week 01 Saints vs Titans ESPN': ('NFL 2023 Week 01 Saints vs Titans', 'ESPN'),
+    'NFL 2023 Week 01 Saints vs Titans FS1 WEB-DL 1080p': ('NFL 2023 Week 01 Saints vs Titans WEB-DL 1080p', 'FS1'),
+    'UFC 300 Prelims ESPN+ 720p': ('UFC 300 Prelims 720p', 'ESPN+'),
+}
+
+
+def naive_find(patterns: list, name: str) -> list:
+    """Same rules as NetworkStripper.find, one str.find loop per pattern."""
+    text = netstrip.fold(name)
+    show_end = next((i for i, ch in enumerate(text) if ch.isdigit()), len(text))
+    candidates = []
+    for p in patterns:
+        start = text.find(p)
+        while start != -1:
+            end = start + len(p)
+            if start >= show_end and netstrip._boundary(text, start) and netstrip._boundary(text, end):
+                candidates.append((start, end))
+            start = text.find(p, start + 1)
+    return netstrip.tail_spans(text, candidates)
+
+
+def regressions() -> int:
+    """Number of REGRESSIONS that do not clean as listed (each one printed)."""
+    failed = 0
+    for name, expected in REGRESSIONS.items():
+        got = nameregex.cleanfilenames(name, with_network=True)
+        if got != expected:
+            failed += 1
+            print(f"  REGRESSION {name!r}\n    expected {expected}\n    got      {got}")
+    return failed
+
+
+def run(label: str, fn, names: list) -> float:
+    started = time.perf_counter()
+    for name in names:
+        fn(name)
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<22} {len(names) / elapsed:>12,.0f} names/s  ({elapsed:.2f}s)")
+    return elapsed
+
+
+STARTUP = """
+import sys, time
+sys.path.insert(0, sys.argv[1])
+def rss():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * 4096 / 2 ** 20
+r0, t0 = rss(), time.perf_counter()
+from helpers import nameregex, netstrip
+r1, t1 = rss(), time.perf_counter()
+netstrip.configure(sys.argv[2] or None)
+nameregex.cleanfilenames('NFL 2023 Week 01 Saints vs Titans FoxSports 720p')
+r2, t2 = rss(), time.perf_counter()
+print(f"{(t1 - t0) * 1e3:.1f} {r1 - r0:.1f} {(t2 - t1) * 1e3:.1f} {r2 - r1:.1f}")
+"""
+
+
+def startup(runs: int = 5):
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = os.path.join(tmp, 'networks.cache')
+        for label, path in (('no cache file', ''), ('cold cache', cache), ('warm cache', cache)):
+            samples = []
+            for _ in range(runs if label != 'cold cache' else 1):
+                if label == 'cold cache' and os.path.exists(cache):
+                    os.unlink(cache)
+                line = subprocess.run([sys.executable, '-c', STARTUP, root, path],
+                                      capture_output=True, text=True, check=True).stdout
+                samples.append([float(v) for v in line.split()])
+            best = [min(column) for column in zip(*samples)]
+            print(f"  {label:<14} import nameregex {best[0]:6.1f} ms +{best[1]:.1f} MiB   "
+                  f"first name {best[2]:6.1f} ms +{best[3]:.1f} MiB")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--corpus', help='file with one release name per line')
+    ap.add_argument('--names', type=int, default=20000, help='synthetic corpus size')
+    ap.add_argument('--startup', action='store_true', help='measure first-use cost in fresh interpreters')
+    args = ap.parse_args()
+
+    if args.startup:
+        startup()
+        return 0
+
+    if args.corpus:
+        with open(args.corpus, encoding='utf-8', errors='replace') as f:
+            names = [os.path.splitext(line.strip())[0] for line in f if line.strip()]
+    else:
+        rnd = random.Random(1)
+        names = [f"{name} {rnd.choice(TAGS)} 720p" for name in synthetic(args.names)]
+
+    stripper = netstrip.stripper()
+    print(f"{len(names):,} names, automaton of {len(stripper.automaton):,} nodes")
+    failed = regressions()
+    print(f"{len(REGRESSIONS) - failed}/{len(REGRESSIONS)} regression case(s) clean as expected")
+
+    patterns = []
+    node_paths = [(0, '')]
+    for node, path in node_paths:                  # recover the pattern set from the trie
+        for ch, nxt in stripper.automaton.goto[node].items():
+            node_paths.append((nxt, path + ch))
+            if len(path) + 1 in stripper.automaton.out[nxt]:
+                patterns.append(path + ch)
+
+    mismatches = sum(1 for name in names if naive_find(patterns, name) != stripper.find(name))
+    found = sum(1 for name in names if stripper.find(name))
+    print(f"{found:,} names carry a network tag, {mismatches} mismatch(es) against the naive scan")
+
+    before = run(f'naive ({len(patterns):,} finds)', lambda s: naive_find(patterns, s), names)
+    after = run('automaton', stripper.find, names)
+    print(f"  speed-up ×{before / after:.2f}")
+    return 1 if mismatches or failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Throughput and peak memory of parsing a large name list three ways:
+
+  loop      cleanfilenames → get_episode → get_session per name, keeping
+            the result dicts (what a backfill report did before)
+  columnar  nameregex.parse_many in this process
+  pool      nameregex.parse_many fanned out over --jobs processes
+
+Every mode runs in a fresh interpreter, so peak RSS (ru_maxrss) is its own;
+"names" is the RSS with just the input list loaded.
+
+    python benchmarks/bench_parse_many.py --names 1000000 --jobs 4
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from helpers import nameregex  # noqa: E402
+from bench_nameregex import synthetic  # noqa: E402
+
+MODES = ('loop', 'columnar', 'pool')
+
+
+def peak_mib(who=resource.RUSAGE_SELF) -> float:
+    return resource.getrusage(who).ru_maxrss / 1024.0      # KiB on Linux
+
+
+def run_mode(mode: str, n: int, jobs: int) -> dict:
+    names = synthetic(n, clean=False)
+    base = peak_mib()
+    started = time.perf_counter()
+    if mode == 'loop':
+        rows = []
+        for name in names:
+            cleanname = nameregex.cleanfilenames(name)
+            episode = nameregex.get_episode(cleanname)
+            if episode.get('retype'):
+                episode.update(nameregex.get_session(episode, cleanname))
+            rows.append(episode)
+        count = len(rows)
+    else:
+        result = nameregex.parse_many(names, processes=jobs if mode == 'pool' else 0)
+        count = len(result)
+    elapsed = time.perf_counter() - started
+    return {
+        'mode': mode,
+        'names': count,
+        'seconds': round(elapsed, 2),
+        'names_per_s': round(count / elapsed),
+        'rss_names_mib': round(base, 1),
+        'rss_peak_mib': round(peak_mib(), 1),
+        'rss_workers_mib': round(peak_mib(resource.RUSAGE_CHILDREN), 1)
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--names', type=int, default=1000000)
+    ap.add_argument('--jobs', type=int, default=os.cpu_count() or 1)
+    ap.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.names, args.jobs)))
+        return 0
+
+    print(f"{args.names:,} names, pool of {args.jobs}")
+    print(f"  {'mode':<9} {'names/s':>10} {'seconds':>8} {'RSS names':>10} {'RSS peak':>9} {'worker peak':>12}")
+    for mode in MODES:
+        line = subprocess.run([sys.executable, os.path.abspath(__file__), '--mode', mode,
+                               '--names', str(args.names), '--jobs', str(args.jobs)],
+                              capture_output=True, text=True, check=True).stdout
+        r = json.loads(line.strip().splitlines()[-1])
+        print(f"  {mode:<9} {r['names_per_s']:>10,} {r['seconds']:>8.2f} {r['rss_names_mib']:>8.1f}MB "
+              f"{r['rss_peak_mib']:>7.1f}MB {r['rss_workers_mib']:>10.1f}MB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Fuzz harness for session detection. Feeds random event strings built from
+the session vocabulary, release-name noise (network tags, codec strings)
+and the non-ASCII letters IGNORECASE folds onto ASCII through both the
+plain session regexes and nameregex's compiled + prefiltered dispatch, and
+reports
+
+  - every input where the two disagree (family, groups or span), and
+  - every input where a compiled search took longer than --slow-ms (a
+    backtracking blow-up).
+
+A growth check then times the dispatch on inputs of doubling length to show
+how it scales.
+
+    python benchmarks/fuzz_sessions.py --cases 200000 --seed 7
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from helpers import nameregex  # noqa: E402
+
+VOCAB = ['half', 'period', 'quarter', 'inning', 'set', 'full', 'game', 'match', 'over', 'time', 'ot', 'extra',
+         'et', 'q', 'qual', 'quali', 'qualy', 'qualifying', 'qualification', 'qualifier', 'qualifiers',
+         'practice', 'free', 'fp', 'top', 'heat', 'races', 'shootout', 'sprint', 'feature', 'main', 'race',
+         'stage', 'day', 'finals', 'part', '1st', '2nd', '3rd', '4th', '10', '2', '07']
+NOISE = ['720p', '1080p60', 'h264', 'x265', 'hevc', 'web-dl', 'english', 'egortech', 'fs1', 'skyf1', 'espn',
+         'hdtv', 'aac2', 'reborn4hd', 'vs', '@', 'at', 'grand', 'prix', 'watkins', 'glen', 'raceday', 'settle']
+ODD = ['İ', 'ı', 'ſ', 'K', 'K', 'S', 'I', 'É']
+
+
+def random_event(rnd: random.Random) -> str:
+    words = []
+    for _ in range(rnd.randint(1, 14)):
+        r = rnd.random()
+        if r < 0.55:
+            w = rnd.choice(VOCAB)
+        elif r < 0.9:
+            w = rnd.choice(NOISE)
+        else:
+            w = ''.join(rnd.choice('abeghimoqrstp0123 ' + ''.join(ODD)) for _ in range(rnd.randint(1, 6)))
+        if rnd.random() < 0.3:
+            w = w.upper() if rnd.random() < 0.5 else w.capitalize()
+        words.append(w)
+    sep = rnd.choice([' ', ' ', ' ', '  ', ''])
+    s = sep.join(words)
+    return (' ' if rnd.random() < 0.8 else '') + s
+
+
+def ref_session(s: str):
+    for re_type, regex_list in nameregex.session_regexes.items():
+        for rx in regex_list:
+            match = re.search(rx, s, re.IGNORECASE)
+            if match:
+                return re_type, match
+    return None, None
+
+
+def key(result):
+    re_type, match = result
+    return re_type, match.groupdict() if match else None, match.span() if match else None
+
+
+def timed(fn, s: str, repeat: int = 1) -> tuple:
+    """(result, best-of-`repeat` seconds) – best-of filters out GC pauses and scheduler noise."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(s)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def growth(label: str, fn, unit: str, steps: int = 8):
+    print(f"  {label}")
+    prev = None
+    for k in range(steps):
+        s = unit * (1 << k)
+        _, t = timed(fn, s, repeat=3)
+        ratio = f"×{t / prev:.1f}" if prev else ''
+        print(f"    len {len(s):>7}  {t * 1e3:9.3f} ms  {ratio}")
+        prev = t
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--cases', type=int, default=100000)
+    ap.add_argument('--seed', type=int, default=1)
+    ap.add_argument('--slow-ms', type=float, default=5.0, help='flag compiled searches slower than this')
+    args = ap.parse_args()
+
+    rnd = random.Random(args.seed)
+    compiled = nameregex._match_session
+    mismatches, slow = [], []
+    total_ref = total_rx = 0.0
+
+    for _ in range(args.cases):
+        s = random_event(rnd)
+        old, t_ref = timed(ref_session, s)
+        new, t_rx = timed(compiled, s)
+        total_ref += t_ref
+        total_rx += t_rx
+        if key(old) != key(new):
+            mismatches.append((s, key(old), key(new)))
+        if t_rx * 1e3 > args.slow_ms:
+            # Confirm with a best-of timing before reporting
+            _, t_rx = timed(compiled, s, repeat=20)
+            if t_rx * 1e3 > args.slow_ms:
+                slow.append((t_rx, s))
+
+    print(f"{args.cases:,} cases: plain regexes {total_ref:.2f}s, compiled + prefilter {total_rx:.2f}s")
+    print(f"{len(mismatches)} mismatch(es)")
+    for s, old, new in mismatches[:20]:
+        print(f"  {s!r}\n    plain:    {old}\n    compiled: {new}")
+    print(f"{len(slow)} slow search(es)")
+    for t_rx, s in sorted(slow, reverse=True)[:20]:
+        print(f"  {t_rx * 1e3:.2f} ms: {s[:120]!r}")
+
+    print("growth on repeated noisy input")
+    for unit in (' race fs1 720p h264', ' top 1 heat q', ' 1st 2nd 3rd half'):
+        growth(f"unit {unit!r}", compiled, unit)
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,235 @@
+# helpers/backfill.py
+"""
+Initial library backfill – walks every library root with parallel os.scandir
+workers and feeds existing video files into the processing pipeline.
+Progress is checkpointed so a crashed scan resumes without rescanning
+finished directories.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from . import plexlog as log
+
+pluginid = "BACKFILL"
+
+CHECKPOINT_VERSION = 1
+
+
+class ScanCheckpoint:
+    """
+    Two sets of directories:
+      done   – the directory and its whole subtree were submitted (skipped on resume)
+      listed – only the directory's own files were submitted (on resume it is
+               listed again for sub-directories, but its files are not re-queued)
+    A directory whose subtree completes replaces its children's entries, so
+    the file stays small even for very large libraries.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.done: Set[str] = set()
+        self.listed: Set[str] = set()
+        self._lock = threading.Lock()
+        self._dirty = False
+        if path:
+            self._load()
+
+    def _load(self):
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            log.Log(f"Ignoring unreadable checkpoint {self.path}: {e}", pluginid, log.LL_WARN)
+            return
+        if data.get('version') != CHECKPOINT_VERSION:
+            log.Log(f"Ignoring checkpoint with unknown version: {self.path}", pluginid, log.LL_WARN)
+            return
+        self.done = set(data.get('done', []))
+        self.listed = set(data.get('listed', []))
+        log.Log(f"Resuming backfill: {len(self.done)} finished subtree(s), "
+                f"{len(self.listed)} listed dir(s)", pluginid)
+
+    def mark_listed(self, dirpath: str):
+        with self._lock:
+            self.listed.add(dirpath)
+            self._dirty = True
+
+    def mark_done(self, dirpath: str, children: Iterable[str]):
+        with self._lock:
+            for child in children:
+                self.done.discard(child)
+            self.listed.discard(dirpath)
+            self.done.add(dirpath)
+            self._dirty = True
+
+    def save(self, force: bool = False):
+        if not self.path:
+            return
+        with self._lock:
+            if not (self._dirty or force):
+                return
+            data = {
+                'version': CHECKPOINT_VERSION,
+                'done': sorted(self.done),
+                'listed': sorted(self.listed)
+            }
+            self._dirty = False
+        tmp = self.path + '.tmp'
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            log.Log(f"Could not write checkpoint {self.path}: {e}", pluginid, log.LL_ERROR)
+
+
+class _DirState:
+    __slots__ = ('parent', 'children', 'outstanding')
+
+    def __init__(self, parent: Optional[str]):
+        self.parent = parent
+        self.children: List[str] = []
+        self.outstanding = 1    # the directory's own listing
+
+
+class LibraryScanner:
+    """
+    Parallel scandir walk over `roots`. Every file whose suffix is in
+    `extensions` is handed to `submit(path, depth, 'backfill')`, where depth
+    has the same meaning as in SportsVideoHandler (0 = directly in the root).
+    """
+
+    def __init__(
+        self,
+        roots: Iterable,
+        extensions: Iterable[str],
+        submit: Callable[[str, int, str], object],
+        checkpoint: Optional[ScanCheckpoint] = None,
+        workers: int = 8,
+        checkpoint_every: float = 10.0
+    ):
+        self.roots = [os.path.abspath(str(r)) for r in roots]
+        self.extensions = {e.lower() for e in extensions}
+        self.submit = submit
+        self.checkpoint = checkpoint or ScanCheckpoint()
+        self.workers = max(1, workers)
+        self.checkpoint_every = checkpoint_every
+
+        self._queue: queue.Queue = queue.Queue()
+        self._states: Dict[str, _DirState] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+        self.dirs_scanned = 0
+        self.dirs_skipped = 0
+        self.files_submitted = 0
+
+    def stop(self):
+        self._stop.set()
+
+    # ───────────────────────────────────────────────
+    #   Walk
+    # ───────────────────────────────────────────────
+
+    def run(self) -> dict:
+        started = time.monotonic()
+        for root in self.roots:
+            self._enqueue(root, root, 0, None)
+
+        threads = [threading.Thread(target=self._worker, name=f"backfill-{i}", daemon=True)
+                   for i in range(self.workers)]
+        for t in threads:
+            t.start()
+
+        last_save = time.monotonic()
+        while any(t.is_alive() for t in threads):
+            for t in threads:
+                t.join(timeout=1.0)
+            if time.monotonic() - last_save >= self.checkpoint_every:
+                self.checkpoint.save()
+                last_save = time.monotonic()
+        self.checkpoint.save(force=True)
+
+        stats = {
+            'dirs_scanned': self.dirs_scanned,
+            'dirs_skipped': self.dirs_skipped,
+            'files_submitted': self.files_submitted,
+            'seconds': time.monotonic() - started
+        }
+        log.Log(f"Backfill finished: {stats['files_submitted']} file(s) from {stats['dirs_scanned']} dir(s), "
+                f"{stats['dirs_skipped']} finished subtree(s) skipped in {stats['seconds']:.1f}s", pluginid)
+        return stats
+
+    def _enqueue(self, dirpath: str, root: str, depth: int, parent: Optional[str]) -> bool:
+        with self._lock:
+            if dirpath in self.checkpoint.done:
+                self.dirs_skipped += 1
+                return False
+            self._states[dirpath] = _DirState(parent)
+        self._queue.put((dirpath, root, depth))
+        return True
+
+    def _worker(self):
+        while not self._stop.is_set():
+            try:
+                dirpath, root, depth = self._queue.get(timeout=0.2)
+            except queue.Empty:
+                with self._lock:
+                    if not self._states:
+                        return
+                continue
+            try:
+                self._scan(dirpath, root, depth)
+            finally:
+                self._queue.task_done()
+
+    def _scan(self, dirpath: str, root: str, depth: int):
+        resubmit = dirpath not in self.checkpoint.listed
+        subdirs = []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif resubmit and os.path.splitext(entry.name)[1].lower() in self.extensions \
+                                and entry.is_file():
+                            self.submit(entry.path, depth, 'backfill')
+                            with self._lock:
+                                self.files_submitted += 1
+                    except OSError:
+                        continue
+        except OSError as e:
+            log.Log(f"Could not scan {dirpath}: {e}", pluginid, log.LL_WARN)
+
+        with self._lock:
+            self.dirs_scanned += 1
+            self._states[dirpath].outstanding += len(subdirs)
+        self.checkpoint.mark_listed(dirpath)
+
+        for sub in subdirs:
+            with self._lock:
+                self._states[dirpath].children.append(sub)
+            if not self._enqueue(sub, root, depth + 1, dirpath):
+                with self._lock:
+                    self._states[dirpath].outstanding -= 1
+        self._finish(dirpath)
+
+    def _finish(self, dirpath: str):
+        """Count one unit of work off `dirpath`; completes ancestors whose subtree is done."""
+        while dirpath is not None:
+            with self._lock:
+                state = self._states[dirpath]
+                state.outstanding -= 1
+                if state.outstanding > 0:
+                    return
+                del self._states[dirpath]
+            self.checkpoint.mark_done(dirpath, state.children)
+            dirpath = state.parent
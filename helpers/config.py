@@ -28,4 +28,163 @@ class AppConfig:
     def log_level(self) -> int:
         level_name = self.parser.get("logging", "level", fallback="INFO").upper()
         levels = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
-        return levels.get(level_name, 20)
\ No newline at end of file
+        return levels.get(level_name, 20)
+
+    @property
+    def quiet_period(self) -> float:
+        """Seconds a file's size/mtime must stay unchanged before it is processed."""
+        return self.parser.getfloat("watcher", "quiet_period", fallback=5.0)
+
+    @property
+    def poll_interval(self) -> float:
+        return self.parser.getfloat("watcher", "poll_interval", fallback=1.0)
+
+    @property
+    def worker_mode(self) -> str:
+        """'thread', 'process' or 'pipeline' (per-stage threads, see [pipeline])."""
+        return self.parser.get("workers", "mode", fallback="thread").lower()
+
+    @property
+    def worker_count(self) -> int:
+        return self.parser.getint("workers", "count", fallback=4)
+
+    @property
+    def queue_size(self) -> int:
+        """Files (not batches) queued per live/manual class before new work is shed to backfill."""
+        return self.parser.getint("workers", "queue_size", fallback=256)
+
+    @property
+    def stats_interval(self) -> float:
+        """Seconds between worker pool stats lines in the log (0 disables)."""
+        return self.parser.getfloat("workers", "stats_interval", fallback=300.0)
+
+    @property
+    def backfill_checkpoint(self) -> Path:
+        fname = self.parser.get("backfill", "checkpoint", fallback="backfill.json")
+        return self.path.parent / fname
+
+    @property
+    def backfill_workers(self) -> int:
+        return self.parser.getint("backfill", "workers", fallback=8)
+
+    @property
+    def jobqueue_path(self) -> Path:
+        fname = self.parser.get("queue", "database", fallback="jobs.db")
+        return self.path.parent / fname
+
+    @property
+    def max_attempts(self) -> int:
+        """Jobs that failed this many times are kept in the queue but no longer retried."""
+        return self.parser.getint("queue", "max_attempts", fallback=5)
+
+    @property
+    def manifest_path(self) -> Path:
+        fname = self.parser.get("manifest", "database", fallback="manifest.db")
+        return self.path.parent / fname
+
+    @property
+    def network_cache(self) -> Path:
+        """Compiled network-tag automaton, shared by all worker processes."""
+        fname = self.parser.get("names", "network_cache", fallback="networks.cache")
+        return self.path.parent / fname
+
+    @property
+    def parse_memo_size(self) -> int:
+        """Parsed clean names remembered per nameregex memo (0 disables)."""
+        return self.parser.getint("names", "memo_size", fallback=4096)
+
+    @property
+    def episode_slots_path(self) -> Path:
+        """Per-season event slot table behind session episode numbers."""
+        fname = self.parser.get("names", "episode_slots", fallback="episodes.db")
+        return self.path.parent / fname
+
+    @property
+    def grammar_packs(self) -> str:
+        """Glob of the filename grammar pack files (see helpers/grammar.py)."""
+        pattern = self.parser.get("names", "grammar_packs", fallback="grammars/*.grammar")
+        return str(self.path.parent / pattern)
+
+    @property
+    def grammar_check_interval(self) -> float:
+        """Seconds between checks of the grammar pack files for changes."""
+        return self.parser.getfloat("names", "grammar_check_interval", fallback=5.0)
+
+    @property
+    def batch_window(self) -> float:
+        """Seconds to collect files settling in the same directory into one batch (0 disables)."""
+        return self.parser.getfloat("workers", "batch_window", fallback=2.0)
+
+    @property
+    def batch_max(self) -> int:
+        return self.parser.getint("workers", "batch_max", fallback=64)
+
+    @property
+    def reconcile_interval(self) -> float:
+        """Seconds between Library/VirtualFolders re-polls (0 disables live reconciliation)."""
+        return self.parser.getfloat("watcher", "reconcile_interval", fallback=300.0)
+
+    def _list(self, section: str, option: str, fallback: str = "") -> list:
+        raw = self.parser.get(section, option, fallback=fallback)
+        return [item.strip() for item in raw.replace("\n", ",").split(",") if item.strip()]
+
+    @property
+    def collection_types(self) -> list:
+        """Jellyfin CollectionTypes worth watching ('mixed' = folders without a type)."""
+        return self._list("libraries", "collection_types", fallback="tvshows, homevideos, mixed")
+
+    @property
+    def include_globs(self) -> list:
+        return self._list("libraries", "include")
+
+    @property
+    def exclude_globs(self) -> list:
+        return self._list("libraries", "exclude")
+
+    @property
+    def polling_mode(self) -> str:
+        """'auto' (poll network shares), 'always' or 'never'."""
+        return self.parser.get("watcher", "polling", fallback="auto").lower()
+
+    @property
+    def polling_globs(self) -> list:
+        """Library roots matching these globs are always polled."""
+        return self._list("watcher", "polling_paths")
+
+    @property
+    def poll_min_interval(self) -> float:
+        return self.parser.getfloat("watcher", "poll_min_interval", fallback=5.0)
+
+    @property
+    def poll_max_interval(self) -> float:
+        return self.parser.getfloat("watcher", "poll_max_interval", fallback=120.0)
+
+    @property
+    def scheduler_weights(self) -> dict:
+        return {
+            cls: self.parser.getint("scheduler", f"weight_{cls}", fallback=default)
+            for cls, default in (("live", 8), ("manual", 4), ("backfill", 1))
+        }
+
+    @property
+    def scheduler_max_wait(self) -> float:
+        """Wait (seconds) after which a class's weight starts doubling, tripling, ..."""
+        return self.parser.getfloat("scheduler", "max_wait", fallback=600.0)
+
+    @property
+    def pipeline_workers(self) -> dict:
+        """Threads per stage of the 'pipeline' worker mode."""
+        return {
+            stage: self.parser.getint("pipeline", f"{stage}_workers", fallback=default)
+            for stage, default in (("parse", 4), ("lookup", 2), ("write", 2), ("push", 1))
+        }
+
+    @property
+    def pipeline_queue_size(self) -> int:
+        return self.parser.getint("pipeline", "queue_size", fallback=64)
+
+    @property
+    def pipeline_inflight(self) -> int:
+        """Jobs in the pipeline at once (0 = twice the total stage threads)."""
+        return self.parser.getint("pipeline", "inflight", fallback=0) \
+            or 2 * sum(self.pipeline_workers.values())
@@ -0,0 +1,174 @@
+# helpers/dircache.py
+"""
+Per-directory listing snapshots for sidecar / artwork existence checks.
+One os.scandir per directory answers every isfile()/exists() question about
+its entries, instead of one stat per candidate file (season posters,
+thumbs, show.jpg, .nfo, tvshow.nfo, …) – which adds up quickly over NFS/SMB.
+Inside a scope() (one file or one batch) a directory is stat'ed once, and
+our own writes update the listing instead of forcing a new scandir.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import FrozenSet, Optional, Tuple
+
+
+class _Listing:
+    __slots__ = ('mtime_ns', 'trusted', 'files', 'dirs')
+
+    def __init__(self, mtime_ns: int, trusted: bool, files: FrozenSet[str], dirs: FrozenSet[str]):
+        self.mtime_ns = mtime_ns
+        self.trusted = trusted
+        self.files = files
+        self.dirs = dirs
+
+
+class DirectoryCache:
+    """
+    LRU of up to `max_dirs` directory listings. A listing is reused while
+    the directory's mtime is unchanged (one stat instead of one per lookup),
+    and within a scope() without even that stat. Listings taken within
+    `racy` seconds of the directory's last change are not trusted – a
+    coarse-mtime filesystem could hide a later change within the same tick –
+    and are refreshed on next use. Changes we make ourselves are reported
+    with wrote()/removed() and patched into the listing.
+    """
+
+    def __init__(self, max_dirs: int = 1024, racy: float = 2.0, clock=time.time):
+        self.max_dirs = max(1, max_dirs)
+        self.racy = racy
+        self.clock = clock
+        self._cache: "OrderedDict[str, _Listing]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        self.hits = 0
+        self.misses = 0
+
+    @contextmanager
+    def scope(self):
+        """
+        Within the block, a directory checked once is not stat'ed again by
+        this thread – wrap one file's (or one batch's) checks. Nested scopes
+        share the outermost one.
+        """
+        if getattr(self._local, 'checked', None) is not None:
+            yield
+            return
+        self._local.checked = set()
+        try:
+            yield
+        finally:
+            self._local.checked = None
+
+    def listing(self, dirpath: str) -> Optional[Tuple[FrozenSet[str], FrozenSet[str]]]:
+        """(file names, directory names) in `dirpath`, or None if it cannot be read."""
+        checked = getattr(self._local, 'checked', None)
+        if checked is not None and dirpath in checked:
+            with self._lock:
+                snap = self._cache.get(dirpath)
+                if snap is not None:
+                    self._cache.move_to_end(dirpath)
+                    self.hits += 1
+                    return snap.files, snap.dirs
+
+        try:
+            mtime_ns = os.stat(dirpath).st_mtime_ns
+        except OSError:
+            self.invalidate(dirpath)
+            return None
+
+        with self._lock:
+            snap = self._cache.get(dirpath)
+            if snap is not None and snap.mtime_ns == mtime_ns and snap.trusted:
+                self._cache.move_to_end(dirpath)
+                self.hits += 1
+                if checked is not None:
+                    checked.add(dirpath)
+                return snap.files, snap.dirs
+            self.misses += 1
+
+        taken_at = self.clock()
+        files, dirs = [], []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file():
+                            files.append(entry.name)
+                        elif entry.is_dir():
+                            dirs.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            self.invalidate(dirpath)
+            return None
+
+        snap = _Listing(mtime_ns, taken_at - mtime_ns / 1e9 > self.racy, frozenset(files), frozenset(dirs))
+        with self._lock:
+            self._cache[dirpath] = snap
+            self._cache.move_to_end(dirpath)
+            while len(self._cache) > self.max_dirs:
+                self._cache.popitem(last=False)
+        if checked is not None:
+            checked.add(dirpath)
+        return snap.files, snap.dirs
+
+    def wrote(self, path):
+        """
+        We created or replaced file `path` – add it to its directory's listing
+        (only if this scope checked that directory, else the listing is dropped).
+        """
+        self._patch(path, True)
+
+    def removed(self, path):
+        """We removed or moved away file `path` – drop it from its directory's listing."""
+        self._patch(path, False)
+
+    def _patch(self, path, present: bool):
+        dirpath, name = os.path.split(os.fspath(path))
+        dirpath = dirpath or '.'
+        checked = getattr(self._local, 'checked', None)
+        if checked is None or dirpath not in checked:
+            # Not confirmed current in this scope – patching could hide someone else's change
+            self.invalidate(dirpath)
+            return
+        try:
+            mtime_ns = os.stat(dirpath).st_mtime_ns
+        except OSError:
+            self.invalidate(dirpath)
+            return
+        with self._lock:
+            snap = self._cache.get(dirpath)
+            if snap is None:
+                return
+            # The new mtime is our own change; a listing that was trusted stays trusted
+            files = snap.files | {name} if present else snap.files - {name}
+            self._cache[dirpath] = _Listing(mtime_ns, snap.trusted, files, snap.dirs)
+
+    def isfile(self, path) -> bool:
+        dirpath, name = os.path.split(os.fspath(path))
+        listing = self.listing(dirpath or '.')
+        return listing is not None and name in listing[0]
+
+    def exists(self, path) -> bool:
+        dirpath, name = os.path.split(os.fspath(path))
+        listing = self.listing(dirpath or '.')
+        return listing is not None and (name in listing[0] or name in listing[1])
+
+    def invalidate(self, dirpath: str):
+        with self._lock:
+            self._cache.pop(dirpath, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'dirs': len(self._cache), 'hits': self.hits, 'misses': self.misses}
+
+
+# Shared by process_file and kobimeta
+cache = DirectoryCache()
+isfile = cache.isfile
+exists = cache.exists
@@ -0,0 +1,117 @@
+# helpers/episodes.py
+"""
+Per-season episode slot table, shared by the app and its worker processes.
+Session episode numbers embed a 0–999 slot derived from the event name.
+Two events of one season can hash to the same slot; the table records the
+slot each event got, moves a newcomer to the next free slot on collision,
+and hands out the same slot again on every later run and in every worker
+process.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Dict, Tuple
+
+from . import plexlog as log
+from .libraries import sql_text, text_from_sql
+
+pluginid = "EPISODES"
+
+SLOTS = 1000
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS slots (
+        show         TEXT NOT NULL,
+        season       INTEGER NOT NULL,
+        event        TEXT NOT NULL,
+        slot         INTEGER NOT NULL,
+        assigned_at  REAL NOT NULL,
+        PRIMARY KEY (show, season, event),
+        UNIQUE (show, season, slot)
+    )
+    """,
+)
+
+
+class EpisodeSlots:
+
+    def __init__(self, path: str):
+        self.path = path
+        # Autocommit mode – allocate() runs its own BEGIN IMMEDIATE transactions
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30.0, isolation_level=None)
+        self._db.text_factory = text_from_sql
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        for sql in _SCHEMA:
+            self._db.execute(sql)
+        self._lock = threading.Lock()
+        self._known: Dict[Tuple[str, int, str], int] = {}
+
+        self.allocated = 0
+        self.collisions = 0
+
+    def allocate(self, show: str, season: int, event: str, preferred: int) -> int:
+        """
+        Slot of `event` in (show, season): the one recorded earlier, else
+        `preferred` if still free, else the next free slot after it.
+        """
+        key = (show, season, event)
+        slot = self._known.get(key)
+        if slot is not None:
+            return slot
+
+        # Show and event come from file names, which need not be valid UTF-8
+        params = (sql_text(show), season, sql_text(event))
+        with self._lock:
+            try:
+                # IMMEDIATE takes the write lock up front: one allocator at a time across processes
+                self._db.execute("BEGIN IMMEDIATE")
+                try:
+                    row = self._db.execute(
+                        "SELECT slot FROM slots "
+                        "WHERE show = CAST(? AS TEXT) AND season = ? AND event = CAST(? AS TEXT)", params
+                    ).fetchone()
+                    if row:
+                        slot = row[0]
+                    else:
+                        taken = {r[0] for r in self._db.execute(
+                            "SELECT slot FROM slots WHERE show = CAST(? AS TEXT) AND season = ?", params[:2]
+                        )}
+                        slot = next(((preferred + k) % SLOTS for k in range(SLOTS)
+                                     if (preferred + k) % SLOTS not in taken), None)
+                        if slot is None:
+                            log.Log(f"All {SLOTS} episode slots of {show!r} season {season} are taken, "
+                                    f"{event!r} shares slot {preferred}", pluginid, log.LL_WARN)
+                            self._db.execute("ROLLBACK")
+                            return preferred
+                        self._db.execute(
+                            "INSERT INTO slots (show, season, event, slot, assigned_at) "
+                            "VALUES (CAST(? AS TEXT), ?, CAST(? AS TEXT), ?, ?)",
+                            (*params, slot, time.time())
+                        )
+                        self.allocated += 1
+                        if slot != preferred:
+                            self.collisions += 1
+                            log.Log(f"Episode slot {preferred} of {show!r} season {season} is taken, "
+                                    f"{event!r} gets slot {slot}", pluginid, log.LL_INFO)
+                    self._db.execute("COMMIT")
+                except BaseException:
+                    if self._db.in_transaction:
+                        self._db.execute("ROLLBACK")
+                    raise
+            except Exception as e:
+                log.Log(f"Episode slot table unavailable ({e}), using slot {preferred} for {event!r}",
+                        pluginid, log.LL_ERROR)
+                return preferred
+            self._known[key] = slot
+        return slot
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'known': len(self._known), 'allocated': self.allocated, 'collisions': self.collisions}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
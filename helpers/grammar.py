@@ -0,0 +1,192 @@
+# helpers/grammar.py
+"""
+Filename grammar packs – extra episode / session patterns kept in files
+next to config.cfg, so a new release-group naming scheme needs no code
+change. A pack is an INI file, one section per pattern family:
+
+    [episode:fight_card]
+    patterns = ^(?P<show>ufc|bellator|pfl)[ ]+(?P<season>[0-9]{1,4})[ ]+(?P<event>.*)$
+    examples = UFC 300 Main Card
+
+    [session:warmup]
+    patterns = [ ](?P<sesname>warm[ ]?up)
+    keywords = warm
+    type     = session
+    episodenr = 90
+    examples = Le Mans Warm Up
+
+Multi-line values hold one pattern (key, keyword, example) per line. The
+groups are those of nameregex's own patterns (EPISODE_GROUPS /
+SESSION_GROUPS); `type` is 'event' or 'session'. A family named like a
+built-in one is tried right after it, a new one after all built-in
+families, and pack session families only when no built-in one matches –
+an example some other family claims first is logged as a warning. Packs
+are validated and compiled when loaded and installed into nameregex as a
+whole; a changed file is picked up by the next maybe_reload(). A pack that
+fails to load keeps its last good version.
+"""
+
+import configparser
+import glob
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from . import nameregex
+from . import plexlog as log
+
+pluginid = "GRAMMAR"
+
+_OPTIONS = {
+    'episode': {'patterns', 'keys', 'examples'},
+    'session': {'patterns', 'keywords', 'type', 'episodenr', 'examples'},
+}
+_LISTS = {'patterns', 'keys', 'keywords', 'examples'}
+
+
+def read_pack(path: str) -> dict:
+    """The spec nameregex.compile_pack() takes, from one pack file. Raises ValueError."""
+    parser = configparser.ConfigParser(interpolation=None)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            parser.read_file(f)
+    except configparser.Error as e:
+        raise ValueError(f"{path}: {e}") from None
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = {'name': name, 'episode': [], 'session': []}
+    for section in parser.sections():
+        kind, _, family = section.partition(':')
+        family = family.strip()
+        if kind not in _OPTIONS or not family:
+            raise ValueError(f"{name}: section [{section}] is not [episode:<family>] or [session:<family>]")
+        unknown = set(parser[section]) - _OPTIONS[kind]
+        if unknown:
+            raise ValueError(f"{name} [{section}]: unknown option(s) {', '.join(sorted(unknown))}")
+        fam = {'family': family}
+        for option, value in parser[section].items():
+            if option in _LISTS:
+                fam[option] = [line.strip() for line in value.splitlines() if line.strip()]
+            else:
+                fam[option] = value.strip()
+        if fam.get('episodenr') and not fam['episodenr'].isdigit():
+            raise ValueError(f"{name} [{section}]: episodenr {fam['episodenr']!r} is not a number")
+        spec[kind].append(fam)
+    return spec
+
+
+class GrammarPacks:
+    """
+    The packs matching `pattern` (a glob). maybe_reload() looks at the files
+    at most every `check_interval` seconds and rebuilds the grammar only when
+    one was added, removed or changed.
+    """
+
+    def __init__(self, pattern: str, check_interval: float = 5.0):
+        self.pattern = pattern
+        self.check_interval = check_interval
+        self._packs: Dict[str, Tuple[tuple, dict]] = {}     # path → (signature, compiled pack)
+        self._signature: Optional[tuple] = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+        self.reloads = 0
+        self.failures = 0
+
+    def _scan(self) -> List[tuple]:
+        files = []
+        for path in sorted(glob.glob(self.pattern)):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue            # removed between glob and stat
+            files.append((path, st.st_mtime_ns, st.st_size))
+        return files
+
+    def load(self) -> bool:
+        """Compile the current pack files and install them; False if nothing changed."""
+        with self._lock:
+            return self._load()
+
+    def maybe_reload(self) -> bool:
+        """load(), throttled; called per file, so it never waits for another thread's reload."""
+        now = time.monotonic()
+        if now - self._checked < self.check_interval or not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self._checked = now
+            return self._load()
+        finally:
+            self._lock.release()
+
+    def _load(self) -> bool:
+        files = self._scan()
+        signature = tuple(files)
+        if signature == self._signature:
+            return False
+        started = time.perf_counter()
+        packs = {}
+        for path, mtime_ns, size in files:
+            old = self._packs.get(path)
+            if old and old[0] == (mtime_ns, size):
+                packs[path] = old
+                continue
+            try:
+                packs[path] = ((mtime_ns, size), nameregex.compile_pack(read_pack(path)))
+            except (OSError, ValueError) as e:
+                self.failures += 1
+                if old:
+                    log.Log(f"Grammar pack {path} not reloaded, keeping its previous version: {e}",
+                            pluginid, log.LL_ERROR)
+                    packs[path] = ((mtime_ns, size), old[1])     # reported once, not on every reload
+                else:
+                    log.Log(f"Grammar pack {path} not loaded: {e}", pluginid, log.LL_ERROR)
+        compiled = [pack for _, pack in packs.values()]
+        grammar = nameregex.build_grammar(compiled)
+        elapsed = time.perf_counter() - started
+        for pack, kind, family, example, winner in nameregex.shadowed_examples(grammar, compiled):
+            log.Log(f"Grammar pack {pack} [{kind}:{family}]: example {example!r} is matched by {winner} "
+                    f"first – the pack's patterns never see it", pluginid, log.LL_WARN)
+
+        previous = nameregex.install_grammar(grammar)
+        self._packs, self._signature = packs, signature
+        self.reloads += 1
+        if previous.packs:
+            log_match_rates(previous.stats(), "replaced")
+        families = sum(len(pack['episode']) + len(pack['session']) for _, pack in packs.values())
+        log.Log(f"Grammar: {len(packs)} pack(s), {families} pattern famil{'y' if families == 1 else 'ies'} "
+                f"compiled in {elapsed * 1e3:.1f} ms (generation {grammar.generation})", pluginid, log.LL_INFO)
+        return True
+
+
+def log_match_rates(stats: dict, label: str = "installed"):
+    """Per-pack episode and session matches of a nameregex.grammar_stats() result, as shares of the parses."""
+    parsed = stats['parsed']
+    for pack, matched in stats['packs'].items():
+        rates = ', '.join(
+            f"{kind} {matched[kind]}/{parsed[kind]} ({matched[kind] / parsed[kind] if parsed[kind] else 0.0:.1%})"
+            for kind in ('episode', 'session')
+        )
+        log.Log(f"Grammar generation {stats['generation']} ({label}): pack {pack} matched {rates}",
+                pluginid, log.LL_INFO)
+
+
+# ───────────────────────────────────────────────
+#   Shared packs of this process
+# ───────────────────────────────────────────────
+
+_packs: Optional[GrammarPacks] = None
+
+
+def configure(pattern, check_interval: float = 5.0) -> GrammarPacks:
+    """Load the packs matching `pattern` now and make them the ones maybe_reload() watches."""
+    global _packs
+    _packs = GrammarPacks(os.fspath(pattern), check_interval)
+    _packs.load()
+    return _packs
+
+
+def maybe_reload() -> bool:
+    """Pick up changed pack files (a no-op until configure() ran)."""
+    packs = _packs
+    return packs.maybe_reload() if packs is not None else False
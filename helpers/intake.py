@@ -0,0 +1,310 @@
+# helpers/intake.py
+"""
+Filesystem event intake – coalesces bursts of watcher events per path,
+only releases a file once it has stopped changing on disk, and groups
+files settling in the same directory into batches.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from . import plexlog as log
+from .jobqueue import JobStore
+from .libraries import is_under
+
+pluginid = "INTAKE"
+
+
+class _Pending:
+    __slots__ = ('depth', 'action', 'events', 'first_seen', 'last_event', 'size', 'mtime_ns', 'stable_since')
+
+    def __init__(self, depth: int, action: str, now: float):
+        self.depth = depth
+        self.action = action
+        self.events = 1
+        self.first_seen = now
+        self.last_event = now
+        self.size = -1
+        self.mtime_ns = -1
+        self.stable_since = now
+
+
+class EventCoalescer:
+    """
+    Keeps one pending entry per path. Created / modified / moved events for the
+    same path collapse into that entry; the path is released to `release`
+    only after its size and mtime stayed unchanged for `quiet_period` seconds.
+    With a `store`, a path is persisted as a job from its first event on, so
+    files still settling survive a restart; discard() and a file vanishing
+    mark it done, subtree moves and deletes are the caller's (see
+    JobStore.rekey_tree / evict_tree), and whoever `release` hands the file
+    to finishes it.
+    """
+
+    def __init__(
+        self,
+        release: Callable[[str, int, str], None],
+        quiet_period: float = 5.0,
+        poll_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        store: Optional[JobStore] = None
+    ):
+        self.release = release
+        self.quiet_period = quiet_period
+        self.poll_interval = poll_interval
+        self.clock = clock
+        self.store = store
+
+        self._pending: Dict[str, _Pending] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.events_received = 0
+        self.jobs_emitted = 0
+
+    # ───────────────────────────────────────────────
+    #   Event intake
+    # ───────────────────────────────────────────────
+
+    def push(self, path: str, depth: int, action: str):
+        """Register a filesystem event for `path`; resets its quiet timer."""
+        now = self.clock()
+        with self._lock:
+            self.events_received += 1
+            entry = self._pending.get(path)
+            if entry is None:
+                self._pending[path] = _Pending(depth, action, now)
+                if self.store is not None:
+                    self.store.add(path, depth, action)
+                return
+            entry.events += 1
+            entry.depth = depth
+            entry.last_event = now
+            entry.stable_since = now
+
+    def discard(self, path: str) -> bool:
+        """Drop a pending path (e.g. the source side of a move)."""
+        with self._lock:
+            dropped = self._pending.pop(path, None) is not None
+        if dropped and self.store is not None:
+            self.store.done(path)
+        return dropped
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def holds(self, path: str) -> bool:
+        with self._lock:
+            return path in self._pending
+
+    def rekey_tree(self, old_dir: str, new_dir: str, depth_of: Optional[Callable[[str], int]] = None) -> int:
+        """
+        Pending paths below a moved directory keep their timers under the new
+        path; `depth_of(new_path)` gives their depth there (else it is kept).
+        """
+        with self._lock:
+            moved = [p for p in self._pending if is_under(p, old_dir)]
+            for p in moved:
+                new_path = new_dir + p[len(old_dir):]
+                entry = self._pending[new_path] = self._pending.pop(p)
+                if depth_of:
+                    entry.depth = depth_of(new_path)
+        return len(moved)
+
+    def discard_tree(self, dirpath: str) -> int:
+        with self._lock:
+            gone = [p for p in self._pending if is_under(p, dirpath)]
+            for p in gone:
+                del self._pending[p]
+        return len(gone)
+
+    # ───────────────────────────────────────────────
+    #   Stability check / release
+    # ───────────────────────────────────────────────
+
+    def poll(self) -> List[Tuple[str, int, str]]:
+        """
+        Stat every pending path once and release the ones that have been
+        quiet long enough. Returns the released (path, depth, action) tuples.
+        """
+        now = self.clock()
+        released = []
+
+        with self._lock:
+            items = list(self._pending.items())
+
+        for path, entry in items:
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                with self._lock:
+                    vanished = self._pending.get(path) is entry
+                    if vanished:
+                        del self._pending[path]
+                if vanished and self.store is not None:
+                    self.store.done(path)
+                log.Log(f"Pending file vanished before it settled: {path}", pluginid, log.LL_DEBUG)
+                continue
+            except OSError as e:
+                log.Log(f"Could not stat pending file {path}: {e}", pluginid, log.LL_WARN)
+                continue
+
+            with self._lock:
+                if self._pending.get(path) is not entry:
+                    continue
+                if (st.st_size, st.st_mtime_ns) != (entry.size, entry.mtime_ns):
+                    entry.size = st.st_size
+                    entry.mtime_ns = st.st_mtime_ns
+                    entry.stable_since = now
+                    continue
+                if now - entry.stable_since < self.quiet_period:
+                    continue
+                del self._pending[path]
+                self.jobs_emitted += 1
+
+            log.Log(f"Released {path} after {entry.events} event(s), "
+                    f"{now - entry.first_seen:.1f}s pending", pluginid, log.LL_DEBUG)
+            released.append((path, entry.depth, entry.action))
+
+        for path, depth, action in released:
+            try:
+                self.release(path, depth, action)
+            except Exception as e:
+                log.LogExcept(f"Release callback failed for {path}", e, pluginid)
+
+        return released
+
+    # ───────────────────────────────────────────────
+    #   Background loop
+    # ───────────────────────────────────────────────
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="intake-coalescer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.poll_interval):
+            self.poll()
+
+
+class DirectoryBatcher:
+    """
+    Groups files that arrive in the same directory within `window` seconds
+    and hands them to `release(items)` as one batch of (path, depth, action)
+    tuples, so a season pack resolves its league and season only once.
+    A batch is released early when it reaches `max_size` files.
+    """
+
+    def __init__(
+        self,
+        release: Callable[[List[Tuple[str, int, str]]], None],
+        window: float = 2.0,
+        max_size: int = 64,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.release = release
+        self.window = window
+        self.max_size = max(1, max_size)
+        self.clock = clock
+
+        self._groups: Dict[str, Tuple[float, List[Tuple[str, int, str]]]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.files = 0
+        self.batches = 0
+
+    def push(self, path: str, depth: int, action: str):
+        dirname = os.path.dirname(path)
+        full = None
+        with self._lock:
+            self.files += 1
+            started, items = self._groups.setdefault(dirname, (self.clock(), []))
+            items.append((path, depth, action))
+            if len(items) >= self.max_size:
+                full = self._groups.pop(dirname)[1]
+                self.batches += 1
+        if full:
+            self._emit(dirname, full)
+
+    def rekey_tree(self, old_dir: str, new_dir: str, depth_of: Optional[Callable[[str], int]] = None) -> int:
+        """Move the groups below `old_dir` to `new_dir`; `depth_of(new_path)` as for EventCoalescer."""
+        with self._lock:
+            moved = [d for d in self._groups if d == old_dir or is_under(d, old_dir)]
+            for d in moved:
+                started, items = self._groups.pop(d)
+                rekeyed = []
+                for p, depth, action in items:
+                    new_path = new_dir + p[len(old_dir):]
+                    rekeyed.append((new_path, depth_of(new_path) if depth_of else depth, action))
+                self._groups[new_dir + d[len(old_dir):]] = (started, rekeyed)
+        return len(moved)
+
+    def discard_tree(self, dirpath: str) -> int:
+        with self._lock:
+            gone = [d for d in self._groups if d == dirpath or is_under(d, dirpath)]
+            for d in gone:
+                del self._groups[d]
+        return len(gone)
+
+    def discard(self, path: str):
+        dirname = os.path.dirname(path)
+        with self._lock:
+            group = self._groups.get(dirname)
+            if group:
+                group[1][:] = [item for item in group[1] if item[0] != path]
+
+    def holds(self, path: str) -> bool:
+        with self._lock:
+            group = self._groups.get(os.path.dirname(path))
+            return bool(group) and any(item[0] == path for item in group[1])
+
+    def flush(self, force: bool = False) -> int:
+        """Release every group whose window has passed (or all of them). Returns batches released."""
+        now = self.clock()
+        with self._lock:
+            due = [d for d, (started, _) in self._groups.items() if force or now - started >= self.window]
+            batches = [(d, self._groups.pop(d)[1]) for d in due]
+            self.batches += len(batches)
+        for dirname, items in batches:
+            self._emit(dirname, items)
+        return len(batches)
+
+    def _emit(self, dirname: str, items: List[Tuple[str, int, str]]):
+        log.Log(f"Batch of {len(items)} file(s) from {dirname}", pluginid, log.LL_DEBUG)
+        try:
+            self.release(items)
+        except Exception as e:
+            log.LogExcept(f"Batch release failed for {dirname}", e, pluginid)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="intake-batcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.flush(force=True)
+
+    def _run(self):
+        while not self._stop.wait(min(self.window, 0.5) or 0.5):
+            self.flush()
@@ -69,4 +69,14 @@ class JellyfinClient:
             log(f"Image upload failed: {e}", "JELLY", LL_ERROR)
             return False
 
+    def report_moved(self, old_path: str, new_path: str):
+        """Tell Jellyfin a media file moved, so it re-keys the item instead of waiting for a scan."""
+        payload = {
+            "Updates": [
+                {"Path": old_path, "UpdateType": "Deleted"},
+                {"Path": new_path, "UpdateType": "Created"},
+            ]
+        }
+        return self._request("POST", "Library/Media/Updated", json_data=payload)
+
     # Add more methods as needed (get_series, get_seasons, get_episodes, etc.)
\ No newline at end of file
@@ -0,0 +1,209 @@
+# helpers/jobqueue.py
+"""
+Durable on-disk job queue (stdlib sqlite3, WAL mode).
+Every file handed to the worker pool is recorded here and only removed once
+process_file finished, so detected-but-unprocessed files survive a restart.
+Writes are buffered and committed in batches to sustain thousands of
+enqueues per second.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from . import plexlog as log
+from .libraries import sql_text, subtree_bounds, text_from_sql
+
+pluginid = "JOB QUEUE"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    path        TEXT PRIMARY KEY,
+    depth       INTEGER NOT NULL,
+    event       TEXT NOT NULL,
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    last_error  TEXT,
+    queued_at   REAL NOT NULL,
+    updated_at  REAL NOT NULL
+)
+"""
+
+_ADD = """
+INSERT INTO jobs (path, depth, event, queued_at, updated_at) VALUES (CAST(? AS TEXT), ?, ?, ?, ?)
+ON CONFLICT(path) DO UPDATE SET depth = excluded.depth, event = excluded.event, updated_at = excluded.updated_at
+"""
+_DONE = "DELETE FROM jobs WHERE path = CAST(? AS TEXT)"
+_FAIL = ("UPDATE jobs SET attempts = attempts + 1, last_error = CAST(? AS TEXT), updated_at = ? "
+         "WHERE path = CAST(? AS TEXT)")
+# Paths (and error messages quoting them) are bound through sql_text(), so file
+# names that are not valid UTF-8 can be queued; the byte offset of a re-keyed
+# subtree is taken on the stored bytes for the same reason
+_REKEY = ("UPDATE jobs SET path = CAST(? AS TEXT) || CAST(substr(CAST(path AS BLOB), ?) AS TEXT) "
+          "WHERE path >= CAST(? AS TEXT) AND path < CAST(? AS TEXT)")
+_IN_TREE = "path >= CAST(? AS TEXT) AND path < CAST(? AS TEXT)"
+
+
+class JobStore:
+    """
+    add() / done() / failed() only append to an in-memory buffer; the buffer is
+    committed in one transaction when it reaches `batch_size` entries or every
+    `flush_interval` seconds, whichever comes first.
+    """
+
+    def __init__(self, path: str, batch_size: int = 500, flush_interval: float = 0.5):
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.text_factory = text_from_sql
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(_SCHEMA)
+
+        self._buffer: List[Tuple[str, tuple]] = []
+        self._buf_lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ───────────────────────────────────────────────
+    #   Buffered writes
+    # ───────────────────────────────────────────────
+
+    def add(self, path: str, depth: int, event: str):
+        now = time.time()
+        self._append(_ADD, (sql_text(path), depth, event, now, now))
+
+    def done(self, path: str):
+        self._append(_DONE, (sql_text(path),))
+
+    def failed(self, path: str, error: str):
+        self._append(_FAIL, (sql_text(str(error)[:1000]), time.time(), sql_text(path)))
+
+    def _append(self, sql: str, params: tuple):
+        with self._buf_lock:
+            self._buffer.append((sql, params))
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self):
+        with self._buf_lock:
+            batch, self._buffer = self._buffer, []
+        if not batch:
+            return
+        with self._db_lock:
+            try:
+                self._db.execute("BEGIN")
+                for sql, params in batch:
+                    self._db.execute(sql, params)
+                self._db.execute("COMMIT")
+            except Exception as e:
+                # Never leave the transaction open: the next BEGIN would fail and
+                # its ROLLBACK would take this batch's changes with it
+                if self._db.in_transaction:
+                    self._db.execute("ROLLBACK")
+                log.Log(f"Could not commit {len(batch)} queue change(s) at once, retrying one by one: {e}",
+                        pluginid, log.LL_WARN)
+                self._apply_each(batch)
+
+    def _apply_each(self, batch: List[Tuple[str, tuple]]):
+        """Commit every change of a failed batch on its own, so one bad change does not cost the rest."""
+        dropped, error = 0, None
+        for sql, params in batch:
+            try:
+                self._db.execute(sql, params)
+            except Exception as e:
+                dropped, error = dropped + 1, e
+        if dropped:
+            log.Log(f"Dropped {dropped} queue change(s) that could not be committed: {error}",
+                    pluginid, log.LL_ERROR)
+
+    # ───────────────────────────────────────────────
+    #   Subtree operations (directory moves / deletes)
+    # ───────────────────────────────────────────────
+
+    def rekey_tree(self, old_dir: str, new_dir: str) -> List[Tuple[str, int, str]]:
+        """Re-key queued jobs below `old_dir` to `new_dir`. Returns the re-keyed (path, depth, event)."""
+        self.flush()
+        lo, hi = map(sql_text, subtree_bounds(old_dir))
+        new_lo, new_hi = map(sql_text, subtree_bounds(new_dir))
+        with self._db_lock:
+            try:
+                self._db.execute("BEGIN")
+                self._db.execute(f"DELETE FROM jobs WHERE {_IN_TREE}", (new_lo, new_hi))
+                self._db.execute(_REKEY, (new_lo, len(lo) + 1, lo, hi))
+                self._db.execute("COMMIT")
+            except Exception as e:
+                if self._db.in_transaction:
+                    self._db.execute("ROLLBACK")
+                log.Log(f"Could not re-key queued jobs {old_dir} → {new_dir}: {e}", pluginid, log.LL_ERROR)
+                return []
+            return self._db.execute(
+                f"SELECT path, depth, event FROM jobs WHERE {_IN_TREE}", (new_lo, new_hi)
+            ).fetchall()
+
+    def evict_tree(self, dirpath: str) -> int:
+        self.flush()
+        lo, hi = map(sql_text, subtree_bounds(dirpath))
+        with self._db_lock:
+            try:
+                self._db.execute("BEGIN")
+                count = self._db.execute(f"DELETE FROM jobs WHERE {_IN_TREE}", (lo, hi)).rowcount
+                self._db.execute("COMMIT")
+            except Exception as e:
+                if self._db.in_transaction:
+                    self._db.execute("ROLLBACK")
+                log.Log(f"Could not evict queued jobs below {dirpath}: {e}", pluginid, log.LL_ERROR)
+                return 0
+            return count
+
+    # ───────────────────────────────────────────────
+    #   Reads
+    # ───────────────────────────────────────────────
+
+    def pending(self, max_attempts: int = 0) -> List[Tuple[str, int, str, int, Optional[str]]]:
+        """
+        Jobs left over from a previous run, oldest first, as
+        (path, depth, event, attempts, last_error). `max_attempts` > 0 skips
+        jobs that already failed that many times.
+        """
+        self.flush()
+        sql = "SELECT path, depth, event, attempts, last_error FROM jobs"
+        params: tuple = ()
+        if max_attempts > 0:
+            sql += " WHERE attempts < ?"
+            params = (max_attempts,)
+        with self._db_lock:
+            return self._db.execute(sql + " ORDER BY queued_at", params).fetchall()
+
+    def __len__(self) -> int:
+        self.flush()
+        with self._db_lock:
+            return self._db.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    # ───────────────────────────────────────────────
+    #   Background flusher
+    # ───────────────────────────────────────────────
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="jobqueue-flush", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        with self._db_lock:
+            self._db.close()
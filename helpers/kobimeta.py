@@ -5,15 +5,23 @@ Used as fallback / override source for showname, season, episode, title
 """
 
 import os
+import shutil
+import hashlib
+import threading
 from pathlib import Path
 import unicodedata
 from xml.etree import ElementTree as ET
 from xml.dom import minidom
 
 from . import plexlog as log
+from . import dircache
 
 pluginid = "KOBI META"
 
+# .nfo writes done / avoided because the file already had identical content
+_nfo_stats = {'written': 0, 'unchanged': 0, 'failed': 0}
+_nfo_stats_lock = threading.Lock()
+
 # ───────────────────────────────────────────────
 #   Helper functions for XML pretty-printing
 # ───────────────────────────────────────────────
@@ -66,7 +74,7 @@ def get_metadata(filepath: str) -> dict:
 
     episode_info = {}
 
-    if not nfo_path.is_file():
+    if not dircache.isfile(nfo_path):
         log.Log(f"No episode .nfo found at {nfo_path}", pluginid, log.LL_DEBUG)
     else:
         try:
@@ -98,7 +106,7 @@ def get_metadata(filepath: str) -> dict:
             path.parent.parent / 'tvshow.nfo'
         ]
         for tv_nfo in candidates:
-            if tv_nfo.is_file():
+            if dircache.isfile(tv_nfo):
                 try:
                     tree = ET.parse(str(tv_nfo))
                     root = tree.getroot()
@@ -127,17 +135,19 @@ def makenfo(
     showname: str,
     episodename: str,
     episodenr: int,
-    season: int
+    season: int,
+    studio: str = ''         # broadcaster tag stripped from the filename
 ):
     """
     Create / update Kodi-style episode .nfo file.
     Uses the new metadata (from TheSportsDB or fallback).
+    The file is only written when its content differs, so an unchanged
+    .nfo keeps its mtime and Jellyfin does not rescan the item.
+    Returns a digest of the document ('' if writing failed).
     """
     path = Path(filepath)
     nfo_path = path.with_suffix('.nfo')
 
-    log.Log(f"Creating/updating .nfo: {nfo_path}", pluginid)
-
     root = ET.Element('episodedetails')
 
     # Core fields
@@ -158,6 +168,9 @@ def makenfo(
     if 'dateEvent' in metadata.get('event', {}):
         ET.SubElement(root, 'aired').text = metadata['event']['dateEvent']
 
+    if studio:
+        ET.SubElement(root, 'studio').text = studio
+
     # Artwork paths (local only – Kodi likes relative or absolute paths)
     if artwork.get('season', {}).get('poster'):
         ET.SubElement(root, 'thumb').text = artwork['season']['poster']
@@ -176,11 +189,81 @@ def makenfo(
     # Write pretty XML
     try:
         xml_str = _pretty_print(root)
+        if _same_content(nfo_path, xml_str):
+            log.Log(f"Unchanged .nfo, not rewritten: {nfo_path}", pluginid, log.LL_DEBUG)
+            _count('unchanged')
+            return nfo_digest(xml_str)
+        log.Log(f"Creating/updating .nfo: {nfo_path}", pluginid)
         with open(nfo_path, 'wb') as f:
             f.write(xml_str)
+        dircache.cache.wrote(nfo_path)
         log.Log(f"Successfully wrote .nfo: {nfo_path}", pluginid)
+        _count('written')
+        return nfo_digest(xml_str)
     except Exception as e:
         log.Log(f"Failed to write .nfo {nfo_path}: {e}", pluginid, log.LL_ERROR)
+        _count('failed')
+        return ''
+
+
+def _same_content(nfo_path: Path, data: bytes) -> bool:
+    """True if `nfo_path` already holds exactly `data` (size checked first, so most changes cost one stat)."""
+    try:
+        if os.path.getsize(nfo_path) != len(data):
+            return False
+        with open(nfo_path, 'rb') as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def _count(key: str):
+    with _nfo_stats_lock:
+        _nfo_stats[key] += 1
+
+
+def nfo_write_stats() -> dict:
+    """{'written', 'unchanged', 'failed'} .nfo counts of this process."""
+    with _nfo_stats_lock:
+        return dict(_nfo_stats)
+
+
+def nfo_digest(data: bytes) -> str:
+    """Content digest used to identify a generated .nfo."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+# Sidecars written next to an episode (<name>.nfo, <name>.jpg thumb, <name>.tsdbevt event id)
+SIDECAR_SUFFIXES = ('.nfo', '.jpg', '.tsdbevt')
+
+
+def move_sidecars(src: str, dest: str) -> list:
+    """
+    Move the sidecars of video `src` so they sit next to video `dest`.
+    Uses os.replace (atomic on one filesystem) and falls back to a copy+delete
+    across filesystems. Returns the list of moved destination paths.
+    """
+    src_base = os.path.splitext(src)[0]
+    dest_base = os.path.splitext(dest)[0]
+    moved = []
+    for suffix in SIDECAR_SUFFIXES:
+        old = src_base + suffix
+        if not os.path.isfile(old):
+            continue
+        new = dest_base + suffix
+        try:
+            try:
+                os.replace(old, new)
+            except OSError:
+                shutil.move(old, new)
+            dircache.cache.removed(old)
+            dircache.cache.wrote(new)
+            moved.append(new)
+        except OSError as e:
+            log.Log(f"Could not move sidecar {old} → {new}: {e}", pluginid, log.LL_ERROR)
+    if moved:
+        log.Log(f"Moved {len(moved)} sidecar(s) with {os.path.basename(dest)}", pluginid)
+    return moved
 
 
 # Legacy / compatibility alias (if any old code still calls this name)
@@ -0,0 +1,191 @@
+# helpers/libraries.py
+"""
+Library root bookkeeping – keeps the set of watched roots in sync with
+Jellyfin's Library/VirtualFolders without restarting the watcher.
+"""
+
+import os
+import threading
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from . import plexlog as log
+
+pluginid = "LIBRARIES"
+
+
+def collapse_roots(paths: Iterable[Path]) -> List[Path]:
+    """
+    Resolve, de-duplicate and drop every root that lies inside another root,
+    so a file below nested library locations is only ever watched once.
+    """
+    resolved = sorted({Path(p).resolve() for p in paths}, key=lambda p: (len(p.parts), str(p)))
+    kept: List[Path] = []
+    for p in resolved:
+        if not any(p == k or k in p.parents for k in kept):
+            kept.append(p)
+    return sorted(kept)
+
+
+def subtree_bounds(dirpath: str) -> Tuple[str, str]:
+    """
+    (lo, hi) such that every path strictly below `dirpath` satisfies
+    lo <= path < hi. Lets a sorted index (SQLite primary key) answer
+    prefix queries in time proportional to the subtree.
+    """
+    base = dirpath.rstrip(os.sep)
+    return base + os.sep, base + chr(ord(os.sep) + 1)
+
+
+def is_under(path: str, dirpath: str) -> bool:
+    lo, hi = subtree_bounds(dirpath)
+    return lo <= path < hi
+
+
+def sql_text(s: str) -> bytes:
+    """
+    `s` for an SQLite TEXT parameter, bound as CAST(? AS TEXT). File names
+    that are not valid UTF-8 reach Python with lone surrogates
+    (surrogateescape), which sqlite3 refuses to encode; their original bytes
+    are stored instead, and compare and sort like any other path.
+    """
+    return s.encode('utf-8', 'surrogateescape')
+
+
+def text_from_sql(value: bytes) -> str:
+    """Connection.text_factory reading back what sql_text() stored."""
+    return value.decode('utf-8', 'surrogateescape')
+
+
+def select_locations(
+    folders: Iterable[dict],
+    collection_types: Iterable[str] = (),
+    include: Iterable[str] = (),
+    exclude: Iterable[str] = ()
+) -> Tuple[List[Path], List[Path]]:
+    """
+    Split the locations of Jellyfin virtual folders into (watched, skipped).
+    A location is watched when its folder's CollectionType is in
+    `collection_types` (empty = any; folders without a type count as 'mixed'),
+    its path matches one of the `include` globs (empty = any) and none of the
+    `exclude` globs. Globs are matched against the full location path.
+    """
+    types = {t.lower() for t in collection_types}
+    watched, skipped = [], []
+    for folder in folders:
+        ctype = (folder.get('CollectionType') or 'mixed').lower()
+        for loc in folder.get('Locations', []):
+            p = Path(loc)
+            ok = (not types or ctype in types) \
+                and (not include or any(fnmatch(str(p), g) for g in include)) \
+                and not any(fnmatch(str(p), g) for g in exclude)
+            if ok:
+                watched.append(p)
+            else:
+                log.Log(f"Not watching {p} ({folder.get('Name', '?')}, CollectionType={ctype})", pluginid, log.LL_DEBUG)
+                skipped.append(p)
+    return watched, skipped
+
+
+def count_dirs(root: Path) -> int:
+    """Number of directories a recursive inotify watch on `root` would register."""
+    count = 0
+    stack = [str(root)]
+    while stack:
+        d = stack.pop()
+        count += 1
+        try:
+            with os.scandir(d) as it:
+                stack.extend(e.path for e in it if e.is_dir(follow_symlinks=False))
+        except OSError:
+            continue
+    return count
+
+
+class LibraryReconciler:
+    """
+    Periodically calls `fetch()` for the current library roots and diffs the
+    result against the active watches: new roots get `watch(path)`, roots
+    that disappeared get `unwatch(path, handle)`. Existing watches are left
+    untouched. If `fetch()` raises, the current watches are kept.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Iterable[Path]],
+        watch: Callable[[Path], object],
+        unwatch: Callable[[Path, object], None],
+        interval: float = 300.0
+    ):
+        self.fetch = fetch
+        self.watch = watch
+        self.unwatch = unwatch
+        self.interval = interval
+
+        self.active: Dict[Path, object] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def roots(self) -> List[Path]:
+        with self._lock:
+            return sorted(self.active)
+
+    def reconcile(self, roots: Optional[Iterable[Path]] = None) -> tuple[list, list]:
+        """Apply one diff. Returns (added, removed) root lists."""
+        if roots is None:
+            try:
+                roots = self.fetch()
+            except Exception as e:
+                log.Log(f"Could not refresh library roots, keeping current watches: {e}", pluginid, log.LL_WARN)
+                return [], []
+        desired = set(collapse_roots(r for r in roots if os.path.isdir(r)))
+
+        with self._lock:
+            current = set(self.active)
+            removed = sorted(current - desired)
+            added = sorted(desired - current)
+
+            # Remove first, so a root replaced by its parent never delivers twice
+            for path in removed:
+                try:
+                    self.unwatch(path, self.active.pop(path))
+                    log.Log(f"Stopped watching → {path}", pluginid)
+                except Exception as e:
+                    log.Log(f"Could not unwatch {path}: {e}", pluginid, log.LL_ERROR)
+            for path in added:
+                try:
+                    self.active[path] = self.watch(path)
+                    log.Log(f"Watching → {path}", pluginid)
+                except Exception as e:
+                    log.Log(f"Could not watch {path}: {e}", pluginid, log.LL_ERROR)
+
+        return added, removed
+
+    def unwatch_all(self):
+        with self._lock:
+            for path, handle in list(self.active.items()):
+                try:
+                    self.unwatch(path, handle)
+                except Exception as e:
+                    log.Log(f"Could not unwatch {path}: {e}", pluginid, log.LL_ERROR)
+            self.active.clear()
+
+    def start(self):
+        if self._thread and self._thread.is_alive() or not self.interval:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="library-reconciler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.reconcile()
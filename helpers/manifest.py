@@ -0,0 +1,201 @@
+# helpers/manifest.py
+"""
+Processed-file fingerprint manifest.
+Remembers, per video path, the inode/size/mtime it had when process_file last
+finished, plus the digest of the .nfo it produced and the matched TheSportsDB
+event. Files whose fingerprint is unchanged are skipped at intake; moved
+directories are re-keyed with one range update on the path key.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+from . import plexlog as log
+from .libraries import sql_text, subtree_bounds, text_from_sql
+
+pluginid = "MANIFEST"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS files (
+        path          TEXT PRIMARY KEY,
+        inode         INTEGER NOT NULL,
+        size          INTEGER NOT NULL,
+        mtime_ns      INTEGER NOT NULL,
+        nfo_hash      TEXT,
+        event_id      TEXT,
+        show          TEXT,
+        league_id     TEXT,
+        processed_at  REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS files_show ON files (show)",
+    "CREATE INDEX IF NOT EXISTS files_league ON files (league_id)",
+)
+
+# Paths and show names come from file names and are bound through sql_text()
+_IN_TREE = "path >= CAST(? AS TEXT) AND path < CAST(? AS TEXT)"
+
+Fingerprint = Tuple[int, int, int]
+
+
+def fingerprint(path: str, st: Optional[os.stat_result] = None) -> Optional[Fingerprint]:
+    """(inode, size, mtime_ns) of `path`, or None if it cannot be stat'ed."""
+    if st is None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+class FileManifest:
+
+    def __init__(self, path: str):
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.text_factory = text_from_sql
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        for sql in _SCHEMA:
+            self._db.execute(sql)
+        self._db.commit()
+        self._lock = threading.Lock()
+
+        self.checked = 0
+        self.skipped = 0
+
+    # ───────────────────────────────────────────────
+    #   Lookup
+    # ───────────────────────────────────────────────
+
+    def get(self, path: str) -> Optional[dict]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT inode, size, mtime_ns, nfo_hash, event_id, show, league_id FROM files "
+                "WHERE path = CAST(? AS TEXT)", (sql_text(path),)
+            ).fetchone()
+        if not row:
+            return None
+        keys = ('inode', 'size', 'mtime_ns', 'nfo_hash', 'event_id', 'show', 'league_id')
+        return dict(zip(keys, row))
+
+    def same_content(self, old: str, new: str) -> bool:
+        """
+        True if `new` is the file recorded under `old`, just renamed/moved:
+        same inode and size, or (across filesystems) same size and mtime.
+        """
+        entry = self.get(old)
+        fp = fingerprint(new)
+        if entry is None or fp is None:
+            return False
+        inode, size, mtime_ns = fp
+        if size != entry['size']:
+            return False
+        return inode == entry['inode'] or mtime_ns == entry['mtime_ns']
+
+    def is_unchanged(self, path: str) -> bool:
+        """True if `path` was processed before and its fingerprint did not change since."""
+        unchanged = self._unchanged(path)
+        # Intake, backfill and worker threads all check – count under the lock
+        with self._lock:
+            self.checked += 1
+            self.skipped += unchanged
+        return unchanged
+
+    def _unchanged(self, path: str) -> bool:
+        entry = self.get(path)
+        if entry is None:
+            return False
+        if fingerprint(path) != (entry['inode'], entry['size'], entry['mtime_ns']):
+            return False
+        # The generated .nfo must still be there, otherwise the file needs redoing
+        if entry['nfo_hash'] and not os.path.isfile(os.path.splitext(path)[0] + '.nfo'):
+            return False
+        return True
+
+    # ───────────────────────────────────────────────
+    #   Updates
+    # ───────────────────────────────────────────────
+
+    def record(self, path: str, nfo_hash: str = '', event_id: str = '', show: str = '', league_id: str = ''):
+        fp = fingerprint(path)
+        if fp is None:
+            return
+        self._write(
+            f"record {path}",
+            ("INSERT OR REPLACE INTO files "
+             "(path, inode, size, mtime_ns, nfo_hash, event_id, show, league_id, processed_at) "
+             "VALUES (CAST(? AS TEXT), ?, ?, ?, ?, ?, CAST(? AS TEXT), ?, ?)",
+             (sql_text(path), *fp, nfo_hash, event_id, sql_text(show), league_id, time.time()))
+        )
+
+    def rekey(self, old: str, new: str) -> bool:
+        """Move the entry of `old` to `new`, refreshing its fingerprint from `new`."""
+        fp = fingerprint(new)
+        if fp is None:
+            return False
+        return self._write(
+            f"re-key {old} → {new}",
+            ("DELETE FROM files WHERE path = CAST(? AS TEXT)", (sql_text(new),)),
+            ("UPDATE files SET path = CAST(? AS TEXT), inode = ?, size = ?, mtime_ns = ? WHERE path = CAST(? AS TEXT)",
+             (sql_text(new), *fp, sql_text(old)))
+        ) > 0
+
+    def rekey_tree(self, old_dir: str, new_dir: str) -> int:
+        """Re-key every entry below `old_dir` to the same relative path below `new_dir`."""
+        lo, hi = map(sql_text, subtree_bounds(old_dir))
+        new_lo, new_hi = map(sql_text, subtree_bounds(new_dir))
+        # The offset is taken on the stored bytes, which may not be valid UTF-8
+        return self._write(
+            f"re-key {old_dir} → {new_dir}",
+            (f"DELETE FROM files WHERE {_IN_TREE}", (new_lo, new_hi)),
+            ("UPDATE files SET path = CAST(? AS TEXT) || CAST(substr(CAST(path AS BLOB), ?) AS TEXT) "
+             f"WHERE {_IN_TREE}", (new_lo, len(lo) + 1, lo, hi))
+        )
+
+    def invalidate_tree(self, dirpath: str) -> int:
+        return self._delete(_IN_TREE, tuple(map(sql_text, subtree_bounds(dirpath))))
+
+    def invalidate(self, path: str) -> int:
+        return self._delete("path = CAST(? AS TEXT)", (sql_text(path),))
+
+    def invalidate_show(self, show: str) -> int:
+        """Forget every file of a show, with or without the ' (season)' suffix process_file appends."""
+        return self._delete("show = CAST(? AS TEXT) OR show LIKE CAST(? AS TEXT) ESCAPE '\\'",
+                            (sql_text(show), sql_text(_like_escape(show) + ' (%')))
+
+    def invalidate_league(self, league_id: str) -> int:
+        return self._delete("league_id = ?", (str(league_id),))
+
+    def _delete(self, where: str, params: tuple) -> int:
+        count = self._write("invalidate entries", (f"DELETE FROM files WHERE {where}", params))
+        if count:
+            log.Log(f"Invalidated {count} manifest entr{'y' if count == 1 else 'ies'}", pluginid)
+        return count
+
+    def _write(self, what: str, *statements: Tuple[str, tuple]) -> int:
+        """Run `statements` in one transaction; rowcount of the last one, 0 if it was rolled back."""
+        with self._lock:
+            try:
+                for sql, params in statements:
+                    cur = self._db.execute(sql, params)
+                self._db.commit()
+            except Exception as e:
+                # An open transaction would be committed by the next write, half done
+                if self._db.in_transaction:
+                    self._db.rollback()
+                log.Log(f"Could not {what} in the manifest: {e}", pluginid, log.LL_ERROR)
+                return 0
+        return cur.rowcount
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def _like_escape(s: str) -> str:
+    return s.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
@@ -5,9 +5,18 @@ Handles dated events, round/week-based naming, session detection (practice/quali
 """
 
 import re
+import sys
+import threading
 import unicodedata
-from typing import Dict, Any, Optional
-
+import zlib
+from array import array
+from itertools import count
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Any, Iterable, List, Optional
+
+from . import netstrip
 from . import plexlog as log
 
 pluginid = "NAME PARSER"
@@ -101,89 +110,370 @@ session_types: Dict[str, str] = {
 }
 
 # ───────────────────────────────────────────────
-#   Main parsing functions
+#   Compiled patterns + prefilter dispatch
 # ───────────────────────────────────────────────
+#
+# Every pattern is compiled once here. Before a family's full patterns run,
+# a cheap check rules it out when the name lacks something every match of
+# that family must contain, so skipping a family never changes the result
+# and families are still tried in the original order.
+
+_FLAGS = re.IGNORECASE
+
+# Episode families: short key patterns (same flags) that every match contains as a substring
+_episode_keys: Dict[str, list] = {
+    'dated':        [r'[0-9]{4}[^0-9a-zA-Z]+[0-9]{2}[^0-9a-zA-Z]+[0-9]{2}[^0-9a-zA-Z]'],
+    'single_event': [r'[ ][0-9]{2,4}[ ]+(PS)?[ ]?[wekround]+[ ]?[0-9]+[ ]'],
+    'match':        [r' @ | vs | at ', r'[ ][0-9]{2,4}[ ]+(PS)?[ ]?[wekround]+[ ]?[0-9]+[ ]'],
+    'pack_event':   [r'^[0-9]*[ ]', r'[ ][0-9]{4}[ ]+(PS)?[ ]?[wekround]*[ ]*[0-9]+[ ]'],
+    'episodic':     [r'[ ][0-9]{4}[ ]+s[0-9]+[ ]*e[0-9]'],
+}
 
-def get_episode(cleanname: str) -> Dict[str, Any]:
+# Session families: at least one of these must occur in the case-folded event string
+_session_keywords: Dict[str, tuple] = {
+    'match_split': ('half', 'period', 'quarter', 'inning', 'set'),
+    'match_full':  ('game', 'match'),
+    'match_extra': ('ot', 'o t', 'rt', 'r t', 'et', 'e t', 'at', 'a t'),
+    'event_quali': ('q',),
+    'event_pract': ('practice', 'fp'),
+    'event_shtot': ('top', 'heat'),
+    'event_race':  ('race', 'stage', 'day', 'finals', 'sprint'),
+}
+
+# IGNORECASE also equates these with ASCII letters; fold them before lower()
+_FOLD = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'})
+
+
+def _fold(s: str) -> str:
+    """Lower-cased `s` with the IGNORECASE look-alikes mapped to ASCII; indexes stay aligned."""
+    return s.lower() if s.isascii() else s.translate(_FOLD).lower()
+
+
+_episode_families = [
+    (re_type, [re.compile(rx, _FLAGS) for rx in regex_list],
+     [re.compile(k, _FLAGS).search for k in _episode_keys.get(re_type, [])])
+    for re_type, regex_list in episode_regexes.items()
+]
+_session_families = [
+    (re_type, [re.compile(rx, _FLAGS) for rx in regex_list], _session_keywords.get(re_type, ()))
+    for re_type, regex_list in session_regexes.items()
+]
+
+
+def _match_episode(s: str, grammar: Optional['_Grammar'] = None):
+    """(re_type, match) of the first episode pattern matching `s`, or (None, None)."""
+    for re_type, patterns, keys in (grammar or _grammar).episode_families:
+        if not all(key(s) for key in keys):
+            continue
+        for rx in patterns:
+            match = rx.search(s)
+            if match:
+                return re_type, match
+    return None, None
+
+
+def _match_session(s: str):
+    """(re_type, match) of the first session pattern matching `s`, or (None, None)."""
+    folded = _fold(s)
+    for re_type, patterns, keywords in _session_families:
+        if keywords and not any(k in folded for k in keywords):
+            continue
+        for rx in patterns:
+            match = rx.search(s)
+            if match:
+                return re_type, match
+    return None, None
+
+
+def _match_session_any(s: str, grammar: Optional['_Grammar'] = None):
+    """_match_session, then the session families added by grammar packs (tried only when no built-in matches)."""
+    re_type, match = _match_session(s)
+    if match:
+        return re_type, match
+    folded = None
+    for re_type, patterns, keywords in (grammar or _grammar).session_families:
+        if keywords:
+            folded = _fold(s) if folded is None else folded
+            if not any(k in folded for k in keywords):
+                continue
+        for rx in patterns:
+            match = rx.search(s)
+            if match:
+                return re_type, match
+    return None, None
+
+
+# ───────────────────────────────────────────────
+#   Grammar – the dispatch tables, built-in plus grammar packs
+# ───────────────────────────────────────────────
+#
+# Grammar packs (see helpers/grammar.py) add episode and session patterns
+# at runtime. Everything a parse reads is bundled in one _Grammar; a new
+# one is built completely and then installed with a single assignment, and
+# every parse takes the current one once at its start – so a reload never
+# shows a parse a half-built table.
+
+# Named groups the parse functions read; pack patterns may only use these
+EPISODE_GROUPS = frozenset({'show', 'year', 'month', 'day', 'season', 'preseason', 'week', 'event', 'ep'})
+SESSION_GROUPS = frozenset({'ses1nr', 'sestxt', 'sesname', 'ses2nr', 'part', 'ses3nr'})
+
+
+class _Grammar:
+    __slots__ = ('generation', 'episode_families', 'session_families', 'session_types', 'session_episodes', 'pattern_pack', 'packs', 'parsed', 'matched')
+
+    def __init__(self, generation: int, episode_families: list, session_families: list,
+                 types: dict, episodes: dict, pattern_pack: dict, packs: list):
+        self.generation = generation
+        self.episode_families = episode_families
+        self.session_families = session_families
+        self.session_types = types
+        self.session_episodes = episodes
+        self.pattern_pack = pattern_pack    # compiled pattern → pack that added it
+        self.packs = packs
+        # Best-effort counters for the match-rate log – plain increments, no lock
+        self.parsed = {'episode': 0, 'session': 0}
+        self.matched: Dict[str, dict] = {name: {'episode': 0, 'session': 0} for name in packs}
+
+    def count(self, kind: str, match):
+        self.parsed[kind] += 1
+        pack = self.pattern_pack.get(match.re) if match is not None else None
+        if pack:
+            self.matched[pack][kind] += 1
+
+    def stats(self) -> dict:
+        return {
+            'generation': self.generation,
+            'parsed': dict(self.parsed),
+            'packs': {name: dict(n) for name, n in self.matched.items()}
+        }
+
+
+_grammar = _Grammar(0, _episode_families, [], dict(session_types), dict(session_episodes), {}, [])
+# Memo keys carry the generation, so a number is never handed out twice –
+# not even after install_grammar() put an older grammar back
+_generations = count(1)
+
+
+def compile_pack(spec: dict) -> dict:
     """
-    Parse filename into structured episode info.
-    Returns dict with keys like: show, year, season, week, event, episodenr, retype, etc.
+    Compile and validate one grammar pack spec (as read by helpers/grammar.py):
+    {'name', 'episode': [{'family', 'patterns', 'keys', 'examples'}],
+     'session': [{'family', 'patterns', 'keywords', 'type', 'episodenr', 'examples'}]}.
+    Raises ValueError naming the first problem.
+    """
+    name = spec['name']
+    compiled = {'name': name, 'episode': [], 'session': []}
+    for kind, allowed in (('episode', EPISODE_GROUPS), ('session', SESSION_GROUPS)):
+        for fam in spec.get(kind, []):
+            where = f"{name} [{kind}:{fam['family']}]"
+            if not fam.get('patterns'):
+                raise ValueError(f"{where}: no patterns")
+            patterns = []
+            for rx in fam['patterns']:
+                try:
+                    patterns.append(re.compile(rx, _FLAGS))
+                except re.error as e:
+                    raise ValueError(f"{where}: bad pattern {rx!r}: {e}") from None
+                unknown = set(patterns[-1].groupindex) - allowed
+                if unknown:
+                    raise ValueError(f"{where}: unknown group(s) {', '.join(sorted(unknown))} in {rx!r}")
+                if kind == 'episode' and 'event' not in patterns[-1].groupindex:
+                    raise ValueError(f"{where}: pattern {rx!r} has no (?P<event>…) group")
+            for example in fam.get('examples', []):
+                if not any(rx.search(example) for rx in patterns):
+                    raise ValueError(f"{where}: example {example!r} is not matched")
+            entry = dict(fam, patterns=patterns)
+            if kind == 'episode':
+                try:
+                    entry['keys'] = [re.compile(k, _FLAGS).search for k in fam.get('keys', [])]
+                except re.error as e:
+                    raise ValueError(f"{where}: bad key pattern: {e}") from None
+            else:
+                if fam.get('type', 'session') not in ('event', 'session'):
+                    raise ValueError(f"{where}: type {fam['type']!r} is not 'event' or 'session'")
+                entry['keywords'] = tuple(_fold(k) for k in fam.get('keywords', []))
+            compiled[kind].append(entry)
+    return compiled
+
+
+def build_grammar(packs: list) -> _Grammar:
     """
+    Built-in tables plus compiled `packs`, in order. Patterns for a built-in
+    episode family are tried right after that family's own; new families
+    go after all built-in ones. Pack session families are tried when no
+    built-in session matches.
+    """
+    extra: Dict[str, list] = {}
+    new_families = []
+    session_families = []
+    types, episodes = dict(session_types), dict(session_episodes)
+    pattern_pack = {}
+    for pack in packs:
+        for fam in pack['episode']:
+            entry = (fam['family'], fam['patterns'], fam['keys'])
+            if fam['family'] in episode_regexes:
+                extra.setdefault(fam['family'], []).append(entry)
+            else:
+                new_families.append(entry)
+            pattern_pack.update((rx, pack['name']) for rx in fam['patterns'])
+        for fam in pack['session']:
+            session_families.append((fam['family'], fam['patterns'], fam['keywords']))
+            if fam['family'] not in session_regexes:
+                types.setdefault(fam['family'], fam.get('type') or 'session')
+                episodes.setdefault(fam['family'], int(fam.get('episodenr') or 100))
+            pattern_pack.update((rx, pack['name']) for rx in fam['patterns'])
+
+    episode_families = []
+    for family in _episode_families:
+        episode_families.append(family)
+        episode_families.extend(extra.get(family[0], ()))
+    episode_families.extend(new_families)
+    return _Grammar(next(_generations), episode_families, session_families, types, episodes,
+                    pattern_pack, [pack['name'] for pack in packs])
+
+
+def shadowed_examples(grammar: _Grammar, packs: list) -> list:
+    """
+    (pack, kind, family, example, what matched instead) for every example of
+    `packs` that `grammar` gives to a pattern outside its pack – a built-in
+    family (or an earlier pack) claims it first, so the pack's patterns
+    never see names like it.
+    """
+    shadowed = []
+    for pack in packs:
+        for kind, match_any in (('episode', _match_episode), ('session', _match_session_any)):
+            for fam in pack[kind]:
+                for example in fam.get('examples', []):
+                    re_type, match = match_any(example, grammar=grammar)
+                    owner = grammar.pattern_pack.get(match.re) if match is not None else None
+                    if owner != pack['name']:
+                        winner = f"{owner or 'built-in'} {re_type}" if match is not None else 'nothing'
+                        shadowed.append((pack['name'], kind, fam['family'], example, winner))
+    return shadowed
+
+
+def install_grammar(grammar: _Grammar) -> _Grammar:
+    """Make `grammar` the one new parses use; returns the one it replaces."""
+    global _grammar
+    previous, _grammar = _grammar, grammar
+    return previous
+
+
+def grammar_stats() -> dict:
+    """Generation, names parsed and per-pack matches of the installed grammar."""
+    return _grammar.stats()
+
+
+# ───────────────────────────────────────────────
+#   Event slots – the stable 3-digit event part of session episode numbers
+# ───────────────────────────────────────────────
+
+_NON_WORD = re.compile(r'[\W_]+')
+
+# Optional episodes.EpisodeSlots – resolves slot collisions within a season
+_slot_table = None
+
+
+def event_key(eventname: str) -> str:
+    """Event name as fingerprinted: case-folded, punctuation/separators collapsed to single spaces."""
+    return _NON_WORD.sub(' ', _fold(eventname)).strip()
+
+
+def event_fingerprint(eventname: str) -> int:
+    """0–999 from CRC32 of event_key() – the same in every process and on every run."""
+    return zlib.crc32(event_key(eventname).encode('utf-8')) % 1000
+
+
+def _event_slot(episode_info: Dict[str, Any], eventname: str) -> int:
+    preferred = event_fingerprint(eventname)
+    if _slot_table is None:
+        return preferred
+    return _slot_table.allocate(episode_info.get('show', ''), int(episode_info.get('season', 0) or 0),
+                                event_key(eventname), preferred)
+
+
+# ───────────────────────────────────────────────
+#   Main parsing functions
+# ───────────────────────────────────────────────
+
+def _get_episode(cleanname: str) -> Dict[str, Any]:
+    """get_episode without the memo."""
     log.Log(f"Parsing episode from: {cleanname}", pluginid, log.LL_DEBUG)
 
-    for re_type, regex_list in episode_regexes.items():
-        for rx in regex_list:
-            match = re.search(rx, cleanname, re.IGNORECASE)
-            if match:
-                groups = match.groupdict()
-                episode = {
-                    'retype': re_type,
-                    'show': groups.get('show', '').strip(),
-                    'year': groups.get('year', ''),
-                    'season': int(groups.get('season', 0)) if groups.get('season', '').isdigit() else 0,
-                    'week': int(groups.get('week', 0)) if groups.get('week', '').isdigit() else 9999,
-                    'event': groups.get('event', '').strip(),
-                    'preseason': bool(groups.get('preseason')),
-                    'episodenr': int(groups.get('ep', 0)) if groups.get('ep', '').isdigit() else 0,
-                }
-                log.Log(f"Matched pattern '{re_type}': {episode}", pluginid, log.LL_DEBUG)
-                return episode
+    grammar = _grammar
+    re_type, match = _match_episode(cleanname, grammar)
+    grammar.count('episode', match)
+    if match:
+        groups = match.groupdict()
+        episode = {
+            'retype': re_type,
+            'show': groups.get('show', '').strip(),
+            'year': groups.get('year', ''),
+            'season': int(groups.get('season', 0)) if groups.get('season', '').isdigit() else 0,
+            'week': int(groups.get('week', 0)) if groups.get('week', '').isdigit() else 9999,
+            'event': groups.get('event', '').strip(),
+            'preseason': bool(groups.get('preseason')),
+            'episodenr': int(groups.get('ep', 0)) if groups.get('ep', '').isdigit() else 0,
+        }
+        log.Log(f"Matched pattern '{re_type}': {episode}", pluginid, log.LL_DEBUG)
+        return episode
 
     log.Log("No episode pattern matched – returning basic fallback", pluginid, log.LL_WARN)
     return {'retype': None, 'event': cleanname, 'show': '', 'year': '', 'season': 0, 'week': 0}
 
 
-def get_session(episode_info: Dict[str, Any], full_cleanname: str) -> Dict[str, Any]:
-    """
-    Detect session/part (practice, qualy, race, half, etc.) from event string.
-    Returns dict with: sessionname, eventname, episodenr, sessiontype, sessionnr
-    """
+def _session_name(groups: dict) -> tuple:
+    """(session name, session number) from a session match's groups."""
+    name_parts = []
+    sessionnr = 1
+    if groups.get('sesname'):
+        name_parts.append(groups['sesname'].strip().lower())
+    if groups.get('ses2nr'):
+        sessionnr = int(groups['ses2nr'])
+        name_parts.append(groups['ses2nr'])
+    if groups.get('ses3nr'):
+        name_parts.append(groups['ses3nr'])
+    return ' '.join(name_parts).strip(), sessionnr
+
+
+def _get_session(episode_info: Dict[str, Any]) -> Dict[str, Any]:
+    """get_session without the memo – only show, season, event, week and preseason are read."""
     event_str = episode_info.get('event', '')
     if not event_str:
         return {}
 
     log.Log(f"Extracting session from event: {event_str}", pluginid, log.LL_DEBUG)
 
-    for re_type, regex_list in session_regexes.items():
-        for rx in regex_list:
-            match = re.search(rx, event_str, re.IGNORECASE)
-            if match:
-                groups = match.groupdict()
-                session_info = {
-                    'sessiontype': session_types.get(re_type, 'unknown'),
-                    'sessionname': '',
-                    'sessionnr': 1,
-                    'eventname': event_str.replace(match.group(0), '').strip(),
-                    'episodenr': session_episodes.get(re_type, 100)
-                }
-
-                # Build session name
-                name_parts = []
-                if groups.get('sesname'):
-                    name_parts.append(groups['sesname'].strip().lower())
-                if groups.get('ses2nr'):
-                    session_info['sessionnr'] = int(groups['ses2nr'])
-                    name_parts.append(groups['ses2nr'])
-                if groups.get('ses3nr'):
-                    name_parts.append(groups['ses3nr'])
-
-                session_info['sessionname'] = ' '.join(name_parts).strip()
-
-                # Special handling for sprint races (usually before main race)
-                if 'sprint' in session_info['sessionname'].lower():
-                    session_info['episodenr'] -= 5
-
-                # Adjust episode number for non-championship / hash fallback
-                if episode_info.get('week', 0) != 0 and episode_info.get('preseason'):
-                    base = str(episode_info['week'])
-                    hash_part = str(abs(hash(episode_info['event'].replace(match.group(0), '').strip())) % 1000)
-                    session_info['episodenr'] = int(base + hash_part + str(session_info['episodenr']))
-                elif episode_info.get('week', 0) == 0:
-                    hash_part = str(abs(hash(episode_info['event'].replace(match.group(0), '').strip())) % 1000)
-                    session_info['episodenr'] = int(hash_part + str(session_info['episodenr']))
-
-                log.Log(f"Session detected: {session_info}", pluginid, log.LL_DEBUG)
-                return session_info
+    grammar = _grammar
+    re_type, match = _match_session_any(event_str, grammar)
+    grammar.count('session', match)
+    if match:
+        groups = match.groupdict()
+        session_info = {
+            'sessiontype': grammar.session_types.get(re_type, 'unknown'),
+            'sessionname': '',
+            'sessionnr': 1,
+            'eventname': event_str.replace(match.group(0), '').strip(),
+            'episodenr': grammar.session_episodes.get(re_type, 100)
+        }
+
+        session_info['sessionname'], session_info['sessionnr'] = _session_name(groups)
+
+        # Special handling for sprint races (usually before main race)
+        if 'sprint' in session_info['sessionname'].lower():
+            session_info['episodenr'] -= 5
+
+        # Adjust episode number for non-championship / hash fallback
+        if episode_info.get('week', 0) != 0 and episode_info.get('preseason'):
+            base = str(episode_info['week'])
+            hash_part = f"{_event_slot(episode_info, session_info['eventname']):03d}"
+            session_info['episodenr'] = int(base + hash_part + str(session_info['episodenr']))
+        elif episode_info.get('week', 0) == 0:
+            hash_part = f"{_event_slot(episode_info, session_info['eventname']):03d}"
+            session_info['episodenr'] = int(hash_part + str(session_info['episodenr']))
+
+        log.Log(f"Session detected: {session_info}", pluginid, log.LL_DEBUG)
+        return session_info
 
     # Fallback: treat whole string as event name, no session
     return {
@@ -195,52 +485,55 @@ def get_session(episode_info: Dict[str, Any], full_cleanname: str) -> Dict[str,
     }
 
 
-def cleanfilenames(name: str) -> str:
-    """Basic filename sanitizer – remove extra dots/spaces, normalize unicode."""
+_DOTS = re.compile(r'\.+')
+_SPACES = re.compile(r'\s+')
+
+
+def _cleanfilenames(name: str, with_network: bool = False):
+    """cleanfilenames without the memo."""
     # Normalize unicode form
     name = unicodedata.normalize('NFC', name)
 
     # Replace multiple dots/spaces with single
-    name = re.sub(r'\.+', '.', name)
-    name = re.sub(r'\s+', ' ', name)
+    name = _DOTS.sub('.', name)
+    name = _SPACES.sub(' ', name)
 
-    # Trim
-    return name.strip()
+    # Network tags – one pass over the name for all known networks
+    name, network = netstrip.stripper().strip(name, _fold(name))
+
+    # Trim (plus any separator a trailing tag left dangling)
+    name = name.strip(' ._-') if network else name.strip()
+    return (name, network) if with_network else name
 
 
 # ───────────────────────────────────────────────
 #   Utility / helper functions
 # ───────────────────────────────────────────────
 
-def hasSession(instr: str) -> bool:
-    """Quick check if string contains any session pattern."""
-    instr_lower = instr.lower()
-    for rxs in session_regexes.values():
-        for rx in rxs:
-            if re.search(rx, instr_lower, re.IGNORECASE):
-                return True
-    return False
+def _hasSession(instr: str) -> bool:
+    return _match_session_any(instr.lower())[1] is not None
 
 
 def removeSession(instr: str) -> str:
     """Remove detected session part from string."""
     result = instr
-    for rxs in session_regexes.values():
-        for rx in rxs:
-            match = re.search(rx, result, re.IGNORECASE)
-            if match:
-                result = re.sub(rx, '', result, flags=re.IGNORECASE).strip()
+    for _re_type, patterns, _keywords in _session_families + _grammar.session_families:
+        for rx in patterns:
+            if rx.search(result):
+                result = rx.sub('', result).strip()
     return result
 
 
-def strSession(instr: str) -> str:
-    """Extract the matched session substring (first match wins)."""
-    for rxs in session_regexes.values():
-        for rx in rxs:
-            match = re.search(rx, instr, re.IGNORECASE)
-            if match:
-                return match.group(0).strip()
-    return instr
+def _strSession(instr: str) -> str:
+    match = _match_session_any(instr)[1]
+    return match.group(0).strip() if match else instr
+
+
+_main_indicators = [re.compile(rx) for rx in (
+    r'\b(main|feature|grand prix|gp|final|decider)\b',
+    r'\brace\b(?![a-z])',  # race not followed by letter
+    r'\bgrand\s+prix\b'
+)]
 
 
 def isMainEvent(instr: str) -> bool:
@@ -249,16 +542,229 @@ def isMainEvent(instr: str) -> bool:
     (can be expanded with more patterns if needed)
     """
     lower = instr.lower()
-    main_indicators = [
-        r'\b(main|feature|grand prix|gp|final|decider)\b',
-        r'\brace\b(?![a-z])',  # race not followed by letter
-        r'\bgrand\s+prix\b'
-    ]
-    for pattern in main_indicators:
-        if re.search(pattern, lower):
-            return True
-    return False
+    return any(rx.search(lower) for rx in _main_indicators)
+
+
+# ───────────────────────────────────────────────
+#   Memo layer – the same clean names come by again and again (season
+#   packs, backfill, re-matches); parse each one once
+# ───────────────────────────────────────────────
+
+class _Memo:
+    """Bounded, thread-safe LRU of parse results with hit/miss counters."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._cache: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, compute):
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+        value = compute()           # outside the lock – a racing duplicate is harmless
+        if self.maxsize > 0:
+            with self._lock:
+                self._cache[key] = value
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'size': len(self._cache), 'hits': self.hits, 'misses': self.misses}
+
+
+MEMO_SIZE = 4096
+
+_memos = {name: _Memo(MEMO_SIZE) for name in ('cleanfilenames', 'episode', 'session', 'hasSession', 'strSession')}
+
+
+def configure(memo_size: int = MEMO_SIZE, slot_table=None):
+    """
+    Entries kept per memo (0 disables memoization) and the episodes.EpisodeSlots
+    table session episode numbers are allocated from (None: fingerprint only).
+    Drops what is cached.
+    """
+    global _slot_table
+    _slot_table = slot_table
+    for memo in _memos.values():
+        memo.maxsize = max(0, memo_size)
+        memo.clear()
+
+
+def memo_stats() -> Dict[str, dict]:
+    """{memo: {size, hits, misses}} for cleanfilenames, episode, session, hasSession, strSession."""
+    return {name: memo.stats() for name, memo in _memos.items()}
+
+
+def cleanfilenames(name: str, with_network: bool = False):
+    """
+    Basic filename sanitizer – remove extra dots/spaces, normalize unicode,
+    strip broadcaster tags (FoxSports, FS1, Sky F1, …). With `with_network`
+    returns (cleanname, first network tag found or '').
+    """
+    return _memos['cleanfilenames'].get((name, with_network), lambda: _cleanfilenames(name, with_network))
+
+
+def get_episode(cleanname: str) -> Dict[str, Any]:
+    """
+    Parse filename into structured episode info.
+    Returns dict with keys like: show, year, season, week, event, episodenr, retype, etc.
+    """
+    # Callers add keys to the result – hand out copies, keep the memoized dict pristine
+    key = (_grammar.generation, cleanname)
+    return dict(_memos['episode'].get(key, lambda: _get_episode(cleanname)))
+
+
+def get_session(episode_info: Dict[str, Any], full_cleanname: str) -> Dict[str, Any]:
+    """
+    Detect session/part (practice, qualy, race, half, etc.) from event string.
+    Returns dict with: sessionname, eventname, episodenr, sessiontype, sessionnr
+    """
+    key = (_grammar.generation, episode_info.get('show', ''), episode_info.get('season', 0),
+           episode_info.get('event', ''), episode_info.get('week', 0), bool(episode_info.get('preseason')))
+    return dict(_memos['session'].get(key, lambda: _get_session(episode_info)))
+
+
+def hasSession(instr: str) -> bool:
+    """Quick check if string contains any session pattern."""
+    return _memos['hasSession'].get((_grammar.generation, instr), lambda: _hasSession(instr))
+
+
+def strSession(instr: str) -> str:
+    """Extract the matched session substring (first match wins)."""
+    return _memos['strSession'].get((_grammar.generation, instr), lambda: _strSession(instr))
+
+
+# ───────────────────────────────────────────────
+#   Batch parsing – backfills and reports over many names
+# ───────────────────────────────────────────────
+
+class ParsedNames:
+    """
+    Columnar parse results, one entry per input name in input order. String
+    columns are lists (repeated values such as show or session names are
+    interned), number columns are arrays. row(i) gives the get_episode-style
+    fields of one name as a dict.
+    """
+
+    STR_COLUMNS = ('name', 'cleanname', 'network', 'retype', 'show', 'year', 'event', 'session', 'sessiontype')
+    INT_COLUMNS = ('season', 'week', 'episodenr', 'sessionnr', 'preseason')
+
+    __slots__ = STR_COLUMNS + INT_COLUMNS
+
+    def __init__(self):
+        for column in self.STR_COLUMNS:
+            setattr(self, column, [])
+        for column in self.INT_COLUMNS:
+            setattr(self, column, array('l'))
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+    def extend(self, other: 'ParsedNames'):
+        for column in self.__slots__:
+            getattr(self, column).extend(getattr(other, column))
+
+    def row(self, i: int) -> Dict[str, Any]:
+        row = {column: getattr(self, column)[i] for column in self.__slots__}
+        row['preseason'] = bool(row['preseason'])
+        return row
+
+    def __getstate__(self):
+        return {column: getattr(self, column) for column in self.__slots__}
+
+    def __setstate__(self, state):
+        for column, values in state.items():
+            setattr(self, column, values)
+
+
+def _num(groups: dict, key: str, default: int) -> int:
+    value = groups.get(key) or ''
+    return int(value) if value.isdigit() else default
+
+
+def _parse_chunk(names: List[str], clean: bool = True) -> ParsedNames:
+    """
+    Same fields as cleanfilenames → get_episode → get_session (session only
+    for names that matched an episode pattern, as in process.parse_stage),
+    without the memo or per-name logging.
+    """
+    out = ParsedNames()
+    intern = sys.intern
+    grammar = _grammar
+    for name in names:
+        cleanname, network = _cleanfilenames(name, with_network=True) if clean else (name, '')
+        re_type, match = _match_episode(cleanname, grammar=grammar)
+        session = sessiontype = ''
+        sessionnr = 1
+        if match:
+            groups = match.groupdict()
+            show = (groups.get('show') or '').strip()
+            year = groups.get('year') or ''
+            event = (groups.get('event') or '').strip()
+            season, week, episodenr = _num(groups, 'season', 0), _num(groups, 'week', 9999), _num(groups, 'ep', 0)
+            preseason = bool(groups.get('preseason'))
+            if event:
+                s_type, s_match = _match_session_any(event, grammar)
+                if s_match:
+                    session, sessionnr = _session_name(s_match.groupdict())
+                    sessiontype = grammar.session_types.get(s_type, 'unknown')
+                else:
+                    sessiontype = 'event'
+        else:
+            show = year = ''
+            event = cleanname
+            season = week = episodenr = 0
+            preseason = False
+
+        out.name.append(name)
+        out.cleanname.append(cleanname)
+        out.network.append(intern(network))
+        out.retype.append(re_type or '')
+        out.show.append(intern(show))
+        out.year.append(intern(year))
+        out.event.append(event)
+        out.session.append(intern(session))
+        out.sessiontype.append(sessiontype)
+        out.season.append(season)
+        out.week.append(week)
+        out.episodenr.append(episodenr)
+        out.sessionnr.append(sessionnr)
+        out.preseason.append(preseason)
+    return out
+
+
+def parse_many(names: Iterable[str], clean: bool = True, processes: int = 0,
+               chunksize: int = 20000) -> ParsedNames:
+    """
+    Parse many filenames (extension already removed) into one ParsedNames.
+    `clean` runs cleanfilenames first; pass False for names that already
+    are clean. With `processes` > 1 the names are parsed in chunks of
+    `chunksize` across a process pool; results keep input order.
+    """
+    names = names if isinstance(names, list) else list(names)
+    if processes <= 1 or len(names) <= chunksize:
+        return _parse_chunk(names, clean)
+
+    netstrip.warm_cache()
+    result = ParsedNames()
+    chunks = (names[i:i + chunksize] for i in range(0, len(names), chunksize))
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        for part in pool.map(partial(_parse_chunk, clean=clean), chunks):
+            result.extend(part)
+    return result
 
 
 # Legacy / compatibility aliases
-clean_file_name = cleanfilenames
\ No newline at end of file
+clean_file_name = cleanfilenames
@@ -0,0 +1,297 @@
+# helpers/netstrip.py
+"""
+Broadcaster / channel tag detection for release names (FoxSports, FS1,
+Sky F1, …). The distinctive entries of helpers/networks.py are compiled
+into one Aho–Corasick automaton, so a name is scanned once – one step per
+character – instead of one substring test per known network.
+
+Most one-word network names are ordinary words as well (Magic, Versus,
+Premier, ATP, History, …), so a tag is only stripped when it is
+unambiguous – a curated sports broadcaster, a multi-word name or a
+letters-and-digits name – and sits in the trailing tag area of the name.
+
+The table is only loaded when the first name is cleaned. The compiled
+automaton is kept in a versioned cache file (see configure()), so worker
+processes load it instead of compiling it again.
+"""
+
+import marshal
+import os
+import re
+import threading
+import zlib
+from typing import Iterable, List, Optional, Tuple
+
+from . import plexlog as log
+
+pluginid = "NETWORKS"
+
+# Bump when the automaton layout or the matching rules change
+CACHE_VERSION = 2
+
+# Sports broadcasters seen in release names – the only one-word names that
+# are stripped (networks.py's other one-word entries are too often words)
+EXTRA = ('sky f1', 'skyf1', 'sky sports', 'skysports', 'sky sport', 'bt sport', 'tnt sports', 'tntsports', 'dazn',
+         'f1 tv', 'f1tv', 'ziggo sport', 'canal+ sport', 'servus tv', 'stan sport', 'nbcsn', 'espn', 'espn+', 'espn2',
+         'espn 2', 'espnu', 'fs1', 'fs2', 'foxsports', 'eurosport', 'sportsnet', 'sportv', 'bein', 'tsn',
+         'cbs', 'nbc', 'abc', 'tnt', 'bbc', 'itv', 'zdf')
+
+# Release-name tokens that may share the trailing tag area with network tags:
+# resolution, codec, audio, source and release flags ("720p", "h 264", "web dl", …)
+_TECH = re.compile(
+    r'[0-9]{3,4}[pi][0-9]{0,3}|[0-9]{2,3}fps|[2458]k|[0-9]|u?hd|fhd|sd|hdr[0-9]*|[hx]|[hx]?26[45]|hevc|avc|xvid'
+    r'|aac[0-9]*|e?ac3|dd[0-9]*|ddp[0-9]*|dts|atmos|flac|web|webrip|webdl|dl|hdtv|pdtv|bluray|brrip|bdrip'
+    r'|dvdrip|proper|repack|rerip|internal|multi|english|eng|mkv|mp4'
+)
+_TOKEN = re.compile(r'[^\W_]+')
+
+# "fox.sports", "fox_sports" and "fox-sports" all read as "fox sports" – applied
+# to the table when compiling and to each name when scanning (1:1, spans stay aligned)
+_SEPARATORS = str.maketrans('._-', '   ')
+
+
+def fold(name: str) -> str:
+    """Lower-cased `name` with dot/underscore/dash read as a space."""
+    return name.lower().translate(_SEPARATORS)
+
+
+class Automaton:
+    """
+    Aho–Corasick automaton over lower-cased `patterns`. Nodes are dicts of
+    char → next node; `fail` is the longest proper suffix that is also a
+    trie path, and `out` holds the lengths of every pattern ending at a
+    node (its own plus those reached through fail links).
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        goto: List[dict] = [{}]
+        out: List[tuple] = [()]
+        for pattern in patterns:
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                node = nxt
+            if len(pattern) not in out[node]:
+                out[node] += (len(pattern),)
+
+        # Breadth-first: a node's fail target is always shallower, so already done
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for node in queue:
+            for ch, nxt in goto[node].items():
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] += out[fail[nxt]]
+                queue.append(nxt)
+
+        self.goto = goto
+        self.fail = fail
+        self.out = out
+
+    def __len__(self) -> int:
+        return len(self.goto)
+
+    def dumps(self) -> bytes:
+        return marshal.dumps((self.goto, self.fail, self.out))
+
+    @classmethod
+    def loads(cls, data: bytes) -> 'Automaton':
+        automaton = cls.__new__(cls)
+        automaton.goto, automaton.fail, automaton.out = marshal.loads(data)
+        return automaton
+
+    def iter_matches(self, text: str):
+        """(start, end) of every pattern occurrence in `text`, by end position."""
+        goto, fail, out = self.goto, self.fail, self.out
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length in out[node]:
+                yield i + 1 - length, i + 1
+
+
+def _boundary(text: str, i: int) -> bool:
+    """True if a token may start/end at `i` – string edge or a non-alphanumeric neighbour."""
+    return i <= 0 or i >= len(text) or not text[i - 1].isalnum() or not text[i].isalnum()
+
+
+def _distinctive(pattern: str) -> bool:
+    """Multi-word or letters-and-digits – not an ordinary word."""
+    return ' ' in pattern or (any(ch.isdigit() for ch in pattern) and any(ch.isalpha() for ch in pattern))
+
+
+def tail_spans(text: str, candidates: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    The `candidates` (tag spans in the folded `text`) that form the trailing
+    tag area: walking back from the end of the name over tags and _TECH
+    tokens, plus a last release-group token right after a _TECH token. The
+    walk stops at the first other word, so a tag inside the event name
+    ("… Speed Week", "… Miami Heat") is never touched.
+    """
+    longest = {}                # end of a tag's last alphanumeric → its longest (start, end)
+    for start, end in candidates:
+        last = end
+        while last > start and not text[last - 1].isalnum():
+            last -= 1
+        best = longest.get(last)
+        if best is None or (start, -end) < (best[0], -best[1]):
+            longest[last] = (start, end)
+    if not longest:
+        return []
+    tokens = [m.span() for m in _TOKEN.finditer(text)]
+
+    def tech(i: int) -> bool:
+        return _TECH.fullmatch(text, *tokens[i]) is not None
+
+    i = len(tokens) - 1
+    if i > 0 and tokens[i][1] not in longest and not tech(i) and tech(i - 1):
+        i -= 1                  # release group ("… h264-EGORTECH")
+    spans = []
+    while i >= 0:
+        span = longest.get(tokens[i][1])
+        if span is not None:
+            spans.append(span)
+            while i >= 0 and tokens[i][0] >= span[0]:
+                i -= 1
+        elif tech(i):
+            i -= 1
+        else:
+            break
+    spans.reverse()
+    return spans
+
+
+class NetworkStripper:
+    """Finds and removes whole-token network tags in a name."""
+
+    def __init__(self, automaton: Automaton):
+        self.automaton = automaton
+
+    @staticmethod
+    def patterns(networks: Iterable[str], extra: Iterable[str] = EXTRA) -> List[str]:
+        """The folded, de-duplicated pattern list the automaton is compiled from."""
+        patterns = {p for p in map(fold, networks) if _distinctive(p)} | {fold(n) for n in extra}
+        return sorted(patterns)
+
+    def find(self, name: str, lowered: Optional[str] = None) -> List[Tuple[int, int]]:
+        """
+        Non-overlapping (start, end) spans of the network tags in the trailing
+        tag area (see tail_spans) that sit on token boundaries. Anything before
+        the first digit is the show name ("Premier League", "ATP", …) and is
+        left alone.
+        """
+        text = (lowered if lowered is not None else name.lower()).translate(_SEPARATORS)
+        if len(text) != len(name):
+            return []           # lower() changed the length, spans would not line up
+        show_end = next((i for i, ch in enumerate(text) if ch.isdigit()), len(text))
+        return tail_spans(text, (
+            (start, end) for start, end in self.automaton.iter_matches(text)
+            if start >= show_end and _boundary(text, start) and _boundary(text, end)
+        ))
+
+    def strip(self, name: str, lowered: Optional[str] = None) -> Tuple[str, str]:
+        """
+        (name without network tags, first tag as written in `name` or '').
+        A separator in front of a removed tag goes with it.
+        """
+        spans = self.find(name, lowered)
+        if not spans:
+            return name, ''
+        parts, pos = [], 0
+        for start, end in spans:
+            cut = start - 1 if start > pos and not name[start - 1].isalnum() else start
+            parts.append(name[pos:cut])
+            pos = end
+        parts.append(name[pos:])
+        first = spans[0]
+        return ''.join(parts), name[first[0]:first[1]]
+
+
+# ───────────────────────────────────────────────
+#   Shared stripper – lazily compiled, cached on disk
+# ───────────────────────────────────────────────
+
+_stripper: Optional[NetworkStripper] = None
+_cache_path: Optional[str] = None
+_lock = threading.Lock()
+
+
+def configure(cache_path):
+    """Where the compiled automaton is cached (None disables the cache file)."""
+    global _cache_path
+    _cache_path = os.fspath(cache_path) if cache_path else None
+
+
+def _digest(patterns: List[str]) -> str:
+    """Identifies the compiled table; a cache file with another digest is stale."""
+    data = '\n'.join(patterns).encode('utf-8')
+    return f"{CACHE_VERSION}:{len(patterns)}:{zlib.crc32(data):08x}"
+
+
+def _load(path: str, digest: str) -> Optional[Automaton]:
+    try:
+        with open(path, 'rb') as f:
+            version, cached_digest, data = marshal.load(f)
+        if version != CACHE_VERSION or cached_digest != digest:
+            return None
+        return Automaton.loads(data)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, EOFError, TypeError) as e:
+        log.Log(f"Ignoring unreadable network cache {path}: {e}", pluginid, log.LL_WARN)
+        return None
+
+
+def _save(path: str, digest: str, automaton: Automaton):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'wb') as f:
+            marshal.dump((CACHE_VERSION, digest, automaton.dumps()), f)
+        os.replace(tmp, path)
+    except OSError as e:
+        log.Log(f"Could not write network cache {path}: {e}", pluginid, log.LL_WARN)
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def _compile() -> NetworkStripper:
+    from .networks import networks
+    patterns = NetworkStripper.patterns(networks)
+    digest = _digest(patterns)
+    path = _cache_path
+    automaton = _load(path, digest) if path else None
+    if automaton is None:
+        automaton = Automaton(patterns)
+        log.Log(f"Compiled {len(patterns)} network names ({len(automaton)} states)", pluginid, log.LL_DEBUG)
+        if path:
+            _save(path, digest, automaton)
+    return NetworkStripper(automaton)
+
+
+def stripper() -> NetworkStripper:
+    """The shared stripper over helpers/networks.py, built (or loaded from the cache) on first use."""
+    global _stripper
+    if _stripper is None:
+        with _lock:
+            if _stripper is None:
+                _stripper = _compile()
+    return _stripper
+
+
+def warm_cache():
+    """Write the cache file now if it is missing or stale, so worker processes only load it."""
+    if _stripper is None and _cache_path:
+        _compile()
@@ -0,0 +1,189 @@
+# helpers/pipeline.py
+"""
+Staged processing pipeline. The stages of process_file (parse → lookup →
+write → push) each get their own threads and a bounded input queue, so the
+TheSportsDB lookup of one file overlaps with the parsing of the next and the
+.nfo write of the previous one, while the Jellyfin push stays serialized.
+Every stage keeps a timing histogram of queue wait and service time.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from . import plexlog as log
+
+pluginid = "PIPELINE"
+
+_STOP = object()
+
+
+class Histogram:
+    """
+    Log-scale latency histogram: bucket i counts samples up to 2**i ms,
+    the last bucket everything above. Percentiles are bucket upper bounds.
+    """
+
+    BUCKETS = 18        # 1 ms … ~131 s
+
+    def __init__(self):
+        self.counts = [0] * (self.BUCKETS + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float):
+        ms = seconds * 1000.0
+        i = 0
+        while i < self.BUCKETS and ms > (1 << i):
+            i += 1
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    def percentile(self, p: float) -> float:
+        """Upper bound (seconds) of the bucket holding the p-th percentile."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = p / 100.0 * self.count
+            seen = 0
+            for i, n in enumerate(self.counts):
+                seen += n
+                if seen >= rank and n:
+                    return self.max if i == self.BUCKETS else min((1 << i) / 1000.0, self.max)
+            return self.max
+
+    def as_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'max': self.max
+        }
+
+
+class Stage:
+    """One step of the pipeline: `fn(job)` run by `workers` threads."""
+
+    def __init__(self, name: str, fn: Callable[[dict], None], workers: int = 1, queue_size: int = 64):
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, workers)
+        self.queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self.wait = Histogram()
+        self.service = Histogram()
+        self.busy = 0
+        self.failed = 0
+
+
+class Pipeline:
+    """
+    Jobs are dicts (see process.new_job). A stage finishes a job early by
+    setting job['result']; otherwise the job moves on to the next stage and
+    the last stage must set it. submit() returns a Future resolved with
+    job['result'], or with the exception a stage raised. Putting a job on a
+    full stage queue blocks, so a slow stage throttles the ones before it.
+    """
+
+    def __init__(self, stages: Iterable[Tuple[str, Callable[[dict], None]]],
+                 workers: Optional[Dict[str, int]] = None, queue_size: int = 64):
+        workers = workers or {}
+        self.stages: List[Stage] = [
+            Stage(name, fn, workers.get(name, 1), queue_size) for name, fn in stages
+        ]
+        if not self.stages:
+            raise ValueError("Pipeline needs at least one stage")
+        self._threads: List[List[threading.Thread]] = []
+        self._lock = threading.Lock()
+
+    # ───────────────────────────────────────────────
+    #   Lifecycle
+    # ───────────────────────────────────────────────
+
+    def start(self):
+        if self._threads:
+            return
+        for idx, stage in enumerate(self.stages):
+            threads = []
+            for i in range(stage.workers):
+                t = threading.Thread(target=self._run, args=(idx,), name=f"stage-{stage.name}-{i}", daemon=True)
+                t.start()
+                threads.append(t)
+            self._threads.append(threads)
+        log.Log("Pipeline started: " + " → ".join(f"{s.name}×{s.workers}" for s in self.stages), pluginid)
+
+    def stop(self):
+        """Drain the stages front to back: jobs already submitted are finished."""
+        for stage, threads in zip(self.stages, self._threads):
+            for _ in threads:
+                stage.queue.put(_STOP)
+            for t in threads:
+                t.join()
+        self._threads = []
+
+    # ───────────────────────────────────────────────
+    #   Jobs
+    # ───────────────────────────────────────────────
+
+    def submit(self, job: dict) -> Future:
+        future: Future = Future()
+        self.stages[0].queue.put((job, future, time.monotonic()))
+        return future
+
+    def run(self, job: dict):
+        """Submit and wait for the result; raises what the failing stage raised."""
+        return self.submit(job).result()
+
+    def _run(self, idx: int):
+        stage = self.stages[idx]
+        last = idx == len(self.stages) - 1
+        while True:
+            item = stage.queue.get()
+            if item is _STOP:
+                return
+            job, future, queued_at = item
+            started = time.monotonic()
+            stage.wait.add(started - queued_at)
+            with self._lock:
+                stage.busy += 1
+            try:
+                stage.fn(job)
+            except Exception as e:
+                with self._lock:
+                    stage.failed += 1
+                future.set_exception(e)
+                continue
+            finally:
+                stage.service.add(time.monotonic() - started)
+                with self._lock:
+                    stage.busy -= 1
+
+            if 'result' in job or last:
+                future.set_result(job.get('result'))
+            else:
+                self.stages[idx + 1].queue.put((job, future, time.monotonic()))
+
+    # ───────────────────────────────────────────────
+    #   Metrics
+    # ───────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                s.name: {
+                    'workers': s.workers,
+                    'busy': s.busy,
+                    'queued': s.queue.qsize(),
+                    'failed': s.failed,
+                    'wait': s.wait.as_dict(),
+                    'service': s.service.as_dict()
+                }
+                for s in self.stages
+            }
@@ -0,0 +1,235 @@
+# helpers/poller.py
+"""
+Polling watch backend for library roots where inotify cannot be used:
+network shares (changes made on the NFS/SMB server never raise inotify
+events) and trees too large for fs.inotify.max_user_watches.
+
+Each poll stats every known directory once and only lists the directories
+whose mtime changed. Differences are dispatched as regular watchdog events,
+so the same SportsVideoHandler serves both backends.
+"""
+
+import os
+import threading
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from watchdog.events import (
+    DirCreatedEvent,
+    DirDeletedEvent,
+    DirMovedEvent,
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileSystemEventHandler,
+)
+
+from . import plexlog as log
+
+pluginid = "POLLER"
+
+NETWORK_FSTYPES = {
+    'nfs', 'nfs4', 'cifs', 'smb', 'smb3', 'smbfs', 'afs', 'ncpfs', '9p',
+    'fuse.sshfs', 'fuse.rclone', 'fuse.gvfsd-fuse', 'glusterfs', 'ceph', 'davfs'
+}
+
+
+def filesystem_type(path: str) -> str:
+    """Filesystem type of the mount holding `path` (Linux /proc/mounts), '' if unknown."""
+    path = os.path.realpath(path)
+    best, fstype = '', ''
+    try:
+        with open('/proc/mounts', 'r', encoding='utf-8') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) < 3:
+                    continue
+                mnt = parts[1].replace('\\040', ' ')
+                if (path == mnt or path.startswith(mnt.rstrip('/') + '/')) and len(mnt) > len(best):
+                    best, fstype = mnt, parts[2]
+    except OSError:
+        return ''
+    return fstype
+
+
+def is_network_path(path: str) -> bool:
+    return filesystem_type(path) in NETWORK_FSTYPES
+
+
+class _DirSnap:
+    __slots__ = ('ino', 'mtime_ns', 'files', 'dirs')
+
+    def __init__(self, ino: int, mtime_ns: int, files: FrozenSet[str], dirs: FrozenSet[str]):
+        self.ino = ino
+        self.mtime_ns = mtime_ns
+        self.files = files
+        self.dirs = dirs
+
+
+class DirectoryPoller:
+    """
+    Polls one library root and dispatches created/deleted events to `handler`.
+    A directory that disappears in one place and reappears with the same inode
+    elsewhere in the same pass is reported as a single DirMovedEvent.
+    The interval adapts between `min_interval` and `max_interval`: it halves
+    after a poll that found changes and grows by half after a quiet one.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        handler: FileSystemEventHandler,
+        min_interval: float = 5.0,
+        max_interval: float = 120.0
+    ):
+        self.root = os.path.abspath(str(root))
+        self.handler = handler
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.interval = min_interval
+
+        self._snap: Dict[str, _DirSnap] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.polls = 0
+        self.dirs_listed = 0
+        self.events = 0
+
+    # ───────────────────────────────────────────────
+    #   Snapshot
+    # ───────────────────────────────────────────────
+
+    def _list(self, dirpath: str) -> Optional[Tuple[int, int, FrozenSet[str], FrozenSet[str]]]:
+        try:
+            st = os.stat(dirpath)
+            files, dirs = [], []
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    try:
+                        (dirs if entry.is_dir(follow_symlinks=False) else files).append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+        self.dirs_listed += 1
+        return st.st_ino, st.st_mtime_ns, frozenset(files), frozenset(dirs)
+
+    def _walk(self, dirpath: str, emit: bool):
+        """Snapshot `dirpath` and everything below it; `emit` reports its content as created."""
+        stack = [dirpath]
+        while stack:
+            d = stack.pop()
+            listing = self._list(d)
+            if listing is None:
+                continue
+            self._snap[d] = _DirSnap(*listing)
+            if emit:
+                for name in listing[2]:
+                    self._dispatch(FileCreatedEvent(os.path.join(d, name)))
+            stack.extend(os.path.join(d, name) for name in listing[3])
+
+    def _subtree(self, dirpath: str) -> list:
+        prefix = dirpath.rstrip(os.sep) + os.sep
+        return [d for d in self._snap if d == dirpath or d.startswith(prefix)]
+
+    def _forget(self, dirpath: str):
+        for d in self._subtree(dirpath):
+            del self._snap[d]
+
+    def _rekey(self, old: str, new: str):
+        for d in self._subtree(old):
+            self._snap[new + d[len(old):]] = self._snap.pop(d)
+
+    def _dispatch(self, event):
+        self.events += 1
+        try:
+            self.handler.dispatch(event)
+        except Exception as e:
+            log.LogExcept(f"Handler failed for {event.src_path}", e, pluginid)
+
+    def prime(self):
+        """Take the initial snapshot without reporting existing files."""
+        self._snap.clear()
+        self._walk(self.root, emit=False)
+        log.Log(f"Polling {self.root}: {len(self._snap)} dir(s) in snapshot", pluginid)
+
+    def poll(self) -> int:
+        """One pass over the tree. Returns the number of events dispatched."""
+        self.polls += 1
+        before = self.events
+        gone: Dict[int, str] = {}
+        added = []
+
+        for d in list(self._snap):
+            snap = self._snap.get(d)
+            if snap is None:
+                continue        # dropped while handling a parent
+            try:
+                mtime_ns = os.stat(d).st_mtime_ns
+            except OSError:
+                continue        # reported as deleted by its parent
+            if mtime_ns == snap.mtime_ns:
+                continue
+
+            listing = self._list(d)
+            if listing is None:
+                continue
+            ino, mtime_ns, files, dirs = listing
+            for name in sorted(files - snap.files):
+                self._dispatch(FileCreatedEvent(os.path.join(d, name)))
+            for name in sorted(snap.files - files):
+                self._dispatch(FileDeletedEvent(os.path.join(d, name)))
+            for name in sorted(snap.dirs - dirs):
+                sub = self._snap.get(os.path.join(d, name))
+                if sub is not None:
+                    gone[sub.ino] = os.path.join(d, name)
+            added.extend(os.path.join(d, name) for name in sorted(dirs - snap.dirs))
+            self._snap[d] = _DirSnap(ino, mtime_ns, files, dirs)
+
+        # Pair removed and new directories by inode → moves instead of delete + create
+        for path in added:
+            try:
+                ino = os.stat(path).st_ino
+            except OSError:
+                continue
+            old = gone.pop(ino, None)
+            if old is not None:
+                self._rekey(old, path)
+                self._dispatch(DirMovedEvent(old, path))
+            else:
+                self._dispatch(DirCreatedEvent(path))
+                self._walk(path, emit=True)
+        for old in gone.values():
+            self._forget(old)
+            self._dispatch(DirDeletedEvent(old))
+
+        changed = self.events - before
+        if changed:
+            self.interval = max(self.min_interval, self.interval / 2)
+        else:
+            self.interval = min(self.max_interval, self.interval * 1.5)
+        return changed
+
+    # ───────────────────────────────────────────────
+    #   Background loop
+    # ───────────────────────────────────────────────
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"poller:{os.path.basename(self.root)}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        self.prime()
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                log.LogExcept(f"Poll failed for {self.root}", e, pluginid)
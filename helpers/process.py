@@ -3,14 +3,21 @@ helpers/process.py
 Object-oriented / client-injected version – 2026 refactor
 '''
 
+import functools
 import os
+import time
 import unicodedata
+from collections import OrderedDict
 from pathlib import Path
 
 from . import nameregex
 from . import kobimeta
+from . import dircache
+from . import grammar
+from . import netstrip
 from . import plexlog as log
 from . import fuzzy
+from .episodes import EpisodeSlots
 from .jellyfin_client import JellyfinClient
 from .sportsdb_client import TheSportsDBClient
 
@@ -28,34 +35,174 @@ def set_clients(jellyfin: JellyfinClient, sportsdb: TheSportsDBClient):
     _sportsdb_client = sportsdb
 
 
-def process_file(file: str, depth: int):
+def init_worker(config_path: str, persist: bool = True):
+    """
+    ProcessPoolExecutor initializer – every worker process builds its own clients.
+    Without `persist` (scan --dry-run) nothing next to config.cfg is written:
+    episode slots are allocated in memory, the network automaton is not cached.
+    """
+    from .config import AppConfig
+    config = AppConfig(config_path)
+    netstrip.configure(config.network_cache if persist else None)
+    slots = EpisodeSlots(str(config.episode_slots_path) if persist else ':memory:')
+    nameregex.configure(config.parse_memo_size, slots)
+    grammar.configure(config.grammar_packs, config.grammar_check_interval)
+    set_clients(
+        JellyfinClient(config.jellyfin_url, config.jellyfin_token),
+        TheSportsDBClient(config.sportsdb_apikey_file)
+    )
+
+
+def run_job(file: str, depth: int, action: str = ''):
+    """Picklable job entry point for process-based workers."""
+    return process_file(file, depth)
+
+
+def process_batch(jobs: list) -> list:
+    """
+    Process files that arrived together in one directory (typically a season
+    pack). League search, season event list and league/event lookups are
+    shared across the batch, so they run once instead of once per file.
+    Returns one result per (file, depth, action) job; failures are returned
+    as the Exception instance instead of being raised.
+    """
+    log.Log(f"Processing batch of {len(jobs)} file(s) in {os.path.dirname(jobs[0][0])}", pluginid)
+    batch = {}
+    results = []
+    with dircache.cache.scope():        # the pack's directory is stat'ed once for the whole batch
+        for file, depth, *_ in jobs:
+            try:
+                results.append(process_file(file, depth, batch=batch))
+            except Exception as e:
+                log.LogExcept(f"Batch member failed: {file}", e, pluginid)
+                results.append(e)
+    return results
+
+
+# Lookup memos of the directories this (worker) process scanned last – a
+# scan walks one directory at a time, so a few are enough
+SCAN_BATCH_DIRS = 8
+_scan_batches: "OrderedDict[str, dict]" = OrderedDict()
+
+
+def _scan_batch(directory: str) -> dict:
+    batch = _scan_batches.pop(directory, None)
+    if batch is None:
+        batch = {}
+    _scan_batches[directory] = batch
+    while len(_scan_batches) > SCAN_BATCH_DIRS:
+        _scan_batches.popitem(last=False)
+    return batch
+
+
+def scan_file(file: str, depth: int, dry_run: bool = True) -> dict:
+    """
+    Headless run for the `scan` CLI: parse, look up and – unless `dry_run` –
+    write the .nfo, but never push to Jellyfin. Returns a JSON-serialisable
+    record with the parse/match outcome and per-stage timings (ms).
+    """
+    job = new_job(file, depth, _scan_batch(os.path.dirname(file)))
+    timings = {}
+    error = ''
+    for name, stage in STAGES[:2] if dry_run else STAGES[:3]:
+        started = time.perf_counter()
+        try:
+            stage(job)
+        except Exception as e:
+            error = f"{name}: {e!r}"
+            break
+        finally:
+            timings[name] = round((time.perf_counter() - started) * 1000.0, 3)
+        if 'result' in job:
+            break
+
+    diskfile = job.get('diskfile', {})
+    tsdb = diskfile.get('tsdb', {})
+    event = tsdb.get('event') or {}
+    return {
+        'file': file,
+        'depth': depth,
+        'cleanname': diskfile.get('entity', {}).get('cleanname', ''),
+        'network': diskfile.get('entity', {}).get('network', ''),
+        'episode': diskfile.get('episode', {}),
+        'session': diskfile.get('episode', {}).get('session', ''),
+        'showname': job.get('showname', ''),
+        'idLeague': job.get('league_id', ''),
+        'idEvent': event.get('idEvent', '') if job.get('tsdb_loaded') else '',
+        'strEvent': event.get('strEvent', '') if job.get('tsdb_loaded') else '',
+        'score': job.get('score', 0.0),
+        'nfo_hash': job.get('written', {}).get('nfo_hash', ''),
+        'timings': timings,
+        'error': error
+    }
+
+
+def new_job(file: str, depth: int, batch: dict = None) -> dict:
+    """Job context handed from stage to stage."""
+    return {'file': file, 'depth': depth, 'batch': batch}
+
+
+def process_file(file: str, depth: int, batch: dict = None):
     """
     Main entry point for processing one sports video file.
-    Called from filesystem watcher.
+    Called from filesystem watcher. `batch` is the shared lookup memo
+    passed in by process_batch(). Runs every stage of STAGES in series;
+    helpers.pipeline runs the same stages concurrently across files.
     """
+    job = new_job(file, depth, batch)
+    with dircache.cache.scope():
+        for _name, stage in STAGES:
+            stage(job)
+            if 'result' in job:
+                break
+    return job['result']
+
+
+def _dir_scoped(stage):
+    """Run `stage` in a dircache scope – the stages also run one by one in helpers.pipeline."""
+    @functools.wraps(stage)
+    def run(job: dict):
+        with dircache.cache.scope():
+            return stage(job)
+    return run
+
+
+# ───────────────────────────────────────────────
+#   Stages – each takes the job context, adds to it and may set
+#   job['result'] to finish the job early
+# ───────────────────────────────────────────────
+
+@_dir_scoped
+def parse_stage(job: dict):
+    """Filename parsing and Kobi/XBMC .nfo reading (CPU + local disk)."""
     if not _jellyfin_client or not _sportsdb_client:
         log.Log("Clients not initialized – cannot process file", pluginid, log.LL_ERROR)
-        return {'message': 'clients not ready'}
+        job['result'] = {'message': 'clients not ready'}
+        return
 
+    file, depth = job['file'], job['depth']
     log.Log(f"Working on file | {file} | (depth={depth})", pluginid)
+    grammar.maybe_reload()
 
     diskfile = {}
     diskfile['entity'] = {}
     diskfile['entity']['path'] = os.path.dirname(file)
     diskfile['entity']['filename'] = os.path.basename(file)
     diskfile['entity']['name'], diskfile['entity']['ext'] = os.path.splitext(diskfile['entity']['filename'])
-    diskfile['entity']['cleanname'] = nameregex.cleanfilenames(
-        unicodedata.normalize('NFC', diskfile['entity']['name'])
+    diskfile['entity']['cleanname'], diskfile['entity']['network'] = nameregex.cleanfilenames(
+        unicodedata.normalize('NFC', diskfile['entity']['name']), with_network=True
     )
 
     # Parse episode info from filename
     diskfile['episode'] = nameregex.get_episode(diskfile['entity']['cleanname'])
 
+    diskfile['episode']['session'] = ''
     if diskfile['episode'].get('retype'):
         session_info = nameregex.get_session(diskfile['episode'], diskfile['entity']['cleanname'])
-        diskfile['episode']['session'] = session_info.get('sessionname', '')
-    else:
-        diskfile['episode']['session'] = ''
+        if session_info.get('sessionname'):
+            # Refines episode name and number below (the slot-checked session episodenr)
+            diskfile['session'] = session_info
+            diskfile['episode']['session'] = session_info['sessionname']
 
     # Kobi/XBMC-style .nfo metadata (preferred if present)
     diskfile['kobimeta'] = kobimeta.get_metadata(file)
@@ -90,9 +237,9 @@ def process_file(file: str, depth: int):
         session_part = diskfile['session']['sessionname']
         episodename = f"{event_part} - {session_part}"
         if diskfile['episode'].get('week', 0):
-            episodename = f"{diskfile['episode']['week']}: {episodenename}"
+            episodename = f"{diskfile['episode']['week']}: {episodename}"
         if diskfile['episode'].get('preseason'):
-            episodename = f"Preseason {episodenename}"
+            episodename = f"Preseason {episodename}"
         diskfile['episode']['event'] = event_part
 
     if 'episodenr' in diskfile.get('session', {}):
@@ -108,54 +255,82 @@ def process_file(file: str, depth: int):
     if 'title' in diskfile['kobimeta']:
         episodename = diskfile['kobimeta']['title']
 
-    # TheSportsDB lookup
     diskfile['tsdb'] = {}
-    tsdb_loaded = False
+    job.update(
+        diskfile=diskfile,
+        showname=showname,
+        episodename=episodename,
+        episodenr=episodenr,
+        season=season,
+        year=year
+    )
 
-    if showname:
-        log.Log(f"Looking up '{showname}' on TheSportsDB", pluginid, log.LL_INFO)
-        league_info, event_info = _sportsdb_client.get_episode(
-            file,
-            _sportsdb_client.search_league(showname),
-            diskfile['episode']
-        )
-        diskfile['tsdb']['league'] = league_info
-        diskfile['tsdb']['event'] = event_info
-
-        if diskfile['tsdb']['event'] and 'strEvent' in diskfile['tsdb']['event']:
-            log.Log("Found TSDB event data", pluginid, log.LL_DEBUG)
-            tsdb_loaded = True
-
-            # Enhance title with round / venue
-            if season == 0:
-                diskfile['tsdb']['event']['strEvent'] = f"Non-Championship : {diskfile['tsdb']['event']['strEvent']}"
-            elif 'strVenue' in diskfile['tsdb']['event'] and diskfile['tsdb']['event']['strVenue'] != 'Unknown':
-                diskfile['tsdb']['event']['strEvent'] = (
-                    f"{str(season).zfill(2)} : {diskfile['tsdb']['event']['strEvent']} @ {diskfile['tsdb']['event']['strVenue']}"
-                )
-            else:
-                diskfile['tsdb']['event']['strEvent'] = (
-                    f"{str(season).zfill(2)} : {diskfile['tsdb']['event']['strEvent']}"
-                )
-
-            seasonname = diskfile['tsdb']['event']['strEvent']
-
-            # Write .nfo
-            kobimeta.makenfo(
-                file,
-                depth,
-                diskfile['tsdb'],
-                diskfile.get('nfo', {}),
-                showname,
-                episodename,
-                episodenr,
-                season
+
+def lookup_stage(job: dict):
+    """TheSportsDB league search and event match (rate-limited API)."""
+    diskfile, showname = job['diskfile'], job['showname']
+    job['tsdb_loaded'] = False
+    if not showname:
+        return
+
+    log.Log(f"Looking up '{showname}' on TheSportsDB", pluginid, log.LL_INFO)
+    job['league_id'] = _sportsdb_client.search_league(showname, job['batch'])
+    league_info, event_info = _sportsdb_client.get_episode(
+        job['file'],
+        job['league_id'],
+        diskfile['episode'],
+        job['batch']
+    )
+    diskfile['tsdb']['league'] = league_info
+    diskfile['tsdb']['event'] = event_info
+
+    job['score'] = diskfile['episode'].pop('match_score', 0.0)
+
+    if diskfile['tsdb']['event'] and 'strEvent' in diskfile['tsdb']['event']:
+        log.Log("Found TSDB event data", pluginid, log.LL_DEBUG)
+        job['tsdb_loaded'] = True
+    else:
+        log.Log("No usable TSDB event found", pluginid, log.LL_DEBUG)
+
+
+@_dir_scoped
+def write_stage(job: dict):
+    """Write the .nfo – from TheSportsDB data, or the parsed filename as fallback (local disk)."""
+    file, depth, diskfile = job['file'], job['depth'], job['diskfile']
+    showname, episodename = job['showname'], job['episodename']
+    episodenr, season = job['episodenr'], job['season']
+    tsdb_loaded = job['tsdb_loaded']
+
+    if tsdb_loaded:
+        # Enhance title with round / venue
+        if season == 0:
+            diskfile['tsdb']['event']['strEvent'] = f"Non-Championship : {diskfile['tsdb']['event']['strEvent']}"
+        elif 'strVenue' in diskfile['tsdb']['event'] and diskfile['tsdb']['event']['strVenue'] != 'Unknown':
+            diskfile['tsdb']['event']['strEvent'] = (
+                f"{str(season).zfill(2)} : {diskfile['tsdb']['event']['strEvent']} @ {diskfile['tsdb']['event']['strVenue']}"
             )
         else:
-            log.Log("No usable TSDB event found", pluginid, log.LL_DEBUG)
+            diskfile['tsdb']['event']['strEvent'] = (
+                f"{str(season).zfill(2)} : {diskfile['tsdb']['event']['strEvent']}"
+            )
+
+        seasonname = diskfile['tsdb']['event']['strEvent']
+
+        # Write .nfo
+        nfo_hash = kobimeta.makenfo(
+            file,
+            depth,
+            diskfile['tsdb'],
+            diskfile.get('nfo', {}),
+            showname,
+            episodename,
+            episodenr,
+            season,
+            studio=diskfile['entity']['network']
+        )
 
     # Fallback: no TSDB data → still create basic .nfo from parsed info
-    if not tsdb_loaded:
+    else:
         log.Log("Using fallback metadata creation (no TSDB)", pluginid, log.LL_INFO)
 
         posterfile   = os.path.join(diskfile['entity']['path'], f"season{season:02d}.jpg")
@@ -167,18 +342,19 @@ def process_file(file: str, depth: int):
         showjpg = os.path.join(dirname, "show.jpg")
 
         # Try to find show poster one level up if in season folder
+        # (existence checks are answered from one cached listing per directory)
         if depth == 2:
             parent_dir = os.path.dirname(dirname)
-            if os.path.exists(os.path.join(parent_dir, "show.jpg")):
+            if dircache.exists(os.path.join(parent_dir, "show.jpg")):
                 showjpg = os.path.join(parent_dir, "show.jpg")
 
         nfo_art = {
             'season': {
-                'thumb': thumbfile if os.path.isfile(thumbfile) else '',
-                'poster': posterfile if os.path.isfile(posterfile) else ''
+                'thumb': thumbfile if dircache.isfile(thumbfile) else '',
+                'poster': posterfile if dircache.isfile(posterfile) else ''
             },
             'sport': {
-                'poster': showjpg if os.path.exists(showjpg) else ''
+                'poster': showjpg if dircache.exists(showjpg) else ''
             }
         }
 
@@ -196,7 +372,7 @@ def process_file(file: str, depth: int):
         seasonname = title
         nfo_event['event']['strEvent'] = title
 
-        kobimeta.makenfo(
+        nfo_hash = kobimeta.makenfo(
             file,
             depth,
             nfo_event,
@@ -204,13 +380,31 @@ def process_file(file: str, depth: int):
             showname,
             episodename,
             episodenr,
-            season
+            season,
+            studio=diskfile['entity']['network']
         )
 
-    # Final validation & Jellyfin push
+    # Identity of what was written – recorded in the fingerprint manifest by the caller,
+    # but only for TheSportsDB matches: a fallback .nfo is redone on the next run
+    job['seasonname'] = seasonname
+    job['written'] = {
+        'nfo_hash': nfo_hash,
+        'tsdb_loaded': tsdb_loaded,
+        'idEvent': (diskfile['tsdb'].get('event') or {}).get('idEvent', '') if tsdb_loaded else '',
+        'idLeague': (diskfile['tsdb'].get('league') or {}).get('idLeague', '') if tsdb_loaded else ''
+    }
+
+    # Final validation – nothing to push without a usable match
     if not showname or not episodename or episodenr == 0:
         log.Log(f"No usable match for {file}", pluginid, log.LL_WARN)
-        return {'message': 'no match'}
+        job['result'] = {'message': 'no match', 'showname': showname, **job['written']}
+
+
+def push_stage(job: dict):
+    """Push the episode to Jellyfin (serialized writer)."""
+    diskfile = job['diskfile']
+    showname, episodename = job['showname'], job['episodename']
+    episodenr, season, year = job['episodenr'], job['season'], job['year']
 
     backup_showname = diskfile['kobimeta'].get('show', '') if 'kobimeta' in diskfile else ''
 
@@ -227,20 +421,30 @@ def process_file(file: str, depth: int):
         episodenr,
         episodename,
         season,
-        seasonname if 'seasonname' in locals() else episodename
+        job.get('seasonname') or episodename
     )
 
     log.Log("Episode added to Jellyfin queue:", pluginid, log.LL_DEBUG)
     log.Log(f"  Series    : {showname}", pluginid, log.LL_DEBUG)
     log.Log(f"  Round/Week: {season}", pluginid, log.LL_DEBUG)
     log.Log(f"  Episode Nr: {episodenr}", pluginid, log.LL_DEBUG)
-    log.Log(f"  Title     : {episodenename}", pluginid, log.LL_DEBUG)
+    log.Log(f"  Title     : {episodename}", pluginid, log.LL_DEBUG)
     log.Log(f"  Year      : {year}", pluginid, log.LL_DEBUG)
 
-    return {
+    job['result'] = {
         'showname': showname,
         'season': season,
         'episode': episodenr,
         'eptitle': episodename,
-        'year': year
-    }
\ No newline at end of file
+        'year': year,
+        **job['written']
+    }
+
+
+# Stage order, as run by process_file() and helpers.pipeline
+STAGES = (
+    ('parse', parse_stage),
+    ('lookup', lookup_stage),
+    ('write', write_stage),
+    ('push', push_stage),
+)
@@ -0,0 +1,97 @@
+# helpers/scan.py
+"""
+Headless batch scan: runs the matcher over a directory tree in a process
+pool and streams one JSON line per video file, without the watcher and
+without touching Jellyfin. Meant for measuring and tuning throughput on a
+large corpus offline.
+"""
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterable, Iterator, Tuple
+
+from . import netstrip
+from . import plexlog as log
+from .process import init_worker, scan_file
+
+pluginid = "SCAN"
+
+
+def iter_videos(root: str, extensions: Iterable[str]) -> Iterator[Tuple[str, int]]:
+    """(path, depth below `root`) of every video file, depth-first, in name order."""
+    exts = {e.lower() for e in extensions}
+    root = os.path.abspath(root)
+    if os.path.isfile(root):
+        if os.path.splitext(root)[1].lower() in exts:
+            yield root, 0
+        return
+    stack = [(root, 0)]
+    while stack:
+        d, depth = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError as e:
+            log.Log(f"Cannot list {d}: {e}", pluginid, log.LL_WARN)
+            continue
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, depth + 1))
+                elif os.path.splitext(entry.name)[1].lower() in exts:
+                    yield entry.path, depth
+            except OSError:
+                continue
+        stack.extend(reversed(subdirs))
+
+
+def run_scan(root: str, extensions: Iterable[str], out=None, jobs: int = 0,
+             dry_run: bool = True, config_path: str = "config.cfg") -> dict:
+    """
+    Scan `root` with `jobs` worker processes (0 = CPU count), writing records
+    to the text stream `out` (default stdout) in completion order. At most
+    4 × jobs files are in flight, so memory stays flat on any corpus size.
+    A `dry_run` writes neither .nfo files nor the episode slot table and
+    network cache next to `config_path`. Returns summary stats.
+    """
+    out = out or sys.stdout
+    jobs = jobs or os.cpu_count() or 1
+    files = iter_videos(root, extensions)
+    stats = {'files': 0, 'matched': 0, 'errors': 0, 'stage_ms': {}}
+    started = time.monotonic()
+
+    def emit(record: dict):
+        out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        stats['files'] += 1
+        stats['matched'] += bool(record['idEvent'])
+        stats['errors'] += bool(record['error'])
+        for stage, ms in record['timings'].items():
+            stats['stage_ms'][stage] = stats['stage_ms'].get(stage, 0.0) + ms
+
+    if not dry_run:
+        netstrip.warm_cache()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker,
+                             initargs=(config_path, not dry_run)) as pool:
+        inflight = set()
+        for path, depth in files:
+            inflight.add(pool.submit(scan_file, path, depth, dry_run))
+            if len(inflight) >= 4 * jobs:
+                finished, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    emit(future.result())
+        for future in wait(inflight).done:
+            emit(future.result())
+
+    elapsed = time.monotonic() - started
+    stats['seconds'] = round(elapsed, 3)
+    stats['files_per_second'] = round(stats['files'] / elapsed, 1) if elapsed else 0.0
+    stats['stage_ms'] = {
+        stage: round(total / stats['files'], 3) for stage, total in stats['stage_ms'].items()
+    } if stats['files'] else {}
+    log.Log(f"Scanned {stats['files']} file(s) in {elapsed:.1f}s ({stats['files_per_second']}/s), "
+            f"{stats['matched']} matched, {stats['errors']} error(s)", pluginid)
+    return stats
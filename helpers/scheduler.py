@@ -0,0 +1,141 @@
+# helpers/scheduler.py
+"""
+Priority-aware job scheduler in front of process_file.
+Three classes – live filesystem events, manual reprocess requests and
+backfill/retry work – share the workers by weight, and a class's share grows
+the longer its oldest job waits, so low-priority work never starves behind a
+steady stream of live arrivals.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+LIVE = 'live'
+MANUAL = 'manual'
+BACKFILL = 'backfill'
+
+CLASSES = (LIVE, MANUAL, BACKFILL)
+DEFAULT_WEIGHTS = {LIVE: 8, MANUAL: 4, BACKFILL: 1}
+
+
+class _Latency:
+    __slots__ = ('count', 'total', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'max': self.max
+        }
+
+
+class PriorityScheduler:
+    """
+    Smooth weighted round-robin over the non-empty classes. Aging: a class
+    whose oldest job has waited `wait` seconds competes with weight
+    `weight * (1 + min(wait / max_wait, max_boost))`, so a starved class gains
+    share gradually without ever taking over the workers completely.
+    """
+
+    def __init__(
+        self,
+        weights: Optional[Dict[str, int]] = None,
+        max_wait: float = 600.0,
+        max_boost: float = 3.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.weights = dict(DEFAULT_WEIGHTS)
+        if weights:
+            self.weights.update(weights)
+        self.max_wait = max_wait
+        self.max_boost = max_boost
+        self.clock = clock
+
+        self._queues: Dict[str, deque] = {c: deque() for c in CLASSES}
+        self._jobs: Dict[str, int] = {c: 0 for c in CLASSES}
+        self._credit: Dict[str, float] = {c: 0.0 for c in CLASSES}
+        self._latency: Dict[str, _Latency] = {c: _Latency() for c in CLASSES}
+        self._cond = threading.Condition()
+        self._closed = False
+        self.aged = 0
+
+    def put(self, item, priority: str = LIVE, size: int = 1):
+        """Queue `item`, which holds `size` jobs (a batch is scheduled as one item)."""
+        if priority not in self._queues:
+            raise ValueError(f"Unknown priority class: {priority}")
+        with self._cond:
+            self._queues[priority].append((self.clock(), item, size))
+            self._jobs[priority] += size
+            self._cond.notify()
+
+    def depth(self, priority: Optional[str] = None) -> int:
+        """Jobs queued in `priority` (or in all classes) – counted by item size, not by item."""
+        with self._cond:
+            if priority:
+                return self._jobs[priority]
+            return sum(self._jobs.values())
+
+    def get(self, timeout: Optional[float] = None):
+        """Next item by priority; None once closed (or on timeout)."""
+        with self._cond:
+            deadline = None if timeout is None else self.clock() + timeout
+            while not self._closed and not any(self._queues.values()):
+                remaining = None if deadline is None else deadline - self.clock()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+            if self._closed:
+                return None
+            cls = self._pick()
+            queued_at, item, size = self._queues[cls].popleft()
+            self._jobs[cls] -= size
+            self._latency[cls].add(self.clock() - queued_at)
+            return item
+
+    def _pick(self) -> str:
+        now = self.clock()
+        ready = [c for c in CLASSES if self._queues[c]]
+
+        # Smooth weighted round-robin (nginx style) with wait-time boosted weights
+        total = 0.0
+        boosted = set()
+        for c in ready:
+            boost = min((now - self._queues[c][0][0]) / self.max_wait, self.max_boost) if self.max_wait else 0.0
+            if boost >= 1.0:
+                boosted.add(c)
+            weight = self.weights[c] * (1.0 + boost)
+            self._credit[c] += weight
+            total += weight
+        best = max(ready, key=lambda c: self._credit[c])
+        self._credit[best] -= total
+        if best in boosted:
+            self.aged += 1
+        # Idle classes must not bank credit for later bursts
+        for c in CLASSES:
+            if not self._queues[c] and c != best:
+                self._credit[c] = 0.0
+        return best
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                c: {'depth': self._jobs[c], **self._latency[c].as_dict()}
+                for c in CLASSES
+            }
@@ -9,7 +9,9 @@ import json
 import re
 import time
 import ssl
+import threading
 import unicodedata
+from concurrent.futures import Future
 from urllib.request import urlopen, Request
 from urllib.error import HTTPError
 
@@ -43,6 +45,7 @@ class TheSportsDBClient:
         # Cache settings (in-memory for simplicity; disk cache can be added later)
         self.cache = {}
         self.cache_time = {}
+        self._memo_lock = threading.Lock()
 
     def _load_apikey(self, path: str) -> str:
         path = os.path.abspath(path)
@@ -85,11 +88,42 @@ class TheSportsDBClient:
     #   Core lookup methods (ported from original)
     # ───────────────────────────────────────────────
 
-    def search_league(self, showname: str) -> str:
+    def _memo(self, batch: dict | None, key: tuple, fetch):
+        """
+        Return the value of `key` in `batch`, computing it with fetch() once per
+        batch (no batch → always fetch). Files of one batch overlap in the
+        pipeline: the first caller fetches, concurrent callers wait for its result.
+        An empty result – nothing found, or the fetch failed (_fetch_json gives
+        {}) – is not remembered, so the next file asks again.
+        """
+        if batch is None:
+            return fetch()
+        with self._memo_lock:
+            future = batch.get(key)
+            owner = future is None
+            if owner:
+                future = batch[key] = Future()
+        if owner:
+            try:
+                value = fetch()
+            except BaseException as e:
+                with self._memo_lock:
+                    batch.pop(key, None)        # not remembered – the next caller tries again
+                future.set_exception(e)
+                raise
+            if not value:
+                with self._memo_lock:
+                    batch.pop(key, None)
+            future.set_result(value)
+        return future.result()
+
+    def search_league(self, showname: str, batch: dict | None = None) -> str:
         """Try to find a league ID from a show/series name."""
         if not showname:
             return ""
+        return self._memo(batch, ('league', showname), lambda: self._search_league(showname))
 
+    def _search_league(self, showname: str) -> str:
         # Basic cleaning
         clean = re.sub(r'\s*\([0-9]{4}\)', '', showname).strip().lower()
 
@@ -105,28 +139,38 @@ class TheSportsDBClient:
         log.Log(f"League match: {league.get('strLeague')} → ID {league.get('idLeague')}", pluginid)
         return league.get('idLeague', '')
 
-    def get_episode(self, filename: str, league_id: str, episode_info: dict) -> tuple[dict, dict]:
+    def get_episode(self, filename: str, league_id: str, episode_info: dict,
+                    batch: dict | None = None) -> tuple[dict, dict]:
         """
         Main high-level method: find league + best matching event.
         Returns (league_dict, event_dict)
+        Files processed as one batch share a `batch` dict, so the season event
+        list and the league/event lookups are fetched only once per batch.
+        The score of the match is left in episode_info['match_score'].
         """
         if not league_id:
             log.Log("No league ID provided → cannot lookup event", pluginid, log.LL_WARN)
             return {}, {}
 
         # Fetch season events (you may want to add caching here)
-        season_events = self._fetch_season_events(league_id, episode_info.get('year', ''))
+        year = episode_info.get('year', '')
+        season_events = self._memo(batch, ('season', league_id, year),
+                                   lambda: self._fetch_season_events(league_id, year))
         if not season_events:
             return {}, {}
 
         # Try to find best event match
-        matched_event = self._find_best_event_match(season_events, episode_info)
+        matched_event, episode_info['match_score'] = self._find_best_event_match(season_events, episode_info)
 
         if matched_event:
-            full_event = self._fetch_json(f"/lookupevent.php?id={matched_event['idEvent']}")
+            event_id = matched_event['idEvent']
+            full_event = self._memo(batch, ('event', event_id),
+                                    lambda: self._fetch_json(f"/lookupevent.php?id={event_id}"))
             event_data = full_event.get('events', [{}])[0] if full_event.get('events') else {}
-            league_data = self._fetch_json(f"/lookupleague.php?id={league_id}").get('leagues', [{}])[0]
-            return league_data, event_data
+            league_data = self._memo(batch, ('lookupleague', league_id),
+                                     lambda: self._fetch_json(f"/lookupleague.php?id={league_id}"))
+            league_data = (league_data.get('leagues') or [{}])[0]
+            return dict(league_data), dict(event_data)
 
         log.Log(f"No matching event found in league {league_id}", pluginid, log.LL_INFO)
         return {}, {}
@@ -139,10 +183,10 @@ class TheSportsDBClient:
         data = self._fetch_json(endpoint)
         return data.get('events', []) or []
 
-    def _find_best_event_match(self, events: list, ep: dict) -> dict | None:
+    def _find_best_event_match(self, events: list, ep: dict) -> tuple[dict | None, float]:
         """
         Core fuzzy matching logic – tries different strategies.
-        Returns best matching event dict or None.
+        Returns (best matching event dict or None, its score).
         """
         candidates = []
 
@@ -158,7 +202,7 @@ class TheSportsDBClient:
             if target_week and target_week == ev_round:
                 if target_session and target_session in ev_name:
                     log.Log(f"Strong match: week {target_week} + '{target_session}' in '{ev_name}'", pluginid)
-                    return event
+                    return event, 1.0
 
             # Fuzzy name + session similarity
             score = fuzzy_compare(target_name, ev_name)
@@ -170,13 +214,13 @@ class TheSportsDBClient:
                 candidates.append((0.90, event))  # high artificial score
 
         if not candidates:
-            return None
+            return None, 0.0
 
         # Sort by descending score
         candidates.sort(key=lambda x: x[0], reverse=True)
         best = candidates[0][1]
         log.Log(f"Best fuzzy match: {best.get('strEvent')} (score ≈ {candidates[0][0]:.3f})", pluginid)
-        return best
+        return best, candidates[0][0]
 
     # ───────────────────────────────────────────────
     #   Optional extra helpers (can be expanded)
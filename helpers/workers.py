@@ -0,0 +1,246 @@
+# helpers/workers.py
+"""
+Bounded worker pool between the filesystem watcher and process_file.
+The watcher thread only ever does a non-blocking put; when the live queue is
+full the job is shed to the backfill class of the scheduler, which is
+drained as workers free up.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from . import plexlog as log
+from .jobqueue import JobStore
+from .scheduler import PriorityScheduler, LIVE, MANUAL, BACKFILL
+
+pluginid = "WORKERS"
+
+Job = Tuple[str, int, str]
+
+
+class WorkerPool:
+    """
+    `mode='thread'` runs `handler(path, depth, action)` directly on the worker
+    threads. `mode='process'` keeps the same threads as dispatchers but runs
+    the handler in a ProcessPoolExecutor (use `initializer` to set up clients
+    inside the child processes). With a `store`, every submitted job is
+    persisted until it finished, and resume() replays what a previous run left.
+    `on_done(path, depth, action, result)` runs on the worker thread after
+    every successful job, in either mode. Batches submitted with
+    submit_batch() go to `batch_handler(jobs)` as a single unit of work; it
+    returns one result per job, with an Exception instance for failed ones.
+    Jobs are scheduled by priority class (live / manual / backfill); see
+    PriorityScheduler for the weighting and aging rules. `queue_size` bounds
+    the jobs – files, not batches – waiting in the live and manual classes;
+    past it new work is shed to backfill (a batch is admitted or shed whole).
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[str, int, str], None],
+        workers: int = 4,
+        queue_size: int = 256,
+        mode: str = 'thread',
+        initializer: Optional[Callable] = None,
+        initargs: tuple = (),
+        store: Optional[JobStore] = None,
+        on_done: Optional[Callable[[str, int, str, object], None]] = None,
+        batch_handler: Optional[Callable[[List[Job]], list]] = None,
+        weights: Optional[Dict[str, int]] = None,
+        max_wait: float = 600.0
+    ):
+        if mode not in ('thread', 'process'):
+            raise ValueError(f"Unknown worker mode: {mode}")
+
+        self.handler = handler
+        self.batch_handler = batch_handler
+        self.workers = max(1, workers)
+        self.mode = mode
+        self.store = store
+        self.on_done = on_done
+
+        self.queue_size = max(1, queue_size)
+        self._sched = PriorityScheduler(weights, max_wait)
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._initializer = initializer
+        self._initargs = initargs
+
+        self._busy = 0
+        self._busy_time = 0.0
+        self._started = 0.0
+        self.processed = 0
+        self.failed = 0
+        self.shed = 0
+        self.vanished = 0
+
+    # ───────────────────────────────────────────────
+    #   Lifecycle
+    # ───────────────────────────────────────────────
+
+    def start(self):
+        if self._threads:
+            return
+        if self.mode == 'process':
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=self._initializer,
+                initargs=self._initargs
+            )
+        self._started = time.monotonic()
+        for i in range(self.workers):
+            t = threading.Thread(target=self._run, name=f"worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        log.Log(f"Started {self.workers} {self.mode} worker(s), queue size {self.queue_size}", pluginid)
+
+    def stop(self):
+        """Finish the job each worker is on and stop. Queued work is left unprocessed."""
+        self._sched.close()
+        for t in self._threads:
+            t.join()
+        self._threads = []
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    # ───────────────────────────────────────────────
+    #   Intake
+    # ───────────────────────────────────────────────
+
+    def submit(self, path: str, depth: int, action: str, priority: str = LIVE) -> bool:
+        """
+        Queue a job without blocking. Returns False when the queue was full
+        and the job went to the backfill class instead.
+        """
+        return self.submit_batch([(path, depth, action)], priority)
+
+    def submit_batch(self, jobs: List[Job], priority: str = LIVE) -> bool:
+        """Queue jobs that should be processed together (e.g. one season pack directory)."""
+        if not jobs:
+            return True
+        batch = tuple(jobs)
+        if self.store is not None:
+            for path, depth, action in batch:
+                self.store.add(path, depth, action)
+        if priority != BACKFILL and self._sched.depth(priority) >= self.queue_size:
+            with self._lock:
+                self.shed += len(batch)
+            log.Log(f"{priority} queue full – shed {len(batch)} job(s) to backfill: {batch[0][0]}",
+                    pluginid, log.LL_DEBUG)
+            self._sched.put(batch, BACKFILL, len(batch))
+            return False
+        self._sched.put(batch, priority, len(batch))
+        return True
+
+    def resume(self, max_attempts: int = 0) -> int:
+        """Re-submit the jobs a previous run left in the store. Returns the count."""
+        if self.store is None:
+            return 0
+        jobs = self.store.pending(max_attempts)
+        by_dir: dict = {}
+        for path, depth, event, attempts, last_error in jobs:
+            if last_error:
+                log.Log(f"Retrying {path} (attempt {attempts + 1}, last error: {last_error})", pluginid, log.LL_DEBUG)
+            by_dir.setdefault(os.path.dirname(path), []).append((path, depth, event))
+        for batch in by_dir.values():
+            self.submit_batch(batch, BACKFILL)
+        if jobs:
+            log.Log(f"Resumed {len(jobs)} unfinished job(s) from {self.store.path}", pluginid)
+        return len(jobs)
+
+    # ───────────────────────────────────────────────
+    #   Workers
+    # ───────────────────────────────────────────────
+
+    def _call(self, fn: Callable, *args):
+        if self._executor:
+            return self._executor.submit(fn, *args).result()
+        return fn(*args)
+
+    def _run(self):
+        while True:
+            batch = self._sched.get()
+            if batch is None:
+                return
+
+            # Files deleted or moved away while queued (directory moves re-submit the new paths)
+            vanished = [job for job in batch if not os.path.exists(job[0])]
+            if vanished:
+                for job in vanished:
+                    log.Log(f"Skipping job, file is gone: {job[0]}", pluginid, log.LL_DEBUG)
+                    if self.store is not None:
+                        self.store.done(job[0])
+                with self._lock:
+                    self.vanished += len(vanished)
+                batch = tuple(job for job in batch if job not in vanished)
+                if not batch:
+                    continue
+
+            with self._lock:
+                self._busy += 1
+            started = time.monotonic()
+            try:
+                if len(batch) > 1 and self.batch_handler:
+                    try:
+                        results = self._call(self.batch_handler, list(batch))
+                    except Exception as e:
+                        results = [e] * len(batch)
+                else:
+                    results = []
+                    for job in batch:
+                        try:
+                            results.append(self._call(self.handler, *job))
+                        except Exception as e:
+                            results.append(e)
+                for job, result in zip(batch, results):
+                    self._complete(job, result)
+            finally:
+                with self._lock:
+                    self._busy -= 1
+                    self._busy_time += time.monotonic() - started
+
+    def _complete(self, job: Job, result):
+        if isinstance(result, Exception):
+            log.Log(f"Job failed for {job[0]}: {result}", pluginid, log.LL_ERROR)
+            if self.store is not None:
+                self.store.failed(job[0], result)
+            with self._lock:
+                self.failed += 1
+            return
+        if self.store is not None:
+            self.store.done(job[0])
+        with self._lock:
+            self.processed += 1
+        if self.on_done:
+            try:
+                self.on_done(*job, result)
+            except Exception as e:
+                log.LogExcept(f"on_done callback failed for {job[0]}", e, pluginid)
+
+    # ───────────────────────────────────────────────
+    #   Metrics
+    # ───────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        classes = self._sched.stats()
+        with self._lock:
+            wall = (time.monotonic() - self._started) if self._started else 0.0
+            return {
+                'queue_depth': classes[LIVE]['depth'] + classes[MANUAL]['depth'],
+                'queue_size': self.queue_size,
+                'backfill': classes[BACKFILL]['depth'],
+                'classes': classes,
+                'aged': self._sched.aged,
+                'workers': self.workers,
+                'busy': self._busy,
+                'utilisation': (self._busy_time / (wall * self.workers)) if wall else 0.0,
+                'processed': self.processed,
+                'failed': self.failed,
+                'shed': self.shed,
+                'vanished': self.vanished
+            }
@@ -0,0 +1,7 @@
+# tests/conftest.py
+"""Makes `helpers` importable when pytest runs from the repository root or from tests/."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
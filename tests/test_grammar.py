@@ -0,0 +1,69 @@
+# tests/test_grammar.py
+"""Grammar packs: a pack is picked up on reload, a broken edit keeps its last good version."""
+
+import os
+
+import pytest
+
+from helpers import nameregex
+from helpers.grammar import GrammarPacks
+
+FIGHT_CARD = """\
+[episode:fight_card]
+patterns = ^(?P<show>ufc|bellator|pfl)[ ]+(?P<season>[0-9]{1,4})[ ]+(?P<event>.*)$
+examples = UFC 300 Main Card
+"""
+# An unbalanced group – the pack no longer compiles
+BROKEN = FIGHT_CARD.replace('(?P<event>.*)$', '(?P<event>.*$')
+
+
+@pytest.fixture
+def packs(tmp_path):
+    builtin = nameregex.install_grammar(nameregex.build_grammar([]))
+    yield GrammarPacks(str(tmp_path / '*.grammar'), check_interval=0)
+    nameregex.install_grammar(builtin)
+
+
+def _write(path, text, mtime):
+    path.write_text(text)
+    os.utime(path, (mtime, mtime))      # a distinct mtime, however coarse the filesystem's clock
+
+
+def test_pack_is_loaded_and_removed(tmp_path, packs):
+    assert nameregex.get_episode('UFC 300 Main Card')['retype'] is None
+    pack = tmp_path / 'fights.grammar'
+    _write(pack, FIGHT_CARD, 1_000_000)
+
+    assert packs.maybe_reload()
+    episode = nameregex.get_episode('UFC 300 Main Card')
+    assert (episode['retype'], episode['show'], episode['season']) == ('fight_card', 'UFC', 300)
+    assert not packs.maybe_reload()         # nothing changed
+
+    pack.unlink()
+    assert packs.maybe_reload()
+    assert nameregex.get_episode('UFC 300 Main Card')['retype'] is None
+
+
+def test_broken_edit_keeps_previous_version(tmp_path, packs):
+    pack = tmp_path / 'fights.grammar'
+    _write(pack, FIGHT_CARD, 1_000_000)
+    packs.load()
+    generation = nameregex.grammar_stats()['generation']
+
+    _write(pack, BROKEN, 1_000_010)
+    assert packs.maybe_reload()
+    assert packs.failures == 1
+    assert nameregex.grammar_stats()['generation'] > generation
+    assert nameregex.get_episode('UFC 300 Main Card')['retype'] == 'fight_card'
+
+    _write(pack, FIGHT_CARD.replace('ufc|', 'ufc|one|'), 1_000_020)
+    assert packs.maybe_reload()
+    assert nameregex.get_episode('ONE 165 Main Card')['retype'] == 'fight_card'
+
+
+def test_broken_new_pack_is_not_installed(tmp_path, packs):
+    _write(tmp_path / 'fights.grammar', BROKEN, 1_000_000)
+    packs.load()
+    assert packs.failures == 1
+    assert nameregex.grammar_stats()['packs'] == {}
+    assert nameregex.get_episode('UFC 300 Main Card')['retype'] is None
@@ -0,0 +1,89 @@
+# tests/test_intake.py
+"""Event coalescing: a file is released once, and only after it stopped changing."""
+
+from helpers.intake import DirectoryBatcher, EventCoalescer
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _coalescer(quiet_period=5.0):
+    clock, released = FakeClock(), []
+    coalescer = EventCoalescer(lambda *job: released.append(job), quiet_period=quiet_period, clock=clock)
+    return coalescer, clock, released
+
+
+def test_released_after_quiet_period(tmp_path):
+    video = tmp_path / 'race.mkv'
+    video.write_bytes(b'x' * 10)
+    path = str(video)
+    coalescer, clock, released = _coalescer()
+    coalescer.push(path, 1, 'created')
+
+    assert coalescer.poll() == []           # first stat only records size and mtime
+    clock.now = 4.9
+    assert coalescer.poll() == []
+    clock.now = 5.1
+    assert coalescer.poll() == [(path, 1, 'created')]
+    assert released == [(path, 1, 'created')]
+    assert coalescer.pending() == 0
+
+
+def test_growing_file_restarts_quiet_period(tmp_path):
+    video = tmp_path / 'race.mkv'
+    video.write_bytes(b'x' * 10)
+    path = str(video)
+    coalescer, clock, released = _coalescer()
+    coalescer.push(path, 1, 'created')
+    coalescer.poll()
+
+    clock.now = 4.0
+    video.write_bytes(b'x' * 20)
+    assert coalescer.poll() == []
+    clock.now = 8.9
+    assert coalescer.poll() == []
+    clock.now = 9.1
+    assert coalescer.poll() == [(path, 1, 'created')]
+
+
+def test_event_burst_collapses_into_one_release(tmp_path):
+    video = tmp_path / 'race.mkv'
+    video.write_bytes(b'x')
+    path = str(video)
+    coalescer, clock, released = _coalescer()
+    for action in ('created', 'modified', 'modified', 'moved'):
+        coalescer.push(path, 1, action)
+    coalescer.poll()
+    clock.now = 6.0
+    coalescer.poll()
+
+    assert released == [(path, 1, 'created')]
+    assert (coalescer.events_received, coalescer.jobs_emitted) == (4, 1)
+
+
+def test_vanished_file_is_dropped(tmp_path):
+    coalescer, clock, released = _coalescer()
+    coalescer.push(str(tmp_path / 'gone.mkv'), 1, 'created')
+    clock.now = 6.0
+    assert coalescer.poll() == []
+    assert coalescer.pending() == 0
+    assert released == []
+
+
+def test_batcher_groups_a_directory_within_its_window():
+    clock, batches = FakeClock(), []
+    batcher = DirectoryBatcher(batches.append, window=2.0, clock=clock)
+    batcher.push('/lib/NFL/Season 2024/a.mkv', 3, 'created')
+    batcher.push('/lib/NFL/Season 2024/b.mkv', 3, 'created')
+    batcher.push('/lib/NBA/Season 2024/c.mkv', 3, 'created')
+    assert batcher.flush() == 0
+
+    clock.now = 2.0
+    assert batcher.flush() == 2
+    assert sorted(len(batch) for batch in batches) == [1, 2]
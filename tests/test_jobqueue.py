@@ -0,0 +1,132 @@
+# tests/test_jobqueue.py
+"""Job queue durability: unfinished jobs survive a crash, any file name can be queued."""
+
+import os
+import time
+
+from helpers.intake import EventCoalescer
+from helpers.jobqueue import JobStore
+from helpers.workers import WorkerPool
+
+# A file name that is not valid UTF-8, as os.listdir() hands it to Python
+LATIN1_NAME = os.fsdecode(b'Ligue 1 2024 Saint-\xc9tienne.mkv')
+
+
+def _jobs(store, max_attempts=0):
+    return [(path, attempts, error) for path, _, _, attempts, error in store.pending(max_attempts)]
+
+
+# ───────────────────────────────────────────────
+#   Crash / resume
+# ───────────────────────────────────────────────
+
+def test_unfinished_jobs_survive_a_crash(tmp_path):
+    db = str(tmp_path / 'jobs.db')
+    store = JobStore(db)
+    for name in ('a.mkv', 'b.mkv', 'c.mkv'):
+        store.add(f'/lib/{name}', 1, 'created')
+    store.done('/lib/b.mkv')
+    store.failed('/lib/c.mkv', 'lookup timed out')
+    store.flush()
+    # No close(): the process dies with the connection still open
+
+    resumed = JobStore(db)
+    assert _jobs(resumed) == [('/lib/a.mkv', 0, None), ('/lib/c.mkv', 1, 'lookup timed out')]
+    assert _jobs(resumed, max_attempts=1) == [('/lib/a.mkv', 0, None)]
+    resumed.close()
+
+
+def test_background_flush_commits_without_close(tmp_path):
+    db = str(tmp_path / 'jobs.db')
+    store = JobStore(db, flush_interval=0.05)
+    store.start()
+    store.add('/lib/a.mkv', 1, 'created')
+
+    reader = JobStore(db)
+    deadline = time.monotonic() + 5
+    while not len(reader) and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert [job[0] for job in reader.pending()] == ['/lib/a.mkv']
+    reader.close()
+    store.close()
+
+
+def test_worker_pool_resumes_and_finishes_left_jobs(tmp_path):
+    db = str(tmp_path / 'jobs.db')
+    kept, gone = tmp_path / 'kept.mkv', tmp_path / 'gone.mkv'
+    kept.write_bytes(b'x')
+    store = JobStore(db)
+    store.add(str(kept), 1, 'created')
+    store.add(str(gone), 1, 'created')
+    store.close()
+
+    handled = []
+    store = JobStore(db)
+    pool = WorkerPool(lambda path, depth, action: handled.append(path), workers=1, store=store)
+    assert pool.resume() == 2
+    pool.start()
+    deadline = time.monotonic() + 5
+    while pool.processed + pool.vanished < 2 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    pool.stop()
+
+    assert handled == [str(kept)]
+    assert pool.vanished == 1
+    assert len(store) == 0
+    store.close()
+
+
+def test_coalescer_persists_files_still_settling(tmp_path):
+    db = str(tmp_path / 'jobs.db')
+    settling, dropped = tmp_path / 'settling.mkv', tmp_path / 'dropped.mkv'
+    settling.write_bytes(b'x')
+    store = JobStore(db)
+    coalescer = EventCoalescer(lambda *job: None, quiet_period=5.0, store=store)
+    coalescer.push(str(settling), 1, 'created')
+    coalescer.push(str(dropped), 1, 'created')
+    coalescer.discard(str(dropped))
+    store.flush()
+
+    resumed = JobStore(db)
+    assert [job[0] for job in resumed.pending()] == [str(settling)]
+    resumed.close()
+    store.close()
+
+
+# ───────────────────────────────────────────────
+#   Path encoding
+# ───────────────────────────────────────────────
+
+def test_path_that_is_not_utf8_round_trips(tmp_path):
+    path = '/lib/Ligue 1/' + LATIN1_NAME
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    store.add(path, 2, 'created')
+    store.failed(path, f'cannot parse {path}')
+    assert _jobs(store) == [(path, 1, f'cannot parse {path}')]
+
+    store.done(path)
+    assert len(store) == 0
+    store.close()
+
+
+def test_subtree_rekey_below_a_directory_that_is_not_utf8(tmp_path):
+    old_dir = '/lib/' + os.fsdecode(b'Saint-\xc9tienne')
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    store.add(old_dir + '/' + LATIN1_NAME, 2, 'created')
+    rekeyed = store.rekey_tree(old_dir, '/lib/Ligue 1')
+    assert rekeyed == [('/lib/Ligue 1/' + LATIN1_NAME, 2, 'created')]
+    store.close()
+
+
+def test_one_bad_change_does_not_cost_the_batch(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    store.add('/lib/a.mkv', 1, 'created')
+    store.add('/lib/b.mkv', 1, None)        # violates NOT NULL
+    store.add('/lib/c.mkv', 1, 'created')
+    store.flush()
+
+    assert not store._db.in_transaction
+    assert [job[0] for job in store.pending()] == ['/lib/a.mkv', '/lib/c.mkv']
+    store.add('/lib/d.mkv', 1, 'created')
+    assert len(store) == 3
+    store.close()
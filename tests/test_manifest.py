@@ -0,0 +1,79 @@
+# tests/test_manifest.py
+"""Fingerprint manifest: unchanged files are skipped, moved files keep their entry."""
+
+import pytest
+
+from helpers.manifest import FileManifest
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    m = FileManifest(str(tmp_path / 'manifest.db'))
+    yield m
+    m.close()
+
+
+def _video(tmp_path, name='NFL 2024-09-08 Chiefs vs Ravens.mkv', nfo=True):
+    video = tmp_path / name
+    video.write_bytes(b'x' * 100)
+    if nfo:
+        video.with_suffix('.nfo').write_text('<episodedetails/>')
+    return video
+
+
+def test_processed_file_is_skipped(tmp_path, manifest):
+    video = _video(tmp_path)
+    assert not manifest.is_unchanged(str(video))
+    manifest.record(str(video), nfo_hash='abc', event_id='42', show='NFL', league_id='4391')
+
+    assert manifest.is_unchanged(str(video))
+    assert (manifest.checked, manifest.skipped) == (2, 1)
+    assert manifest.get(str(video))['event_id'] == '42'
+
+
+def test_modified_file_is_redone(tmp_path, manifest):
+    video = _video(tmp_path)
+    manifest.record(str(video), nfo_hash='abc')
+    video.write_bytes(b'x' * 200)
+    assert not manifest.is_unchanged(str(video))
+
+
+def test_missing_nfo_is_redone(tmp_path, manifest):
+    video = _video(tmp_path)
+    manifest.record(str(video), nfo_hash='abc')
+    video.with_suffix('.nfo').unlink()
+    assert not manifest.is_unchanged(str(video))
+
+
+def test_survives_reopen(tmp_path):
+    video = _video(tmp_path)
+    db = str(tmp_path / 'manifest.db')
+    first = FileManifest(db)
+    first.record(str(video), nfo_hash='abc')
+    first.close()
+
+    second = FileManifest(db)
+    assert second.is_unchanged(str(video))
+    second.close()
+
+
+def test_renamed_file_keeps_its_entry(tmp_path, manifest):
+    video = _video(tmp_path, nfo=False)
+    manifest.record(str(video), event_id='42')
+    moved = video.rename(tmp_path / 'renamed.mkv')
+    other = _video(tmp_path, 'other.mkv', nfo=False)
+    other.write_bytes(b'y' * 50)
+
+    assert manifest.same_content(str(video), str(moved))
+    assert not manifest.same_content(str(video), str(other))
+    assert manifest.rekey(str(video), str(moved))
+    assert manifest.get(str(video)) is None
+    assert manifest.get(str(moved))['event_id'] == '42'
+    assert manifest.is_unchanged(str(moved))
+
+
+def test_invalidate_show_includes_season_suffix(tmp_path, manifest):
+    for name, show in (('a.mkv', 'Formula 1'), ('b.mkv', 'Formula 1 (2024)'), ('c.mkv', 'Formula 10')):
+        manifest.record(str(_video(tmp_path, name, nfo=False)), show=show)
+    assert manifest.invalidate_show('Formula 1') == 2
+    assert manifest.get(str(tmp_path / 'c.mkv')) is not None
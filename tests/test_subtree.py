@@ -0,0 +1,91 @@
+# tests/test_subtree.py
+"""Directory moves and deletes: every store re-keys exactly the moved subtree."""
+
+import os
+
+from helpers.intake import DirectoryBatcher, EventCoalescer
+from helpers.jobqueue import JobStore
+from helpers.manifest import FileManifest
+
+OLD, NEW = '/lib/Show 1', '/lib/Renamed'
+# '/lib/Show 10' sorts right after '/lib/Show 1/' – a plain prefix match would take it along
+INSIDE = (OLD + '/Season 2024/a.mkv', OLD + '/b.mkv')
+OUTSIDE = ('/lib/Show 10/c.mkv', '/lib/Show 1.mkv')
+
+
+def test_jobqueue_rekey_and_evict(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    for path in INSIDE + OUTSIDE:
+        store.add(path, path.count('/'), 'created')
+    store.add(NEW + '/stale.mkv', 2, 'created')
+
+    rekeyed = store.rekey_tree(OLD, NEW)
+    assert sorted(path for path, _, _ in rekeyed) == [NEW + '/Season 2024/a.mkv', NEW + '/b.mkv']
+    assert sorted(job[0] for job in store.pending()) == sorted(
+        [NEW + '/Season 2024/a.mkv', NEW + '/b.mkv', *OUTSIDE])
+
+    assert store.evict_tree(NEW) == 2
+    assert sorted(job[0] for job in store.pending()) == sorted(OUTSIDE)
+    store.close()
+
+
+def test_manifest_rekey_and_invalidate(tmp_path):
+    old, new = tmp_path / 'Show 1', str(tmp_path / 'Renamed')
+    (old / 'Season 2024').mkdir(parents=True)
+    (tmp_path / 'Show 10').mkdir()
+    files = [old / 'Season 2024' / 'a.mkv', old / 'b.mkv', tmp_path / 'Show 10' / 'c.mkv']
+    manifest = FileManifest(str(tmp_path / 'manifest.db'))
+    for f in files:
+        f.write_bytes(b'x')
+        manifest.record(str(f))
+
+    assert manifest.rekey_tree(str(old), new) == 2
+    assert manifest.get(str(files[0])) is None
+    assert manifest.get(os.path.join(new, 'Season 2024', 'a.mkv')) is not None
+    assert manifest.get(str(files[2])) is not None
+
+    assert manifest.invalidate_tree(new) == 2
+    assert manifest.get(os.path.join(new, 'b.mkv')) is None
+    manifest.close()
+
+
+def test_manifest_rekey_below_a_directory_that_is_not_utf8(tmp_path):
+    old = tmp_path / os.fsdecode(b'Saint-\xc9tienne')
+    old.mkdir()
+    video = old / os.fsdecode(b'Ligue 1 \xe9t\xe9.mkv')
+    video.write_bytes(b'x')
+    manifest = FileManifest(str(tmp_path / 'manifest.db'))
+    manifest.record(str(video))
+
+    assert manifest.rekey_tree(str(old), str(tmp_path / 'Ligue 1')) == 1
+    assert manifest.get(str(tmp_path / 'Ligue 1' / video.name)) is not None
+    manifest.close()
+
+
+def test_coalescer_rekey_recomputes_depth(tmp_path):
+    coalescer = EventCoalescer(lambda *job: None)
+    for path in INSIDE + OUTSIDE:
+        coalescer.push(path, 0, 'created')
+
+    assert coalescer.rekey_tree(OLD, NEW, depth_of=lambda p: p.count('/')) == 2
+    assert coalescer.holds(NEW + '/Season 2024/a.mkv')
+    assert coalescer._pending[NEW + '/b.mkv'].depth == 3
+    assert not coalescer.holds(INSIDE[0])
+    assert all(coalescer.holds(p) for p in OUTSIDE)
+
+    assert coalescer.discard_tree(NEW) == 2
+    assert coalescer.pending() == len(OUTSIDE)
+
+
+def test_batcher_rekey_moves_groups_and_depths():
+    batches = []
+    batcher = DirectoryBatcher(batches.append)
+    for path in INSIDE + OUTSIDE:
+        batcher.push(path, 0, 'created')
+
+    assert batcher.rekey_tree(OLD, NEW, depth_of=lambda p: p.count('/')) == 2
+    assert batcher.holds(NEW + '/b.mkv')
+    assert not batcher.holds(INSIDE[1])
+    batcher.flush(force=True)
+    jobs = {path: depth for batch in batches for path, depth, _ in batch}
+    assert jobs == {NEW + '/Season 2024/a.mkv': 4, NEW + '/b.mkv': 3, '/lib/Show 10/c.mkv': 0, '/lib/Show 1.mkv': 0}